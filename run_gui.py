@@ -3,11 +3,14 @@ GUI Launcher for Organelle Analysis Software
 
 USAGE:
     python run_gui.py
+    python run_gui.py --profile    # save cProfile output next to results
+    python run_gui.py --workers 4 --worker-idle-timeout 300
 
 Author: Philipp Kaintoch
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Add src directory to path
@@ -16,4 +19,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.gui.main_window import launch_gui
 
 if __name__ == "__main__":
-    launch_gui()
+    parser = argparse.ArgumentParser(description="Orgaplex-Analyzer GUI")
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="Profile each analysis run and save .pstats and collapsed-stack files"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help="Number of worker processes (default: CPU count - 1)"
+    )
+    parser.add_argument(
+        '--worker-idle-timeout', type=float, default=600.0,
+        help="Seconds before idle worker processes shut down (default: 600)"
+    )
+    args = parser.parse_args()
+
+    launch_gui(profile=args.profile, workers=args.workers,
+               worker_idle_timeout=args.worker_idle_timeout)
@@ -38,6 +38,9 @@ setup(
         "openpyxl>=3.1.0,<4.0.0",
         "matplotlib>=3.8.0",
     ],
+    extras_require={
+        "ims": ["h5py>=3.8.0"],
+    },
     entry_points={
         "console_scripts": [
             "orgaplex-gui=src.gui.main_window:launch_gui",
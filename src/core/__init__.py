@@ -6,19 +6,58 @@ This package contains the core analysis modules:
 - OneWayInteractionAnalyzer: Pairwise organelle distance analysis
 - VolSpherMetricsAnalyzer: Volume and sphericity metrics
 - NWayInteractionAnalyzer: Multi-organelle boolean contact patterns
+
+Submodules import pandas and NumPy, so they are loaded lazily on first
+attribute access (PEP 562). ``import src.core`` itself stays cheap, which
+keeps GUI startup fast.
 """
 
-from .data_loader import DataLoader, DataStructureError
-from .one_way_interaction import OneWayInteractionAnalyzer
-from .vol_spher_metrics import VolSpherMetricsAnalyzer
-from .nway_interaction import NWayInteractionAnalyzer
-from .radial_distribution import RadialDistributionAnalyzer
-
-__all__ = [
-    'DataLoader',
-    'DataStructureError',
-    'OneWayInteractionAnalyzer',
-    'VolSpherMetricsAnalyzer',
-    'NWayInteractionAnalyzer',
-    'RadialDistributionAnalyzer',
-]
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'DataLoader': '.data_loader',
+    'DataStructureError': '.data_loader',
+    'open_dataset': '.data_loader',
+    'CellCatalog': '.catalog',
+    'PackedDatasetLoader': '.dataset_store',
+    'pack_dataset': '.dataset_store',
+    'ImsDatasetLoader': '.ims_loader',
+    'ArchiveDatasetLoader': '.archive_loader',
+    'RunningStats': '.streaming',
+    'QuantileSketch': '.streaming',
+    'FixedBinHistogram': '.streaming',
+    'ContactMatrix': '.contact_matrix',
+    'OneWayInteractionAnalyzer': '.one_way_interaction',
+    'VolSpherMetricsAnalyzer': '.vol_spher_metrics',
+    'NWayInteractionAnalyzer': '.nway_interaction',
+    'RadialDistributionAnalyzer': '.radial_distribution',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+def preload():
+    """
+    Import all analysis submodules (and their pandas/NumPy dependencies).
+
+    Intended to be called from a background thread once the GUI is visible,
+    so the first analysis run does not pay the import cost.
+    """
+    for module_name in sorted(set(_LAZY_EXPORTS.values())):
+        importlib.import_module(module_name, __name__)
@@ -0,0 +1,326 @@
+"""
+Archive Dataset Backend
+
+Reads an Imaris CSV export directly from a zip or tar archive, without
+extracting it to disk. The manifest is built from the archive's member
+list (the central directory for zip files); member CSVs are decompressed
+in memory and parsed exactly like files on disk, so results are identical
+to analyzing the extracted tree.
+
+When the distance files of a (cell, organelle) pair are listed, their
+decompression is started in a thread pool, so members are inflated in
+parallel while the analyzer parses the previous one.
+
+Author: Philipp Kaintoch
+"""
+
+import io
+import os
+import tarfile
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .data_loader import DataLoader, DataStructureError
+from .streaming import DEFAULT_CHUNK_ROWS
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+MAX_PENDING_READS = 64  # decompressed members held ahead of the reader
+
+
+def is_archive(path: Path) -> bool:
+    """True if the path names a supported archive type."""
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+class ArchiveDatasetLoader(DataLoader):
+    """
+    DataLoader backend reading an Imaris export from a zip/tar archive.
+
+    The archive may contain the export folder itself (a single top-level
+    directory) or its contents. File paths handed out by
+    get_distance_files()/get_metric_file() are virtual
+    (archive path / folder / file name).
+
+    Notes:
+    ------
+    - zip members are decompressed in parallel threads (zlib releases the GIL)
+    - Compressed tar archives (.tar.gz etc.) have no random access; every
+      member read rewinds the stream, so zip or plain tar is much faster
+    - Combined single-file statistics exports are not supported in archives
+    """
+
+    def __init__(self, archive_path: str, max_threads: Optional[int] = None):
+        """
+        Parameters:
+        -----------
+        archive_path : str
+            Path to the zip or tar archive
+        max_threads : int, optional
+            Decompression threads (default: CPU count, at most 8)
+        """
+        super().__init__(archive_path)
+        self.max_threads = max_threads or min(8, os.cpu_count() or 1)
+
+        self._members = {}  # archive member name -> ZipInfo/TarInfo
+        self._root = ''  # common top-level directory stripped from member names
+        self._folder_files = {}  # virtual folder path -> {file name: member name}
+
+        # Opened lazily per process (not picklable)
+        self._archive = None
+        self._archive_lock = threading.Lock()
+        self._executor = None
+        self._pending = OrderedDict()  # virtual path -> Future[bytes]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_archive'] = None
+        state['_archive_lock'] = None
+        state['_executor'] = None
+        state['_pending'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._archive_lock = threading.Lock()
+
+    @property
+    def _is_zip(self) -> bool:
+        return self.parent_dir.suffix.lower() == '.zip'
+
+    def _open_archive(self):
+        # Caller must hold self._archive_lock
+        if self._archive is None:
+            if self._is_zip:
+                self._archive = zipfile.ZipFile(self.parent_dir)
+            else:
+                self._archive = tarfile.open(self.parent_dir)
+        return self._archive
+
+    def detect_structure(self) -> bool:
+        if not self.parent_dir.is_file():
+            raise DataStructureError(f"Archive does not exist: {self.parent_dir}")
+
+        try:
+            with self._archive_lock:
+                archive = self._open_archive()
+                if self._is_zip:
+                    infos = [(info.filename, info) for info in archive.infolist() if not info.is_dir()]
+                else:
+                    infos = [(info.name, info) for info in archive.getmembers() if info.isfile()]
+        except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+            raise DataStructureError(f"Cannot read archive {self.parent_dir.name}: {e}")
+
+        # Skip macOS metadata (__MACOSX/, ._*)
+        self._members = {
+            name: info for name, info in infos
+            if not any(part == '__MACOSX' or part.startswith('._') for part in PurePosixPath(name).parts)
+        }
+        if not self._members:
+            raise DataStructureError(f"Archive is empty: {self.parent_dir.name}")
+
+        # Strip a single top-level directory (zipped export folder)
+        top_level = {PurePosixPath(name).parts[0] for name in self._members}
+        self._root = ''
+        if len(top_level) == 1 and all(len(PurePosixPath(n).parts) > 1 for n in self._members):
+            root = top_level.pop()
+            if not root.endswith('_Statistics'):
+                self._root = root
+
+        directories = {self._relative(name).parent for name in self._members}
+        direct = [d for d in directories if len(d.parts) == 1 and d.name.endswith('_Statistics')]
+
+        if direct:
+            self.search_dir = PurePosixPath()
+            self.has_ld = True
+            logger.info("Structure: Direct -> Dataset contains LD")
+        else:
+            logger.info("Structure: Nested -> Searching subdirectories...")
+            search_dirs = sorted({
+                d.parent for d in directories
+                if len(d.parts) == 2 and d.name.endswith('_Statistics')
+            })
+            if not search_dirs:
+                raise DataStructureError(
+                    "No valid Statistics folders found in archive or its subdirectories"
+                )
+            logger.info(f"Found {len(search_dirs)} subdirectories with data")
+            self.search_dir = search_dirs[0]
+            self.has_ld = False
+
+        return True
+
+    def _relative(self, member_name: str) -> PurePosixPath:
+        path = PurePosixPath(member_name)
+        return path.relative_to(self._root) if self._root else path
+
+    def find_cell_folders(self) -> bool:
+        if self.search_dir is None:
+            raise DataStructureError("Must call detect_structure() first")
+
+        folder_files = {}
+        for name in self._members:
+            relative = self._relative(name)
+            if relative.parent.parent == self.search_dir and relative.parent.name.endswith('_Statistics'):
+                folder_files.setdefault(relative.parent, {})[relative.name] = name
+
+        if not folder_files:
+            raise DataStructureError("No folders ending with '_Statistics' found")
+
+        folders = []
+        self._folder_files = {}
+        for relative_folder in sorted(folder_files):
+            parsed = self._parse_folder_name(relative_folder.name)
+            if parsed is None:
+                continue
+            folder = self.parent_dir.joinpath(*relative_folder.parts)
+            self._folder_files[folder] = folder_files[relative_folder]
+            folders.append((*parsed, folder))
+
+        self._index_cell_folders(folders)
+        return True
+
+    def _member_name(self, file_path: Path) -> Optional[str]:
+        return self._folder_files.get(file_path.parent, {}).get(file_path.name)
+
+    def _read_member(self, member_name: str) -> bytes:
+        info = self._members[member_name]
+        if self._is_zip:
+            with self._archive_lock:
+                archive = self._open_archive()
+            # ZipFile serializes raw reads internally; inflating runs in parallel
+            return archive.read(info)
+
+        with self._archive_lock:
+            return self._open_archive().extractfile(info).read()
+
+    def _prefetch(self, file_paths: List[Path]):
+        """Start decompressing members in background threads."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_threads,
+                                                thread_name_prefix='archive-read')
+        for file_path in file_paths:
+            if file_path in self._pending:
+                continue
+            member_name = self._member_name(file_path)
+            if member_name is None:
+                continue
+            self._pending[file_path] = self._executor.submit(self._read_member, member_name)
+            while len(self._pending) > MAX_PENDING_READS:
+                _, stale = self._pending.popitem(last=False)
+                stale.cancel()
+
+    def _member_data(self, file_path: Path) -> bytes:
+        future: Optional[Future] = self._pending.pop(file_path, None)
+        if future is not None and not future.cancelled():
+            return future.result()
+
+        member_name = self._member_name(file_path)
+        if member_name is None:
+            raise FileNotFoundError(f"{file_path.name} is not in {self.parent_dir.name}")
+        return self._read_member(member_name)
+
+    def read_values(self, file_path: Path) -> pd.Series:
+        file_path = Path(file_path)
+        return self._parse_values(io.BytesIO(self._member_data(file_path)), file_path.name)
+
+    def read_object_values(self, file_path: Path) -> pd.Series:
+        file_path = Path(file_path)
+        return self._parse_object_values(io.BytesIO(self._member_data(file_path)), file_path.name)
+
+    def iter_values(self, file_path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[np.ndarray]:
+        # The member is decompressed in memory; parsing is chunked
+        file_path = Path(file_path)
+        yield from self._iter_csv_chunks(io.BytesIO(self._member_data(file_path)), file_path.name, chunk_rows)
+
+    def iter_object_values(self, file_path: Path,
+                           chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]:
+        file_path = Path(file_path)
+        yield from self._iter_csv_object_chunks(
+            io.BytesIO(self._member_data(file_path)), file_path.name, chunk_rows
+        )
+
+    def get_distance_files(self, cell_id: str, source_organelle: str) -> List[Tuple[Path, str]]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        folder = self.catalog.folder_path(cell_id, source_organelle)
+        if folder is None:
+            return []
+
+        result = []
+        for file_name in sorted(self._folder_files.get(folder, {})):
+            if 'Shortest_Distance_to_Surfaces_Surfaces' not in file_name or not file_name.endswith('.csv'):
+                continue
+            target_match = self.target_pattern.search(file_name)
+            if target_match:
+                result.append((folder / file_name, target_match.group(1)))
+            else:
+                logger.warning(f"Could not identify target in {file_name}")
+
+        self._prefetch([file_path for file_path, _ in result])
+        return result
+
+    def distance_bytes(self, cell_id: str, source_organelle: str) -> int:
+        # Uncompressed member sizes from the manifest; nothing is prefetched
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        folder = self.catalog.folder_path(cell_id, source_organelle)
+        n_bytes = 0
+        for file_name, member_name in self._folder_files.get(folder, {}).items():
+            if 'Shortest_Distance_to_Surfaces_Surfaces' in file_name and file_name.endswith('.csv'):
+                info = self._members[member_name]
+                n_bytes += info.file_size if self._is_zip else info.size
+        return n_bytes
+
+    def get_metric_file(self, cell_id: str, organelle: str, metric: str) -> Optional[Path]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        folder = self.catalog.folder_path(cell_id, organelle)
+        if folder is None:
+            return None
+        file_path = folder / f"{cell_id}_{organelle}_{metric}.csv"
+        return file_path if self._member_name(file_path) is not None else None
+
+    def get_dataset_stats(self) -> Dict[str, int]:
+        """Count CSV members and their uncompressed size."""
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        n_files = 0
+        n_bytes = 0
+        for files in self._folder_files.values():
+            for file_name, member_name in files.items():
+                if file_name.endswith('.csv'):
+                    info = self._members[member_name]
+                    n_files += 1
+                    n_bytes += info.file_size if self._is_zip else info.size
+        return {'files': n_files, 'bytes': n_bytes}
+
+    def prefetch_headers(self, n_bytes: int = 4096, stop_event=None) -> int:
+        """Nothing to prefetch: the manifest was read during discovery."""
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return 0
+
+    def close(self):
+        """Close the archive and stop decompression threads."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._archive_lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
@@ -0,0 +1,148 @@
+"""
+Dataset Catalog Module
+
+Indexed, integer-coded view of the (cell, organelle) folders discovered by a
+DataLoader. Cells and organelles are numbered in sorted order; folder
+records live in parallel NumPy arrays, and inverted indexes plus
+precomputed natural-sort ranks make every lookup O(1) and every ordering a
+single O(n log n) sort.
+
+Author: Philipp Kaintoch
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from ..utils.sorting import natural_sort_key, sort_cell_ids
+
+
+class CellCatalog:
+    """
+    Catalog of Statistics folders, keyed by integer cell and organelle codes.
+
+    Usage:
+        catalog = CellCatalog.from_folders([(cell_id, organelle, path), ...])
+        catalog.cells_with('ER')          # cells with ER data, sorted
+        catalog.folder_path('control_1', 'ER')
+        catalog.sort_cells(['control_10', 'control_2'])
+
+    Notes:
+    ------
+    - Codes follow plain sorted order, so cells_with()/organelles_of()
+      return the same order as sorted(set(...)) did before
+    - Natural ranks (control_2 before control_10) are precomputed once
+    - If a (cell, organelle) pair occurs twice, the last folder wins
+      for lookups; all folders are kept as records
+    """
+
+    __slots__ = (
+        'cells', 'organelles', '_cell_codes', '_organelle_codes',
+        'folder_cell', 'folder_organelle', 'folder_paths',
+        '_folder_matrix', '_cells_by_organelle', '_organelles_by_cell',
+        '_natural_rank',
+    )
+
+    def __init__(self, cells: List[str], organelles: List[str],
+                 folder_cell: np.ndarray, folder_organelle: np.ndarray,
+                 folder_paths: List[Path]):
+        """
+        Parameters:
+        -----------
+        cells, organelles : List[str]
+            Sorted unique names; the list index is the code
+        folder_cell, folder_organelle : np.ndarray
+            Cell and organelle code of each folder record
+        folder_paths : List[Path]
+            Path of each folder record
+        """
+        self.cells = cells
+        self.organelles = organelles
+        self._cell_codes = {cell_id: code for code, cell_id in enumerate(cells)}
+        self._organelle_codes = {organelle: code for code, organelle in enumerate(organelles)}
+
+        self.folder_cell = folder_cell
+        self.folder_organelle = folder_organelle
+        self.folder_paths = folder_paths
+
+        # (cell code, organelle code) -> folder record, -1 if missing
+        self._folder_matrix = np.full((len(cells), len(organelles)), -1, dtype=np.int32)
+        self._folder_matrix[folder_cell, folder_organelle] = np.arange(len(folder_paths), dtype=np.int32)
+
+        present = self._folder_matrix >= 0
+        self._cells_by_organelle = [np.flatnonzero(present[:, o]) for o in range(len(organelles))]
+        self._organelles_by_cell = [np.flatnonzero(present[c]) for c in range(len(cells))]
+
+        # cell code -> position in natural sort order
+        self._natural_rank = np.empty(len(cells), dtype=np.int64)
+        self._natural_rank[sorted(range(len(cells)), key=lambda c: natural_sort_key(cells[c]))] = (
+            np.arange(len(cells))
+        )
+
+    @classmethod
+    def from_folders(cls, folders: Iterable[Tuple[str, str, Path]]) -> 'CellCatalog':
+        """
+        Build a catalog from (cell_id, organelle, folder_path) tuples.
+        """
+        folders = list(folders)
+        cells = sorted({cell_id for cell_id, _, _ in folders})
+        organelles = sorted({organelle for _, organelle, _ in folders})
+        cell_codes = {cell_id: code for code, cell_id in enumerate(cells)}
+        organelle_codes = {organelle: code for code, organelle in enumerate(organelles)}
+
+        return cls(
+            cells,
+            organelles,
+            np.array([cell_codes[f[0]] for f in folders], dtype=np.int32),
+            np.array([organelle_codes[f[1]] for f in folders], dtype=np.int32),
+            [Path(f[2]) for f in folders],
+        )
+
+    def __len__(self) -> int:
+        return len(self.folder_paths)
+
+    def folder_path(self, cell_id: str, organelle: str) -> Optional[Path]:
+        """Statistics folder of a (cell, organelle) pair, or None."""
+        cell_code = self._cell_codes.get(cell_id)
+        organelle_code = self._organelle_codes.get(organelle)
+        if cell_code is None or organelle_code is None:
+            return None
+        record = self._folder_matrix[cell_code, organelle_code]
+        return self.folder_paths[record] if record >= 0 else None
+
+    def cells_with(self, organelle: str) -> List[str]:
+        """Cells that have data for an organelle, in sorted order."""
+        organelle_code = self._organelle_codes.get(organelle)
+        if organelle_code is None:
+            return []
+        return [self.cells[c] for c in self._cells_by_organelle[organelle_code]]
+
+    def organelles_of(self, cell_id: str) -> List[str]:
+        """Organelles present for a cell, in sorted order."""
+        cell_code = self._cell_codes.get(cell_id)
+        if cell_code is None:
+            return []
+        return [self.organelles[o] for o in self._organelles_by_cell[cell_code]]
+
+    def natural_rank(self, cell_id: str) -> int:
+        """Position of a cell in natural sort order (KeyError if unknown)."""
+        return int(self._natural_rank[self._cell_codes[cell_id]])
+
+    def natural_ranks(self) -> Dict[str, int]:
+        """Mapping cell_id -> natural sort position, e.g. for Series.map()."""
+        return dict(zip(self.cells, self._natural_rank.tolist()))
+
+    def sort_cells(self, cell_ids: List[str]) -> List[str]:
+        """
+        Sort cell IDs naturally using the precomputed ranks.
+
+        Falls back to sort_cell_ids() if any ID is not in the catalog.
+        """
+        if all(cell_id in self._cell_codes for cell_id in cell_ids):
+            return sorted(cell_ids, key=self.natural_rank)
+        return sort_cell_ids(list(cell_ids))
+
+    def iter_folders(self) -> Iterator[Tuple[str, str, Path]]:
+        """Yield (cell_id, organelle, folder_path) for every folder record."""
+        for cell_code, organelle_code, path in zip(
+                self.folder_cell.tolist(), self.folder_organelle.tolist(), self.folder_paths):
+            yield self.cells[cell_code], self.organelles[organelle_code], path
@@ -0,0 +1,271 @@
+"""
+Packed Contact Matrix Module
+
+Stores the per-surface-point contact state of a bait organelle against
+several targets (optionally at several distance thresholds) as bits,
+8 points per byte (np.packbits). Used by the N-Way analyzer for contact
+pattern counting and exportable for downstream per-surface analyses.
+
+Author: Philipp Kaintoch
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+# Number of set bits for every byte value
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Bytes per column unpacked at once when computing codes (512k points)
+_BLOCK_BYTES = 1 << 16
+
+# A threshold block: one distance for all targets or one per target
+Threshold = Union[float, Mapping[str, float], Sequence[float]]
+
+
+class ContactMatrix:
+    """
+    Bit-packed points x (thresholds x targets) contact flags.
+
+    Column (k, i) holds, for every surface point, whether the distance to
+    targets[i] is <= thresholds[k]. A threshold is either one distance for
+    all targets or a {target: distance} map (e.g., ER contacts at 0.1 and
+    LD contacts at 0.0), so mixed thresholds cost the same as a single one.
+    Each column is packed along the points axis, so column operations
+    (AND/OR/NOT, popcount) work on whole bytes.
+
+    Usage:
+        matrix = ContactMatrix.from_distances({'ER': er, 'LD': ld}, thresholds=(0.0, 0.1))
+        matrix.count('ER')                      # points touching ER at 0.0
+        matrix.count_exact({'ER', 'LD'}, 0.1)   # touching exactly ER and LD at 0.1
+        ContactMatrix.from_distances(distances, thresholds=({'ER': 0.1, 'LD': 0.0},))
+        matrix.code_histogram()                 # counts per contact code
+        matrix.co_contacts()                    # targets x targets co-contact counts
+        matrix.save('cell_ER.npz')
+
+    Notes:
+    ------
+    - Padding bits of the last byte are always zero
+    - Memory is n_points * n_targets * n_thresholds / 8 bytes
+    """
+
+    __slots__ = ('targets', 'n_points', '_threshold_table', '_bits')
+
+    def __init__(self, targets: Sequence[str], thresholds: Sequence[Threshold], n_points: int,
+                 bits: np.ndarray):
+        """
+        Parameters:
+        -----------
+        targets : Sequence[str]
+            Target organelle names (column order)
+        thresholds : Sequence[float or Dict[str, float]]
+            Contact threshold of each column block (one for all targets or
+            one per target)
+        n_points : int
+            Number of surface points
+        bits : np.ndarray
+            uint8 array of shape (len(thresholds) * len(targets), ceil(n_points / 8))
+        """
+        self.targets = list(targets)
+        self.n_points = int(n_points)
+        self._threshold_table = np.array(
+            [self._threshold_row(threshold) for threshold in thresholds], dtype=np.float64
+        ).reshape(len(thresholds), len(self.targets))
+
+        expected = (len(self._threshold_table) * len(self.targets), -(-self.n_points // 8))
+        if bits.shape != expected or bits.dtype != np.uint8:
+            raise ValueError(f"Packed bits must be uint8 with shape {expected}, got {bits.dtype} {bits.shape}")
+        self._bits = bits
+
+    def _threshold_row(self, threshold: Threshold) -> list:
+        """Per-target distances of one threshold block."""
+        if isinstance(threshold, Mapping):
+            missing = [target for target in self.targets if target not in threshold]
+            if missing:
+                raise ValueError(f"No threshold for targets: {missing}")
+            return [float(threshold[target]) for target in self.targets]
+        if np.ndim(threshold) == 1:
+            if len(threshold) != len(self.targets):
+                raise ValueError(f"Expected {len(self.targets)} per-target thresholds, got {len(threshold)}")
+            return [float(value) for value in threshold]
+        return [float(threshold)] * len(self.targets)
+
+    @property
+    def thresholds(self) -> tuple:
+        """Threshold of each column block: a float, or a {target: distance} dict if mixed."""
+        labels = []
+        for row in self._threshold_table:
+            if len(set(row.tolist())) <= 1:
+                labels.append(float(row[0]) if len(row) else 0.0)
+            else:
+                labels.append(dict(zip(self.targets, row.tolist())))
+        return tuple(labels)
+
+    @classmethod
+    def from_distances(cls, distance_data: Dict[str, np.ndarray],
+                       thresholds: Iterable[Threshold] = (0.0,)) -> 'ContactMatrix':
+        """
+        Build a matrix from per-target distance arrays of equal length.
+
+        Parameters:
+        -----------
+        distance_data : Dict[str, array-like]
+            Target organelle -> distances (one per surface point)
+        thresholds : Iterable[float or Dict[str, float]]
+            Distances <= threshold count as contact; a dict gives one
+            threshold per target
+        """
+        targets = list(distance_data)
+        thresholds = tuple(thresholds)
+        arrays = [np.asarray(distances) for distances in distance_data.values()]
+        n_points = len(arrays[0]) if arrays else 0
+        if any(len(a) != n_points for a in arrays):
+            raise ValueError("All distance arrays must have the same length")
+
+        bits = np.empty((len(thresholds) * len(targets), -(-n_points // 8)), dtype=np.uint8)
+        matrix = cls(targets, thresholds, n_points, bits)
+        for k, row in enumerate(matrix._threshold_table):
+            for i, distances in enumerate(arrays):
+                bits[k * len(targets) + i] = np.packbits(distances <= row[i])
+        return matrix
+
+    def __len__(self) -> int:
+        return self.n_points
+
+    def __repr__(self) -> str:
+        return (f"ContactMatrix({self.n_points} points, targets={self.targets}, "
+                f"thresholds={list(self.thresholds)}, {self.nbytes} bytes)")
+
+    @property
+    def nbytes(self) -> int:
+        return self._bits.nbytes
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Read-only view of the packed bits (columns x bytes)."""
+        view = self._bits.view()
+        view.flags.writeable = False
+        return view
+
+    def _threshold_index(self, threshold: Optional[Threshold]) -> int:
+        if threshold is None:
+            if len(self._threshold_table) != 1:
+                raise ValueError(f"Matrix has several thresholds {list(self.thresholds)}; pass one")
+            return 0
+        row = self._threshold_row(threshold)
+        matches = np.flatnonzero((self._threshold_table == row).all(axis=1))
+        if len(matches) == 0:
+            raise ValueError(f"Threshold {threshold} not in matrix (available: {list(self.thresholds)})")
+        return int(matches[0])
+
+    def _column(self, target: str, threshold: Optional[Threshold]) -> np.ndarray:
+        try:
+            i = self.targets.index(target)
+        except ValueError:
+            raise ValueError(f"Target '{target}' not in matrix (available: {self.targets})")
+        return self._bits[self._threshold_index(threshold) * len(self.targets) + i]
+
+    def _valid_mask(self) -> np.ndarray:
+        """Byte mask with ones for real points and zeros for padding bits."""
+        return np.packbits(np.ones(self.n_points, dtype=bool))
+
+    @staticmethod
+    def _popcount(packed: np.ndarray) -> int:
+        return int(_POPCOUNT[packed].sum(dtype=np.int64))
+
+    def contacts(self, target: str, threshold: Optional[Threshold] = None) -> np.ndarray:
+        """Unpacked boolean contact flags of one target (one per point)."""
+        return np.unpackbits(self._column(target, threshold), count=self.n_points).astype(bool)
+
+    def count(self, target: str, threshold: Optional[Threshold] = None) -> int:
+        """Points in contact with a target (regardless of other targets)."""
+        return self._popcount(self._column(target, threshold))
+
+    def count_all(self, contact_set: Iterable[str], threshold: Optional[Threshold] = None) -> int:
+        """Points in contact with every target in contact_set (others ignored)."""
+        combined = self._valid_mask()
+        for target in contact_set:
+            combined &= self._column(target, threshold)
+        return self._popcount(combined)
+
+    def count_exact(self, contact_set: Iterable[str], threshold: Optional[Threshold] = None) -> int:
+        """Points in contact with exactly the targets in contact_set (empty set = no contact)."""
+        contact_set = set(contact_set)
+        unknown = contact_set - set(self.targets)
+        if unknown:
+            raise ValueError(f"Targets not in matrix: {sorted(unknown)}")
+
+        combined = self._valid_mask()
+        for target in self.targets:
+            column = self._column(target, threshold)
+            combined &= column if target in contact_set else ~column
+        return self._popcount(combined)
+
+    def _unpacked_blocks(self, threshold: Optional[Threshold]) -> Iterable[np.ndarray]:
+        """Yield targets x points uint8 flags in blocks of _BLOCK_BYTES * 8 points."""
+        k = self._threshold_index(threshold)
+        columns = self._bits[k * len(self.targets):(k + 1) * len(self.targets)]
+        for start in range(0, columns.shape[1], _BLOCK_BYTES):
+            n_block = min(self.n_points - start * 8, _BLOCK_BYTES * 8)
+            yield np.unpackbits(columns[:, start:start + _BLOCK_BYTES], axis=1, count=n_block)
+
+    def iter_codes(self, threshold: Optional[Threshold] = None) -> Iterable[np.ndarray]:
+        """
+        Yield contact codes in blocks of points.
+
+        The code of a point is sum(2**i for targets i in contact).
+        """
+        if len(self.targets) > 62:
+            raise ValueError("Contact codes support at most 62 targets")
+
+        for flags in self._unpacked_blocks(threshold):
+            codes = np.zeros(flags.shape[1], dtype=np.int64)
+            for i, column_flags in enumerate(flags):
+                codes |= column_flags.astype(np.int64) << i
+            yield codes
+
+    def code_histogram(self, threshold: Optional[Threshold] = None) -> np.ndarray:
+        """Number of points per contact code (length 2**n_targets)."""
+        histogram = np.zeros(1 << len(self.targets), dtype=np.int64)
+        for codes in self.iter_codes(threshold):
+            histogram += np.bincount(codes, minlength=len(histogram))
+        return histogram
+
+    def co_contacts(self, threshold: Optional[Threshold] = None) -> np.ndarray:
+        """
+        Points in contact with both target i and target j (C.T @ C).
+
+        The diagonal holds the per-target contact counts. Computed as one
+        matrix product per block of points; float32 products are exact
+        because a block has fewer than 2**24 points.
+
+        Returns:
+        --------
+        np.ndarray : int64 array of shape (n_targets, n_targets), in target order
+        """
+        result = np.zeros((len(self.targets), len(self.targets)), dtype=np.int64)
+        for flags in self._unpacked_blocks(threshold):
+            flags = flags.astype(np.float32)
+            result += np.rint(flags @ flags.T).astype(np.int64)
+        return result
+
+    def to_frame(self, threshold: Optional[Threshold] = None) -> pd.DataFrame:
+        """Unpacked boolean DataFrame (rows = points, columns = targets)."""
+        return pd.DataFrame({target: self.contacts(target, threshold) for target in self.targets})
+
+    def save(self, path: str) -> Path:
+        """Save as compressed .npz (packed bits plus target/threshold labels)."""
+        path = Path(path)
+        np.savez_compressed(
+            path, bits=self._bits, targets=np.array(self.targets, dtype=str),
+            thresholds=self._threshold_table, n_points=np.array(self.n_points)
+        )
+        return path if path.suffix == '.npz' else path.with_name(path.name + '.npz')
+
+    @classmethod
+    def load(cls, path: str) -> 'ContactMatrix':
+        """Load a matrix written by save()."""
+        with np.load(path) as data:
+            return cls(data['targets'].tolist(), data['thresholds'].tolist(),
+                       int(data['n_points']), data['bits'])
@@ -6,24 +6,78 @@ Handles data extraction and validation from Imaris-generated segmentation data.
 Author: Philipp Kaintoch
 """
 
+import os
 import re
+import threading
 import warnings
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 import pandas as pd
 import numpy as np
 from ..utils.logging_config import get_logger
 from ..utils.file_filters import filter_metadata_files
+from .catalog import CellCatalog
+from .streaming import DEFAULT_CHUNK_ROWS, RunningStats, iter_array_chunks
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Combined (all statistics in one file) exports
+COMBINED_EXPORT_SUFFIXES = ('.csv', '.xlsx', '.xls')
+COMBINED_CACHE_FOLDERS = 8  # parsed folders kept in memory per loader
+
+# Per-object tables (see DataLoader.object_table)
+DISTANCE_COLUMN_PREFIX = 'Distance_to_'  # + target organelle
+OBJECT_TABLE_METRICS = ('Volume', 'Sphericity', 'Distance_from_Origin_Reference_Frame')
+OBJECT_TABLE_CACHE = 16  # (cell, organelle) tables kept in memory per loader
+ROW_INDEX = 'Row'  # index name of values without object IDs (paired by row position)
+
 
 class DataStructureError(Exception):
     """Raised when data structure doesn't match expected format."""
     pass
 
 
+def open_dataset(path: str) -> 'DataLoader':
+    """
+    Create the DataLoader backend matching a dataset path.
+
+    Parameters:
+    -----------
+    path : str
+        Imaris export directory, a zip/tar archive of one, a packed dataset
+        store (*.orgaplex), an Imaris .ims file, or a directory of .ims files
+
+    Returns:
+    --------
+    DataLoader : Loader instance (discovery not yet run)
+    """
+    path = Path(path)
+    if path.suffix == '.orgaplex':
+        from .dataset_store import PackedDatasetLoader
+        return PackedDatasetLoader(path)
+    if path.name.lower().endswith(('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')):
+        from .archive_loader import ArchiveDatasetLoader
+        return ArchiveDatasetLoader(path)
+    if path.suffix == '.ims' or (path.is_dir() and _contains_only_ims(path)):
+        from .ims_loader import ImsDatasetLoader
+        return ImsDatasetLoader(path)
+    return DataLoader(path)
+
+
+def _contains_only_ims(directory: Path) -> bool:
+    """True if a directory holds .ims files but no *_Statistics export folders."""
+    has_ims = False
+    for entry in os.scandir(directory):
+        if entry.name.startswith('._'):
+            continue
+        if entry.name.endswith('_Statistics'):
+            return False
+        has_ims = has_ims or entry.name.endswith('.ims')
+    return has_ims
+
+
 class DataLoader:
     """
     Handles loading and validation of organelle interaction data.
@@ -49,13 +103,11 @@ class DataLoader:
         # Data storage
         self.search_dir = None
         self.has_ld = False
-        self.cell_folders = []
         self.all_organelles = []
         self.unique_cells = []
 
-        # Lookup dictionaries for O(1) access (built after find_cell_folders)
-        self._folder_lookup = {}  # (cell_id, organelle) -> folder info
-        self._cells_to_organelles = {}  # cell_id -> [organelles]
+        # Indexed folder catalog (built by find_cell_folders)
+        self.catalog = None
 
         # Regex patterns for parsing folder and file names
         # Pattern to extract cell ID: everything before the last organelle_Statistics
@@ -73,6 +125,29 @@ class DataLoader:
         # Validation flag
         self._is_validated = False
 
+        # Combined statistics exports (see _combined_statistics)
+        self._combined_files = {}  # folder -> (file, header row) or None
+        self._combined_values = OrderedDict()  # folder -> ({virtual file name: values}, {...: object IDs})
+
+        # Per-object columns (see object_table)
+        self._object_tables = OrderedDict()  # (cell_id, organelle) -> ({column: values}, failed columns)
+
+        # Guards the LRU caches above; files are parsed outside the lock, so
+        # threads reading different cells run concurrently
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Worker processes start with empty caches
+        state = self.__dict__.copy()
+        state['_combined_values'] = OrderedDict()
+        state['_object_tables'] = OrderedDict()
+        state['_cache_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
     def detect_structure(self) -> bool:
         """
         Detect the folder structure to determine if dataset contains LD.
@@ -159,66 +234,72 @@ class DataLoader:
             raise DataStructureError("No folders ending with '_Statistics' found")
 
         # Parse each folder to extract cell ID and organelle
-        self.cell_folders = []
+        folders = []
         for folder in stat_dirs:
-            folder_name = folder.name
+            parsed = self._parse_folder_name(folder.name)
+            if parsed is not None:
+                folders.append((*parsed, folder))
 
-            # Extract cell ID
-            cell_match = self.cell_id_pattern.match(folder_name)
-            if not cell_match:
-                logger.warning(f"Could not parse cell ID from {folder_name}")
-                continue
-            cell_id = cell_match.group(1)
+        self._index_cell_folders(folders)
+        return True
 
-            # Extract organelle
-            org_match = self.organelle_pattern.search(folder_name)
-            if not org_match:
-                logger.warning(f"Could not parse organelle from {folder_name}")
-                continue
-            organelle = org_match.group(1)
+    def _parse_folder_name(self, folder_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Extract (cell_id, organelle) from a Statistics folder name.
 
-            self.cell_folders.append({
-                'full_path': folder,
-                'folder_name': folder_name,
-                'cell_id': cell_id,
-                'organelle': organelle
-            })
+        Returns None (and logs a warning) if the name cannot be parsed.
+        """
+        # Extract cell ID
+        cell_match = self.cell_id_pattern.match(folder_name)
+        if not cell_match:
+            logger.warning(f"Could not parse cell ID from {folder_name}")
+            return None
 
-        if not self.cell_folders:
-            raise DataStructureError("No valid cell folders could be parsed")
+        # Extract organelle
+        org_match = self.organelle_pattern.search(folder_name)
+        if not org_match:
+            logger.warning(f"Could not parse organelle from {folder_name}")
+            return None
 
-        # Extract unique values
-        self.unique_cells = sorted(set(f['cell_id'] for f in self.cell_folders))
-        self.all_organelles = sorted(set(f['organelle'] for f in self.cell_folders))
+        return cell_match.group(1), org_match.group(1)
+
+    def _index_cell_folders(self, folders: List[Tuple[str, str, Path]]):
+        """
+        Build the catalog and unique cell/organelle lists.
+
+        Shared by all dataset backends once they have discovered their folders.
+
+        Parameters:
+        -----------
+        folders : List[Tuple[str, str, Path]]
+            (cell_id, organelle, folder_path) for every Statistics folder
+        """
+        if not folders:
+            raise DataStructureError("No valid cell folders could be parsed")
 
-        # Build lookup dictionaries for O(1) access (performance optimization)
-        self._build_lookup_dictionaries()
+        self.catalog = CellCatalog.from_folders(folders)
+        self.unique_cells = list(self.catalog.cells)
+        self.all_organelles = list(self.catalog.organelles)
 
         logger.info(f"Found {len(self.unique_cells)} unique cells")
         logger.info(f"Found {len(self.all_organelles)} unique organelles: {', '.join(self.all_organelles)}")
 
         self._is_validated = True
-        return True
 
-    def _build_lookup_dictionaries(self):
+    @property
+    def cell_folders(self) -> List[Dict[str, Any]]:
         """
-        Build lookup dictionaries for fast O(1) access instead of O(n) linear searches.
+        Folder records as dicts (compatibility view of self.catalog).
 
-        This significantly improves performance for large datasets.
+        Keys: 'full_path', 'folder_name', 'cell_id', 'organelle'. Built on
+        each access; use self.catalog for lookups.
         """
-        # Build (cell_id, organelle) -> folder_info lookup
-        self._folder_lookup = {
-            (f['cell_id'], f['organelle']): f
-            for f in self.cell_folders
-        }
-
-        # Build cell_id -> [organelles] lookup
-        self._cells_to_organelles = {}
-        for folder in self.cell_folders:
-            cell_id = folder['cell_id']
-            if cell_id not in self._cells_to_organelles:
-                self._cells_to_organelles[cell_id] = []
-            self._cells_to_organelles[cell_id].append(folder['organelle'])
+        if self.catalog is None:
+            return []
+        return [
+            {'full_path': path, 'folder_name': path.name, 'cell_id': cell_id, 'organelle': organelle}
+            for cell_id, organelle, path in self.catalog.iter_folders()
+        ]
 
     def load_distance_file(self, file_path: Path) -> pd.Series:
         """
@@ -245,46 +326,495 @@ class DataLoader:
         - Warns if suspiciously large values detected (>1000 micrometers)
         """
         try:
-            # Skip first 4 rows (Imaris CSV headers), no column names
-            df = pd.read_csv(file_path, skiprows=4, header=None, encoding='utf-8')
+            # Extract first column and drop NaN values
+            distances = self.read_values(file_path).dropna()
+            return self._validate_distances(distances, file_path.name)
 
-            # Validate file structure
-            if df.shape[1] < 1:
-                raise ValueError(f"File has no columns: {file_path.name}")
+        except pd.errors.EmptyDataError:
+            raise IOError(f"File is empty or has no data: {file_path.name}")
+        except Exception as e:
+            raise IOError(f"Error reading {file_path.name}: {str(e)}")
 
-            if df.shape[0] < 1:
-                raise ValueError(f"File has no data rows: {file_path.name}")
+    @staticmethod
+    def _validate_distances(distances: pd.Series, file_name: str) -> pd.Series:
+        """Validation of load_distance_file() on values without NaN."""
+        # Validation step: Check for empty data
+        if len(distances) == 0:
+            raise ValueError(f"No valid distance values in {file_name}")
+
+        # Validation step: Ensure data is numeric
+        if not pd.api.types.is_numeric_dtype(distances):
+            raise ValueError(f"Distance data is not numeric in {file_name}")
+
+        # Validation step: Check for infinite values
+        if np.isinf(distances).any():
+            raise ValueError(f"Infinite values found in {file_name}")
+
+        # Validate for unusually large values (>1000 micrometers)
+        if (distances.abs() > 100000).any():
+            warnings.warn(
+                f"Unusually large distance values (>100 µm) found in {file_name}. "
+                f"Max value: {distances.abs().max():.2f} nm. Please verify data quality.",
+                UserWarning
+            )
+
+        return distances
+
+    def summarize_distance_file(self, file_path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                                accumulators: Sequence = ()) -> RunningStats:
+        """
+        Streaming counterpart of load_distance_file().
 
-            # Extract first column and drop NaN values
-            distances = df.iloc[:, 0].dropna()
+        Reads the file in chunks of chunk_rows values and returns running
+        statistics instead of the values, so memory stays bounded by the
+        chunk size. Validation matches load_distance_file().
 
-            # Validation step: Check for empty data
-            if len(distances) == 0:
-                raise ValueError(f"No valid distance values in {file_path.name}")
+        Parameters:
+        -----------
+        file_path : Path
+            Path returned by get_distance_files()
+        chunk_rows : int
+            Values per chunk
+        accumulators : Sequence
+            Further accumulators updated with every chunk in the same pass
+            (e.g., QuantileSketch, FixedBinHistogram)
+
+        Returns:
+        --------
+        RunningStats : count, mean, min/max and contacts (distance <= 0)
 
-            # Validation step: Ensure data is numeric
-            if not pd.api.types.is_numeric_dtype(distances):
-                raise ValueError(f"Distance data is not numeric in {file_path.name}")
+        Raises:
+        -------
+        IOError : If the file cannot be read or validation fails
+        """
+        try:
+            stats = RunningStats()
+            for chunk in self.iter_values(file_path, chunk_rows):
+                try:
+                    stats.update(chunk)
+                except ValueError:
+                    raise ValueError(f"Distance data is not numeric in {file_path.name}")
+                if not stats.has_inf:
+                    # Infinite values are reported by the validation below
+                    for accumulator in accumulators:
+                        accumulator.update(chunk)
+
+            if stats.count == 0:
+                raise ValueError(f"No valid distance values in {file_path.name}")
 
-            # Validation step: Check for infinite values
-            if np.isinf(distances).any():
+            if stats.has_inf:
                 raise ValueError(f"Infinite values found in {file_path.name}")
 
-            # Validate for unusually large values (>1000 micrometers)
-            if (distances.abs() > 100000).any():
+            max_abs = max(abs(stats.min), abs(stats.max))
+            if max_abs > 100000:
                 warnings.warn(
                     f"Unusually large distance values (>100 µm) found in {file_path.name}. "
-                    f"Max value: {distances.abs().max():.2f} nm. Please verify data quality.",
+                    f"Max value: {max_abs:.2f} nm. Please verify data quality.",
                     UserWarning
                 )
 
-            return distances
+            return stats
 
         except pd.errors.EmptyDataError:
             raise IOError(f"File is empty or has no data: {file_path.name}")
         except Exception as e:
             raise IOError(f"Error reading {file_path.name}: {str(e)}")
 
+    def iter_values(self, file_path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[np.ndarray]:
+        """
+        Read the raw value column in chunks (streaming counterpart of read_values).
+
+        Yields arrays of at most chunk_rows values in file order, without
+        NaN removal. Dataset backends override this.
+
+        Raises:
+        -------
+        ValueError : If the file has no data rows
+        pd.errors.EmptyDataError : If the file is empty
+        """
+        try:
+            yield from self._iter_csv_chunks(file_path, file_path.name, chunk_rows)
+        except FileNotFoundError:
+            # Virtual file of a combined statistics export
+            values = self._combined_statistics(Path(file_path).parent).get(Path(file_path).name)
+            if values is None:
+                raise
+            if len(values) == 0:
+                raise ValueError(f"File has no data rows: {file_path.name}")
+            yield from iter_array_chunks(values, chunk_rows)
+
+    @staticmethod
+    def _iter_csv_chunks(source, file_name: str, chunk_rows: int) -> Iterator[np.ndarray]:
+        """Chunked variant of _parse_values() (first column only)."""
+        reader = pd.read_csv(source, skiprows=4, header=None, encoding='utf-8',
+                             usecols=[0], chunksize=chunk_rows)
+        n_rows = 0
+        with reader:
+            for chunk in reader:
+                n_rows += len(chunk)
+                yield chunk.iloc[:, 0].to_numpy()
+
+        if n_rows == 0:
+            raise ValueError(f"File has no data rows: {file_name}")
+
+    def iter_object_values(self, file_path: Path,
+                           chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]:
+        """
+        Read the value column and the object IDs in chunks (streaming
+        counterpart of read_object_values).
+
+        Yields (object IDs, values) pairs of at most chunk_rows rows in file
+        order; the IDs are None if the file has no ID column and may be NaN
+        where the column is incomplete. Dataset backends override this.
+        """
+        try:
+            yield from self._iter_csv_object_chunks(file_path, file_path.name, chunk_rows)
+        except FileNotFoundError:
+            values = self._combined_statistics(Path(file_path).parent).get(Path(file_path).name)
+            if values is None:
+                raise
+            if len(values) == 0:
+                raise ValueError(f"File has no data rows: {file_path.name}")
+            object_ids = self._combined_export(Path(file_path).parent)[1].get(Path(file_path).name)
+            yield from self._iter_array_pairs(object_ids, values, chunk_rows)
+
+    @staticmethod
+    def _iter_array_pairs(object_ids: Optional[np.ndarray], values: np.ndarray,
+                          chunk_rows: int) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]:
+        """Chunk in-memory values and their object IDs (or None) alike."""
+        if object_ids is None:
+            for chunk in iter_array_chunks(values, chunk_rows):
+                yield None, chunk
+        else:
+            yield from zip(iter_array_chunks(object_ids, chunk_rows), iter_array_chunks(values, chunk_rows))
+
+    @staticmethod
+    def _iter_csv_object_chunks(source, file_name: str,
+                                chunk_rows: int) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]:
+        """Chunked variant of _parse_object_values() (first and 'ID' column)."""
+        labels = pd.read_csv(source, skiprows=3, nrows=0, encoding='utf-8').columns
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        id_columns = [i for i, name in enumerate(labels) if str(name).strip() == 'ID' and i > 0]
+        if not id_columns:
+            for chunk in DataLoader._iter_csv_chunks(source, file_name, chunk_rows):
+                yield None, chunk
+            return
+
+        reader = pd.read_csv(source, skiprows=4, header=None, encoding='utf-8',
+                             usecols=[0, id_columns[0]], chunksize=chunk_rows)
+        n_rows = 0
+        with reader:
+            for chunk in reader:
+                n_rows += len(chunk)
+                object_ids = pd.to_numeric(chunk.iloc[:, 1], errors='coerce').to_numpy(dtype=np.float64)
+                yield object_ids, chunk.iloc[:, 0].to_numpy()
+
+        if n_rows == 0:
+            raise ValueError(f"File has no data rows: {file_name}")
+
+    def read_values(self, file_path: Path) -> pd.Series:
+        """
+        Read the raw value column (first column) of an Imaris statistics file.
+
+        This is the single I/O primitive used by all analyzers; alternative
+        dataset backends override it. No NaN removal or validation is done
+        here, so row alignment with other statistics of the same object is
+        preserved.
+
+        Parameters:
+        -----------
+        file_path : Path
+            Path returned by get_distance_files() or get_metric_file()
+
+        Returns:
+        --------
+        pd.Series : Values in file order
+
+        Raises:
+        -------
+        ValueError : If the file has no columns or no data rows
+        pd.errors.EmptyDataError : If the file is empty
+        """
+        try:
+            return self._parse_values(file_path, file_path.name)
+        except FileNotFoundError:
+            # Virtual file of a combined statistics export
+            values = self._combined_statistics(Path(file_path).parent).get(Path(file_path).name)
+            if values is None:
+                raise
+            if len(values) == 0:
+                raise ValueError(f"File has no data rows: {file_path.name}")
+            return pd.Series(values)
+
+    @staticmethod
+    def _parse_values(source, file_name: str) -> pd.Series:
+        """
+        Parse the first column of an Imaris statistics CSV.
+
+        Parameters:
+        -----------
+        source : path or file-like
+            Anything pd.read_csv accepts
+        file_name : str
+            Name used in error messages
+        """
+        # Skip first 4 rows (Imaris CSV headers), no column names
+        df = pd.read_csv(source, skiprows=4, header=None, encoding='utf-8')
+
+        # Validate file structure
+        if df.shape[1] < 1:
+            raise ValueError(f"File has no columns: {file_name}")
+
+        if df.shape[0] < 1:
+            raise ValueError(f"File has no data rows: {file_name}")
+
+        return df.iloc[:, 0]
+
+    def read_object_values(self, file_path: Path) -> pd.Series:
+        """
+        Read the value column of a statistics file, indexed by object ID.
+
+        Like read_values(), without NaN removal. The index is the Imaris
+        'ID' column; if a file has none (or it is incomplete/duplicated),
+        the row position is used instead, in an index named 'Row' (see
+        object_table()). Dataset backends override this.
+
+        Returns:
+        --------
+        pd.Series : Values with an int64 index named 'ID' (or 'Row')
+        """
+        try:
+            return self._parse_object_values(file_path, file_path.name)
+        except FileNotFoundError:
+            # Combined exports are sorted by object ID per statistic
+            values = self.read_values(file_path)
+            object_ids = self._combined_export(Path(file_path).parent)[1].get(Path(file_path).name)
+            if object_ids is None:
+                return self._positional(values)
+            return pd.Series(values.to_numpy(), index=pd.Index(object_ids, name='ID'))
+
+    @staticmethod
+    def _positional(values: pd.Series) -> pd.Series:
+        """Values indexed by row position (for sources without object IDs)."""
+        return pd.Series(values.to_numpy(), index=pd.RangeIndex(len(values), name=ROW_INDEX))
+
+    @staticmethod
+    def _parse_object_values(source, file_name: str) -> pd.Series:
+        """
+        Parse the first column and the 'ID' column of an Imaris statistics CSV.
+
+        Data rows are parsed like _parse_values() (without a header), so a
+        trailing comma on data rows but not on the column-name row does not
+        shift columns. The ID column is located by its name in row 4.
+
+        Parameters:
+        -----------
+        source : path or file-like
+            Anything pd.read_csv accepts (file-likes must be seekable)
+        file_name : str
+            Name used in error messages
+        """
+        # Row 4 holds the column names
+        labels = pd.read_csv(source, skiprows=3, nrows=0, encoding='utf-8').columns
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        df = pd.read_csv(source, skiprows=4, header=None, encoding='utf-8')
+
+        if df.shape[1] < 1:
+            raise ValueError(f"File has no columns: {file_name}")
+
+        if df.shape[0] < 1:
+            raise ValueError(f"File has no data rows: {file_name}")
+
+        values = df.iloc[:, 0]
+        id_columns = [i for i, name in enumerate(labels) if str(name).strip() == 'ID' and i < df.shape[1]]
+        if not id_columns:
+            return DataLoader._positional(values)
+
+        ids = pd.to_numeric(df.iloc[:, id_columns[0]], errors='coerce')
+        if ids.isna().any() or not ids.is_unique:
+            logger.warning(f"Incomplete or duplicate object IDs in {file_name}, using row order")
+            return DataLoader._positional(values)
+
+        return pd.Series(values.to_numpy(), index=pd.Index(ids.astype(np.int64), name='ID'))
+
+    def object_table(self, cell_id: str, organelle: str,
+                     columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Per-object table of a (cell, organelle): one row per surface object.
+
+        Statistics files are joined on the Imaris object ID (outer join), so
+        objects missing in a file are NaN instead of shifting later rows.
+        If a file has no usable IDs, rows are paired by position instead
+        (index 'Row'), which requires all files to have the same length;
+        otherwise the cell is skipped with a warning (empty table).
+        Columns are read lazily (only requested columns) and cached for the
+        most recently used (cell, organelle) pairs, so analyses on the same
+        loader parse each file once.
+
+        Parameters:
+        -----------
+        cell_id : str
+            Cell identifier
+        organelle : str
+            Organelle name
+        columns : List[str], optional
+            Columns to include: DISTANCE_COLUMN_PREFIX + target organelle
+            (e.g., "Distance_to_ER") or a metric (e.g., "Volume"). Default:
+            all distance files plus OBJECT_TABLE_METRICS.
+
+        Returns:
+        --------
+        pd.DataFrame : Index = object ID; requested columns that exist and
+            could be read (read errors are logged)
+        """
+        object_columns = self._object_columns(cell_id, organelle, columns)
+        if not object_columns:
+            return pd.DataFrame(index=pd.Index([], dtype=np.int64, name='ID'))
+
+        if all(values.index.name == 'ID' for values in object_columns.values()):
+            # Vectorized outer join on object ID
+            table = pd.concat(list(object_columns.values()), axis=1, join='outer', sort=True)
+            table.columns = list(object_columns)
+            table.index.name = 'ID'
+            return table
+
+        lengths = {column: len(values) for column, values in object_columns.items()}
+        if len(set(lengths.values())) > 1:
+            logger.warning(
+                f"Skipping {cell_id}/{organelle}: files without object IDs differ in length "
+                f"({', '.join(f'{column}: {n}' for column, n in lengths.items())})"
+            )
+            return pd.DataFrame(index=pd.RangeIndex(0, name=ROW_INDEX))
+
+        n_rows = next(iter(lengths.values()))
+        return pd.DataFrame(
+            {column: values.to_numpy() for column, values in object_columns.items()},
+            index=pd.RangeIndex(n_rows, name=ROW_INDEX)
+        )
+
+    def _object_columns(self, cell_id: str, organelle: str,
+                        columns: Optional[List[str]]) -> Dict[str, pd.Series]:
+        """
+        read_object_values() of the requested columns of a (cell, organelle), cached.
+
+        Returns:
+        --------
+        Dict[str, pd.Series] : column -> values, in requested order (columns
+            that do not exist or failed to read are left out)
+        """
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        files = {}
+        if columns is None or any(column.startswith(DISTANCE_COLUMN_PREFIX) for column in columns):
+            files = {
+                DISTANCE_COLUMN_PREFIX + target_org: file_path
+                for file_path, target_org in self.get_distance_files(cell_id, organelle)
+            }
+        wanted = list(files) + list(OBJECT_TABLE_METRICS) if columns is None else list(columns)
+        for column in wanted:
+            if column not in files and not column.startswith(DISTANCE_COLUMN_PREFIX):
+                file_path = self.get_metric_file(cell_id, organelle, column)
+                if file_path is not None:
+                    files[column] = file_path
+
+        key = (cell_id, organelle)
+        with self._cache_lock:
+            loaded, failed = self._object_tables.pop(key, ({}, set()))
+
+        for column in wanted:
+            if column in loaded or column in failed or column not in files:
+                continue
+            try:
+                loaded[column] = self.read_object_values(files[column])
+            except Exception as e:
+                logger.error(f"Failed to load {files[column].name}: {str(e)}")
+                failed.add(column)
+
+        with self._cache_lock:
+            self._object_tables[key] = (loaded, failed)
+            while len(self._object_tables) > OBJECT_TABLE_CACHE:
+                self._object_tables.popitem(last=False)
+
+        return {column: loaded[column] for column in wanted if column in loaded}
+
+    def load_object_distances(self, cell_id: str, organelle: str,
+                              targets: Optional[List[str]] = None,
+                              aligned: bool = True) -> Dict[str, pd.Series]:
+        """
+        ID-aligned, validated distance columns of a (cell, source organelle).
+
+        All returned Series share the object table index, so position i is
+        the same surface object in every target. Objects missing in a target
+        file (or NaN there) are NaN. Targets failing load_distance_file()
+        validation are logged and skipped.
+
+        Parameters:
+        -----------
+        targets : List[str], optional
+            Target organelles to load (default: all distance files)
+        aligned : bool
+            If False, each target keeps the objects of its own file (for
+            per-target statistics), so files that cannot be aligned are
+            still returned
+
+        Returns:
+        --------
+        Dict[str, pd.Series] : target organelle -> distances
+        """
+        distance_files = [
+            (file_path, target_org) for file_path, target_org in self.get_distance_files(cell_id, organelle)
+            if targets is None or target_org in targets
+        ]
+        columns = [DISTANCE_COLUMN_PREFIX + target_org for _, target_org in distance_files]
+        if aligned:
+            table = self.object_table(cell_id, organelle, columns)
+            object_columns = {column: table[column] for column in table.columns}
+        else:
+            object_columns = self._object_columns(cell_id, organelle, columns)
+
+        distances = {}
+        for file_path, target_org in distance_files:
+            column = DISTANCE_COLUMN_PREFIX + target_org
+            if column not in object_columns:
+                continue
+            try:
+                self._validate_distances(object_columns[column].dropna(), file_path.name)
+            except Exception as e:
+                logger.error(f"Failed to load {file_path.name}: Error reading {file_path.name}: {str(e)}")
+                continue
+            distances[target_org] = object_columns[column]
+        return distances
+
+    def get_metric_file(self, cell_id: str, organelle: str, metric: str) -> Optional[Path]:
+        """
+        Get the file of a per-object statistic for a cell and organelle.
+
+        Parameters:
+        -----------
+        cell_id : str
+            Cell identifier (e.g., "control_1")
+        organelle : str
+            Organelle name (e.g., "ER")
+        metric : str
+            Statistic file suffix (e.g., "Volume", "Sphericity",
+            "Distance_from_Origin_Reference_Frame")
+
+        Returns:
+        --------
+        Path or None : Path to pass to read_values(), or None if not available
+        """
+        folder = self.get_folder_path(cell_id, organelle)
+        if folder is None:
+            return None
+
+        file_path = folder / f"{cell_id}_{organelle}_{metric}.csv"
+        if file_path.exists() or file_path.name in self._combined_statistics(folder):
+            return file_path
+        return None
+
     def get_distance_files(self, cell_id: str, source_organelle: str) -> List[Tuple[Path, str]]:
         """
         Get all distance files for a specific cell and source organelle.
@@ -303,19 +833,19 @@ class DataLoader:
         if not self._is_validated:
             raise DataStructureError("Must call find_cell_folders() first")
 
-        # Use O(1) dictionary lookup instead of O(n) linear search
-        key = (cell_id, source_organelle)
-        folder_info = self._folder_lookup.get(key)
-
-        if folder_info is None:
+        source_folder = self.catalog.folder_path(cell_id, source_organelle)
+        if source_folder is None:
             return []
 
-        source_folder = folder_info['full_path']
-
         # Find all distance files, excluding macOS metadata files
         distance_files = filter_metadata_files(
             source_folder.glob('*Shortest_Distance_to_Surfaces_Surfaces*.csv')
         )
+        if not distance_files:
+            distance_files = [
+                source_folder / name for name in sorted(self._combined_statistics(source_folder))
+                if 'Shortest_Distance_to_Surfaces_Surfaces' in name
+            ]
 
         # Extract target organelles
         result = []
@@ -332,7 +862,173 @@ class DataLoader:
 
         return result
 
-    def get_folder_path(self, cell_id: str, organelle: str) -> Path:
+    def distance_bytes(self, cell_id: str, source_organelle: str) -> int:
+        """
+        Size of the distance data of a cell/organelle pair, in bytes.
+
+        Used as a cost estimate for scheduling; only the folder listing is
+        read. A combined export counts with its whole file size.
+        """
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        source_folder = self.catalog.folder_path(cell_id, source_organelle)
+        if source_folder is None:
+            return 0
+
+        n_bytes = 0
+        try:
+            with os.scandir(source_folder) as entries:
+                for entry in entries:
+                    if (not entry.name.startswith('._') and entry.name.endswith('.csv')
+                            and 'Shortest_Distance_to_Surfaces_Surfaces' in entry.name):
+                        n_bytes += entry.stat().st_size
+        except OSError as e:
+            logger.debug(f"Could not list {source_folder}: {e}")
+            return 0
+
+        if n_bytes == 0:
+            combined = self._find_combined_file(source_folder)
+            if combined is not None:
+                n_bytes = combined[0].stat().st_size
+        return n_bytes
+
+    def _find_combined_file(self, folder: Path) -> Optional[Tuple[Path, int]]:
+        """
+        Find a combined statistics export in a folder (cached per folder).
+
+        A combined export is a CSV/Excel file with a 'Variable' column holding
+        the statistic name of each row.
+
+        Returns:
+        --------
+        Tuple[Path, int] or None : (file, header row index)
+        """
+        with self._cache_lock:
+            if folder in self._combined_files:
+                return self._combined_files[folder]
+
+        found = None
+        candidates = filter_metadata_files(
+            p for p in folder.iterdir() if p.suffix.lower() in COMBINED_EXPORT_SUFFIXES
+        ) if folder.is_dir() else []
+        for file_path in sorted(candidates):
+            try:
+                if file_path.suffix.lower() == '.csv':
+                    with open(file_path, encoding='utf-8', errors='replace') as f:
+                        head = [line.rstrip('\r\n').split(',') for _, line in zip(range(10), f)]
+                else:
+                    head = pd.read_excel(file_path, header=None, nrows=10).astype(str).values.tolist()
+            except Exception as e:
+                logger.debug(f"Could not inspect {file_path.name}: {e}")
+                continue
+
+            header_row = next(
+                (i for i, cells in enumerate(head) if 'Variable' in [c.strip() for c in cells]), None
+            )
+            if header_row is not None:
+                found = (file_path, header_row)
+                break
+
+        with self._cache_lock:
+            self._combined_files[folder] = found
+        return found
+
+    def _combined_statistics(self, folder: Path) -> Dict[str, np.ndarray]:
+        """Values of the combined statistics export of a folder (see _combined_export)."""
+        return self._combined_export(folder)[0]
+
+    def _combined_export(self, folder: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Split the combined statistics export of a folder by statistic.
+
+        The file is read once; rows are grouped by Variable (plus the target
+        surface for distance statistics) and sorted by object ID, giving
+        the same values as the per-statistic CSV files would. Results are
+        keyed by the file name the per-statistic export would use, e.g.
+        "control_1_ER_Volume.csv", and cached for the most recent folders.
+
+        Returns:
+        --------
+        Tuple[Dict, Dict] : virtual file name -> values (empty if no export),
+            and virtual file name -> int64 object IDs (statistics whose IDs are
+            missing, incomplete or duplicated are left out)
+        """
+        with self._cache_lock:
+            cached = self._combined_values.get(folder)
+            if cached is not None:
+                self._combined_values.move_to_end(folder)
+                return cached
+
+        combined = self._find_combined_file(folder)
+        if combined is None:
+            return {}, {}
+        file_path, header_row = combined
+
+        wanted = {'Variable', 'Value', 'Surfaces', 'ID'}
+        try:
+            if file_path.suffix.lower() == '.csv':
+                df = pd.read_csv(file_path, skiprows=header_row, header=0, encoding='utf-8',
+                                 usecols=lambda c: c.strip() in wanted)
+            else:
+                df = pd.read_excel(file_path, header=header_row,
+                                   usecols=lambda c: str(c).strip() in wanted)
+        except Exception as e:
+            logger.error(f"Failed to read combined export {file_path.name}: {str(e)}")
+            with self._cache_lock:
+                self._combined_files[folder] = None
+            return {}, {}
+
+        df.columns = [str(c).strip() for c in df.columns]
+        if 'Value' not in df.columns:
+            logger.error(f"Combined export {file_path.name} has no 'Value' column")
+            with self._cache_lock:
+                self._combined_files[folder] = None
+            return {}, {}
+        df = df[df['Variable'].notna()]
+
+        # File name stem the per-statistic export uses for each row
+        stems = df['Variable'].astype(str).str.strip().str.replace(r'\s+', '_', regex=True)
+        if 'Surfaces' in df.columns:
+            has_target = df['Surfaces'].notna()
+            targets = df.loc[has_target, 'Surfaces'].astype(str).str.replace(r'^Surfaces=', '', regex=True)
+            stems[has_target] = stems[has_target] + '_Surfaces=' + targets
+        prefix = folder.name[:-len('_Statistics')] if folder.name.endswith('_Statistics') else folder.name
+        df = df.assign(_name=prefix + '_' + stems + '.csv')
+
+        if 'ID' in df.columns:
+            df = df.sort_values(['_name', 'ID'], kind='stable')
+        object_ids = pd.to_numeric(df['ID'], errors='coerce').to_numpy() if 'ID' in df.columns else None
+        raw_values = df['Value'].to_numpy()
+        values = pd.to_numeric(df['Value'], errors='coerce').to_numpy(dtype=np.float64)
+        malformed = np.isnan(values) & df['Value'].notna().to_numpy()
+        statistics = {}
+        statistic_ids = {}
+        for name, positions in df.groupby('_name', sort=False).indices.items():
+            if malformed[positions].any():
+                # Raw values fail validation as "not numeric", like a per-statistic CSV
+                logger.debug(f"Non-numeric values for {name} in {file_path.name}")
+                statistics[name] = raw_values[positions]
+            else:
+                statistics[name] = values[positions]
+
+            if object_ids is not None:
+                ids = object_ids[positions]
+                if np.isnan(ids).any() or len(np.unique(ids)) != len(ids):
+                    logger.warning(f"Incomplete or duplicate object IDs for {name} in {file_path.name}, "
+                                   f"using row order")
+                else:
+                    statistic_ids[name] = ids.astype(np.int64)
+
+        with self._cache_lock:
+            self._combined_values[folder] = (statistics, statistic_ids)
+            while len(self._combined_values) > COMBINED_CACHE_FOLDERS:
+                self._combined_values.popitem(last=False)
+
+        logger.debug(f"Split {file_path.name} into {len(statistics)} statistics")
+        return statistics, statistic_ids
+
+    def get_folder_path(self, cell_id: str, organelle: str) -> Optional[Path]:
         """
         Get the folder path for a specific cell and organelle.
 
@@ -350,10 +1046,7 @@ class DataLoader:
         if not self._is_validated:
             raise DataStructureError("Must call find_cell_folders() first")
 
-        folder_info = self._folder_lookup.get((cell_id, organelle))
-        if folder_info is None:
-            return None
-        return folder_info['full_path']
+        return self.catalog.folder_path(cell_id, organelle)
 
     def get_cells_by_organelle(self, organelle: str) -> List[str]:
         """
@@ -371,11 +1064,63 @@ class DataLoader:
         if not self._is_validated:
             raise DataStructureError("Must call find_cell_folders() first")
 
-        cells = [
-            f['cell_id'] for f in self.cell_folders
-            if f['organelle'] == organelle
-        ]
-        return sorted(set(cells))
+        return self.catalog.cells_with(organelle)
+
+    def get_dataset_stats(self) -> Dict[str, int]:
+        """
+        Count the CSV files and bytes in all discovered Statistics folders.
+
+        Returns:
+        --------
+        dict : {'files': number of CSV files, 'bytes': total size in bytes}
+        """
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        n_files = 0
+        n_bytes = 0
+        for folder_path in self.catalog.folder_paths:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('._') or not entry.name.endswith('.csv'):
+                        continue
+                    if entry.is_file():
+                        n_files += 1
+                        n_bytes += entry.stat().st_size
+
+        return {'files': n_files, 'bytes': n_bytes}
+
+    def prefetch_headers(self, n_bytes: int = 4096, stop_event=None) -> int:
+        """
+        Read the first bytes of every CSV file to warm the OS/network file cache.
+
+        Parameters:
+        -----------
+        n_bytes : int
+            Number of bytes to read from the start of each file
+        stop_event : threading.Event, optional
+            If set, prefetching stops early
+
+        Returns:
+        --------
+        int : Number of files touched
+        """
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        touched = 0
+        for folder_path in self.catalog.folder_paths:
+            for file_path in filter_metadata_files(folder_path.glob('*.csv')):
+                if stop_event is not None and stop_event.is_set():
+                    return touched
+                try:
+                    with open(file_path, 'rb') as f:
+                        f.read(n_bytes)
+                    touched += 1
+                except OSError as e:
+                    logger.debug(f"Prefetch skipped {file_path.name}: {e}")
+
+        return touched
 
     def validate_data(self) -> Dict[str, Any]:
         """
@@ -401,9 +1146,9 @@ class DataLoader:
             'missing_data': []
         }
 
-        # Check for cells missing certain organelles (using optimized lookup)
+        # Check for cells missing certain organelles
         for cell_id in self.unique_cells:
-            cell_organelles = self._cells_to_organelles.get(cell_id, [])
+            cell_organelles = self.catalog.organelles_of(cell_id)
             missing = set(self.all_organelles) - set(cell_organelles)
             if missing:
                 report['missing_data'].append(
@@ -0,0 +1,370 @@
+"""
+Packed Dataset Store Module
+
+Converts an Imaris CSV export tree into a single binary file (*.orgaplex)
+that all analyzers can open through PackedDatasetLoader.
+
+File layout:
+    8 bytes   magic b'ORGAPLEX'
+    4 bytes   format version (uint32, little endian)
+    8 bytes   index length in bytes (uint64, little endian)
+    n bytes   JSON index
+    ...       one flat float array per measurement kind and one int64 array
+              of object IDs, each 64-byte aligned
+
+The index maps every original CSV file, i.e. (cell, organelle, target or
+metric), to a [start, stop) slice of its kind's array, and to the slice of
+the ID array starting at its ID offset (null if the file had no usable
+object IDs; its rows are then paired by position). Arrays are opened
+with np.memmap and sliced without copying, so a rerun is a sequential read
+of one file and concurrent processes share the OS page cache.
+
+USAGE:
+    python -m src.core.dataset_store <input_dir> <output.orgaplex> [--dtype float64]
+
+Author: Philipp Kaintoch
+"""
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .data_loader import DataLoader, DataStructureError, open_dataset
+from .streaming import DEFAULT_CHUNK_ROWS, iter_array_chunks
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+STORE_SUFFIX = '.orgaplex'
+MAGIC = b'ORGAPLEX'
+FORMAT_VERSION = 2
+_HEADER = struct.Struct('<8sIQ')
+_ALIGNMENT = 64
+_ID_KIND = 'ID'
+
+# Per-object statistics packed in addition to the distance files
+PACKED_METRICS = ('Volume', 'Sphericity', 'Distance_from_Origin_Reference_Frame')
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def pack_dataset(data_loader: DataLoader, output_path: str, dtype: str = 'float32') -> Path:
+    """
+    Pack all distance and metric files of a dataset into one store file.
+
+    Parameters:
+    -----------
+    data_loader : DataLoader
+        Loader for the source dataset (discovery is run if needed)
+    output_path : str
+        Destination file; the '.orgaplex' suffix is added if missing
+    dtype : str
+        'float32' (half the size) or 'float64' (bit-identical to CSV parsing)
+
+    Returns:
+    --------
+    Path : Path of the written store
+
+    Notes:
+    ------
+    - Files that cannot be read or are not numeric are skipped with a
+      warning; analyzers then treat them as missing
+    - The store is written to a temporary file and renamed on success
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype('float32'), np.dtype('float64')):
+        raise ValueError(f"Unsupported dtype: {dtype} (use float32 or float64)")
+
+    output_path = Path(output_path)
+    if output_path.suffix != STORE_SUFFIX:
+        output_path = output_path.with_name(output_path.name + STORE_SUFFIX)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not data_loader._is_validated:
+        data_loader.detect_structure()
+        data_loader.find_cell_folders()
+
+    logger.info(f"Packing {len(data_loader.catalog)} folders into {output_path.name}")
+
+    with tempfile.TemporaryDirectory(dir=output_path.parent, prefix='.orgaplex_') as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        kind_files = {}
+        kind_lengths = {}
+        entries = []
+        skipped = 0
+
+        def write(kind: str, array: np.ndarray) -> int:
+            if kind not in kind_files:
+                kind_files[kind] = open(tmp_dir / f"{len(kind_files)}.bin", 'wb')
+                kind_lengths[kind] = 0
+
+            kind_files[kind].write(array.tobytes())
+            start = kind_lengths[kind]
+            kind_lengths[kind] = start + len(array)
+            return start
+
+        def append(kind: str, cell_id: str, organelle: str, key: str, file_path: Path):
+            nonlocal skipped
+            try:
+                values = data_loader.read_object_values(file_path)
+                if not pd.api.types.is_numeric_dtype(values):
+                    raise ValueError("values are not numeric")
+            except Exception as e:
+                logger.warning(f"Skipping {file_path.name}: {e}")
+                skipped += 1
+                return
+
+            start = write(kind, values.to_numpy(dtype=dtype))
+            id_start = None
+            if values.index.name == 'ID':
+                id_start = write(_ID_KIND, values.index.to_numpy(dtype=np.int64))
+            entries.append([kind, cell_id, organelle, key, start, start + len(values),
+                            file_path.name, id_start])
+
+        try:
+            for cell_id, organelle, _ in data_loader.catalog.iter_folders():
+                for file_path, target_org in data_loader.get_distance_files(cell_id, organelle):
+                    append('distance', cell_id, organelle, target_org, file_path)
+
+                for metric in PACKED_METRICS:
+                    file_path = data_loader.get_metric_file(cell_id, organelle, metric)
+                    if file_path is not None:
+                        append(metric, cell_id, organelle, metric, file_path)
+        finally:
+            for f in kind_files.values():
+                f.close()
+
+        # Offsets are relative to the 64-byte aligned end of the index
+        arrays = {}
+        offset = 0
+        for kind, length in kind_lengths.items():
+            kind_dtype = np.dtype(np.int64) if kind == _ID_KIND else dtype
+            arrays[kind] = {'offset': offset, 'length': length, 'dtype': kind_dtype.str}
+            offset = _aligned(offset + length * kind_dtype.itemsize)
+
+        index = {
+            'version': FORMAT_VERSION,
+            'dtype': dtype.str,
+            'has_ld': data_loader.has_ld,
+            'source': str(data_loader.search_dir),
+            'folders': [
+                [cell_id, organelle, path.name]
+                for cell_id, organelle, path in data_loader.catalog.iter_folders()
+            ],
+            'arrays': arrays,
+            'entries': entries,
+        }
+        index_bytes = json.dumps(index).encode('utf-8')
+        data_start = _aligned(_HEADER.size + len(index_bytes))
+
+        tmp_output = tmp_dir / 'store.tmp'
+        with open(tmp_output, 'wb') as out:
+            out.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(index_bytes)))
+            out.write(index_bytes)
+            for kind, info in arrays.items():
+                out.write(b'\0' * (data_start + info['offset'] - out.tell()))
+                with open(kind_files[kind].name, 'rb') as src:
+                    shutil.copyfileobj(src, out, length=16 * 1024 * 1024)
+
+        os.replace(tmp_output, output_path)
+
+    size_mb = output_path.stat().st_size / 1024 ** 2
+    logger.info(f"Packed {len(entries)} files ({skipped} skipped) into {output_path} ({size_mb:.1f} MB)")
+    return output_path
+
+
+def read_store_index(store_path: Path) -> Tuple[dict, int]:
+    """
+    Read and validate the index of a packed store.
+
+    Returns:
+    --------
+    Tuple[dict, int] : (index, absolute byte offset of the data region)
+    """
+    with open(store_path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise DataStructureError(f"Not a packed dataset store: {store_path.name}")
+        magic, version, index_length = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise DataStructureError(f"Not a packed dataset store: {store_path.name}")
+        if version != FORMAT_VERSION:
+            raise DataStructureError(
+                f"Unsupported store version {version} in {store_path.name} (expected {FORMAT_VERSION})"
+            )
+        index = json.loads(f.read(index_length).decode('utf-8'))
+
+    return index, _aligned(_HEADER.size + index_length)
+
+
+class PackedDatasetLoader(DataLoader):
+    """
+    DataLoader backend reading a packed *.orgaplex store via np.memmap.
+
+    File paths handed out by get_distance_files()/get_metric_file() are
+    virtual (store path / original folder / original file name), so log
+    messages look the same as for the CSV tree.
+    """
+
+    def __init__(self, store_path: str):
+        super().__init__(store_path)
+        self._index = None
+        self._data_start = 0
+        self._arrays = {}  # kind -> np.memmap, opened lazily per process
+        self._entries = {}  # virtual path -> (kind, start, stop, ID start or None)
+        self._distance_entries = {}  # (cell_id, organelle) -> [(path, target)]
+        self._metric_entries = {}  # (cell_id, organelle, metric) -> path
+
+    def __getstate__(self):
+        # Memory maps would be pickled as copies; workers reopen the file
+        state = super().__getstate__()
+        state['_arrays'] = {}
+        return state
+
+    def detect_structure(self) -> bool:
+        if not self.parent_dir.is_file():
+            raise DataStructureError(f"Dataset store does not exist: {self.parent_dir}")
+
+        self._index, self._data_start = read_store_index(self.parent_dir)
+        self.search_dir = self.parent_dir
+        self.has_ld = bool(self._index['has_ld'])
+
+        logger.info(f"Structure: Packed store ({len(self._index['entries'])} arrays) "
+                    f"-> Dataset {'contains' if self.has_ld else 'does not contain'} LD")
+        return True
+
+    def find_cell_folders(self) -> bool:
+        if self._index is None:
+            raise DataStructureError("Must call detect_structure() first")
+
+        folders = [
+            (cell_id, organelle, self.parent_dir / folder_name)
+            for cell_id, organelle, folder_name in self._index['folders']
+        ]
+        folder_names = {(cell_id, organelle): path.name for cell_id, organelle, path in folders}
+
+        self._entries = {}
+        self._distance_entries = {}
+        self._metric_entries = {}
+        for kind, cell_id, organelle, key, start, stop, file_name, id_start in self._index['entries']:
+            path = self.parent_dir / folder_names[(cell_id, organelle)] / file_name
+            self._entries[path] = (kind, start, stop, id_start)
+            if kind == 'distance':
+                self._distance_entries.setdefault((cell_id, organelle), []).append((path, key))
+            else:
+                self._metric_entries[(cell_id, organelle, key)] = path
+
+        self._index_cell_folders(folders)
+        return True
+
+    def _array(self, kind: str) -> np.memmap:
+        array = self._arrays.get(kind)
+        if array is None:
+            info = self._index['arrays'][kind]
+            array = np.memmap(
+                self.parent_dir, dtype=np.dtype(info['dtype']), mode='r',
+                offset=self._data_start + info['offset'], shape=(info['length'],)
+            )
+            self._arrays[kind] = array
+        return array
+
+    def _entry(self, file_path: Path) -> Tuple[str, int, int, Optional[int]]:
+        entry = self._entries.get(Path(file_path))
+        if entry is None:
+            raise FileNotFoundError(f"{Path(file_path).name} is not in {self.parent_dir.name}")
+
+        kind, start, stop, id_start = entry
+        if stop <= start:
+            raise ValueError(f"File has no data rows: {Path(file_path).name}")
+        return entry
+
+    def _slice(self, file_path: Path) -> np.ndarray:
+        kind, start, stop, _ = self._entry(file_path)
+        return self._array(kind)[start:stop]
+
+    def _object_ids(self, file_path: Path) -> Optional[np.ndarray]:
+        _, start, stop, id_start = self._entry(file_path)
+        if id_start is None:
+            return None
+        return self._array(_ID_KIND)[id_start:id_start + stop - start]
+
+    def iter_values(self, file_path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[np.ndarray]:
+        # Only the pages of the current chunk are touched
+        for chunk in iter_array_chunks(self._slice(file_path), chunk_rows):
+            yield chunk.astype(np.float64)
+
+    def iter_object_values(self, file_path: Path,
+                           chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]:
+        pairs = self._iter_array_pairs(self._object_ids(file_path), self._slice(file_path), chunk_rows)
+        for object_ids, chunk in pairs:
+            yield object_ids, chunk.astype(np.float64)
+
+    def read_values(self, file_path: Path) -> pd.Series:
+        values = self._slice(file_path)
+        if values.dtype != np.float64:
+            # Analyzers accumulate in float64, as with parsed CSV values
+            return pd.Series(values.astype(np.float64))
+        # Zero-copy view into the memory map
+        return pd.Series(values, copy=False)
+
+    def read_object_values(self, file_path: Path) -> pd.Series:
+        values = self.read_values(file_path)
+        object_ids = self._object_ids(file_path)
+        if object_ids is None:
+            return self._positional(values)
+        return pd.Series(values.to_numpy(), index=pd.Index(np.asarray(object_ids), name='ID'))
+
+    def get_distance_files(self, cell_id: str, source_organelle: str) -> List[Tuple[Path, str]]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return list(self._distance_entries.get((cell_id, source_organelle), []))
+
+    def distance_bytes(self, cell_id: str, source_organelle: str) -> int:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        itemsize = np.dtype(self._index['dtype']).itemsize
+        return sum(
+            (self._entries[path][2] - self._entries[path][1]) * itemsize
+            for path, _ in self._distance_entries.get((cell_id, source_organelle), [])
+        )
+
+    def get_metric_file(self, cell_id: str, organelle: str, metric: str) -> Optional[Path]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return self._metric_entries.get((cell_id, organelle, metric))
+
+    def get_dataset_stats(self) -> Dict[str, int]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return {'files': len(self._entries), 'bytes': self.parent_dir.stat().st_size}
+
+    def prefetch_headers(self, n_bytes: int = 4096, stop_event=None) -> int:
+        """Read the whole store sequentially to warm the page cache."""
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        with open(self.parent_dir, 'rb') as f:
+            while f.read(16 * 1024 * 1024):
+                if stop_event is not None and stop_event.is_set():
+                    break
+        return 1
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pack an Imaris export into a single dataset store")
+    parser.add_argument('input_dir', help="Imaris export directory")
+    parser.add_argument('output', help="Output store path (*.orgaplex)")
+    parser.add_argument('--dtype', choices=['float32', 'float64'], default='float32',
+                        help="Storage precision (default: float32)")
+    args = parser.parse_args()
+
+    pack_dataset(open_dataset(args.input_dir), args.output, dtype=args.dtype)
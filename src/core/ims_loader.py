@@ -0,0 +1,289 @@
+"""
+Imaris .ims Dataset Backend
+
+Reads surface statistics directly from Imaris .ims (HDF5) files, so the
+per-statistic CSV export step can be skipped. Each .ims file is one cell
+(cell ID = file stem), each Surfaces object one organelle (organelle =
+surface name).
+
+Statistics are stored per surface object in three HDF5 tables:
+    Scene8/Content/Surfaces<N>/StatisticsValue  (ID_Object, ID_StatisticsType, Value)
+    Scene8/Content/Surfaces<N>/StatisticsType   (ID, ID_FactorList, Name, ...)
+    Scene8/Content/Surfaces<N>/Factor           (ID_List, Name, Level)
+
+Requires the optional h5py package.
+
+Author: Philipp Kaintoch
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .data_loader import DataLoader, DataStructureError
+from .streaming import DEFAULT_CHUNK_ROWS, iter_array_chunks
+from ..utils.file_filters import filter_metadata_files
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+IMS_SUFFIX = '.ims'
+DISTANCE_STATISTIC = 'Shortest_Distance_to_Surfaces'
+_CONTENT_GROUPS = ('Scene8/Content', 'Scene/Content')
+
+
+def _import_h5py():
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError(
+            "Reading .ims files requires h5py. Install it with: pip install h5py"
+        ) from None
+    return h5py
+
+
+def _text(value) -> str:
+    """Decode an HDF5 string attribute or field (Imaris stores some as char arrays)."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'S' and value.size > 1:
+            value = b''.join(value.ravel().tolist())
+        else:
+            value = value.ravel()[0] if value.size else b''
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', errors='replace')
+    return str(value).rstrip('\0').strip()
+
+
+def _normalize(name: str) -> str:
+    """Statistic name as used in CSV export file names ('Volume', 'Shortest_Distance_to_Surfaces')."""
+    return re.sub(r'\s+', '_', name.strip())
+
+
+class ImsDatasetLoader(DataLoader):
+    """
+    DataLoader backend reading statistics from Imaris .ims files.
+
+    parent_dir is either a single .ims file or a directory searched
+    recursively for .ims files. File paths handed out by
+    get_distance_files()/get_metric_file() are virtual and named like the
+    CSV export (ims file / <cell>_<org>_Statistics / <cell>_<org>_<stat>.csv).
+
+    Notes:
+    ------
+    - Values are returned in object ID order, like the CSV export
+    - Imaris stores values as float32, so results can differ from a CSV
+      export in the last printed digits
+    - The statistics table of one surface is read in a single HDF5 call and
+      kept until another surface is requested
+    """
+
+    def __init__(self, parent_dir: str):
+        super().__init__(parent_dir)
+        self._ims_files = []
+        self._entries = {}  # virtual path -> (ims path, surface group, statistics type ID)
+        self._distance_entries = {}  # (cell_id, organelle) -> [(path, target)]
+        self._metric_entries = {}  # (cell_id, organelle, metric) -> path
+        self._values_cache = (None, {})  # ((ims path, group), {type ID: (object IDs, values)})
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_values_cache'] = (None, {})
+        return state
+
+    def detect_structure(self) -> bool:
+        if not self.parent_dir.exists():
+            raise DataStructureError(f"Parent directory does not exist: {self.parent_dir}")
+
+        _import_h5py()
+        if self.parent_dir.is_file():
+            self._ims_files = [self.parent_dir]
+        else:
+            self._ims_files = sorted(filter_metadata_files(self.parent_dir.rglob(f'*{IMS_SUFFIX}')))
+
+        if not self._ims_files:
+            raise DataStructureError(f"No {IMS_SUFFIX} files found in {self.parent_dir}")
+
+        self.search_dir = self.parent_dir
+        logger.info(f"Structure: Imaris files -> {len(self._ims_files)} .ims file(s)")
+        return True
+
+    def find_cell_folders(self) -> bool:
+        if self.search_dir is None:
+            raise DataStructureError("Must call detect_structure() first")
+
+        h5py = _import_h5py()
+        self._entries = {}
+        self._distance_entries = {}
+        self._metric_entries = {}
+
+        folders = []
+        for ims_path in self._ims_files:
+            cell_id = ims_path.stem
+            try:
+                with h5py.File(ims_path, 'r') as f:
+                    surfaces = self._surface_groups(f)
+                    if not surfaces:
+                        logger.warning(f"No Surfaces with statistics in {ims_path.name}")
+                        continue
+                    for group_path, organelle in surfaces:
+                        folder = ims_path / f"{cell_id}_{organelle}_Statistics"
+                        self._register_statistics(f[group_path], ims_path, group_path,
+                                                  cell_id, organelle, folder)
+                        folders.append((cell_id, organelle, folder))
+            except OSError as e:
+                logger.warning(f"Could not read {ims_path.name}: {e}")
+
+        self._index_cell_folders(folders)
+        self.has_ld = 'LD' in self.all_organelles
+        logger.info(f"Dataset {'contains' if self.has_ld else 'does not contain'} LD")
+        return True
+
+    @staticmethod
+    def _surface_groups(ims_file) -> List[Tuple[str, str]]:
+        """(group path, surface name) of every Surfaces object that has statistics."""
+        for content_path in _CONTENT_GROUPS:
+            if content_path in ims_file:
+                content = ims_file[content_path]
+                break
+        else:
+            return []
+
+        surfaces = []
+        for key in content:
+            group = content[key]
+            if not key.startswith('Surfaces') or 'StatisticsValue' not in group:
+                continue
+            name = _text(group.attrs['Name']) if 'Name' in group.attrs else key
+            surfaces.append((f"{content.name.lstrip('/')}/{key}", name))
+        return surfaces
+
+    def _register_statistics(self, group, ims_path: Path, group_path: str,
+                             cell_id: str, organelle: str, folder: Path):
+        """Add one virtual file per statistics type of a surface."""
+        factors = {}
+        if 'Factor' in group:
+            for row in group['Factor'][()]:
+                factors.setdefault(int(row['ID_List']), {})[_text(row['Name'])] = _text(row['Level'])
+
+        for row in group['StatisticsType'][()]:
+            type_id = int(row['ID'])
+            name = _normalize(_text(row['Name']))
+            factor_levels = factors.get(int(row['ID_FactorList']), {})
+
+            if name == DISTANCE_STATISTIC and 'Surfaces' in factor_levels:
+                file_name = f"{cell_id}_{organelle}_{name}_Surfaces={factor_levels['Surfaces']}.csv"
+                target_match = self.target_pattern.search(file_name)
+                if not target_match:
+                    logger.warning(f"Could not identify target in {file_name}")
+                    continue
+                path = folder / file_name
+                self._distance_entries.setdefault((cell_id, organelle), []).append(
+                    (path, target_match.group(1))
+                )
+            else:
+                path = folder / f"{cell_id}_{organelle}_{name}.csv"
+                self._metric_entries[(cell_id, organelle, name)] = path
+
+            self._entries[path] = (ims_path, group_path, type_id)
+
+    def _surface_values(self, ims_path: Path, group_path: str) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """Read the statistics table of one surface, split by statistics type."""
+        key, cached = self._values_cache
+        if key == (ims_path, group_path):
+            return cached
+
+        h5py = _import_h5py()
+        with h5py.File(ims_path, 'r') as f:
+            table = f[group_path]['StatisticsValue'][()]
+
+        # Per-object values only (ID_Object -1 holds overall statistics)
+        table = table[table['ID_Object'] >= 0]
+        types = table['ID_StatisticsType']
+        order = np.lexsort((table['ID_Object'], types))
+        types = types[order]
+        object_ids = table['ID_Object'][order].astype(np.int64)
+        values = table['Value'][order].astype(np.float64)
+
+        type_ids, starts = np.unique(types, return_index=True)
+        stops = np.append(starts[1:], len(types))
+        by_type = {
+            int(type_id): (object_ids[start:stop], values[start:stop])
+            for type_id, start, stop in zip(type_ids, starts, stops)
+        }
+
+        self._values_cache = ((ims_path, group_path), by_type)
+        return by_type
+
+    def _statistic(self, file_path: Path) -> Tuple[np.ndarray, np.ndarray]:
+        """(object IDs, values) of one virtual statistics file."""
+        entry = self._entries.get(Path(file_path))
+        if entry is None:
+            raise FileNotFoundError(f"{Path(file_path).name} is not in {self.parent_dir.name}")
+
+        ims_path, group_path, type_id = entry
+        statistic = self._surface_values(ims_path, group_path).get(type_id)
+        if statistic is None or len(statistic[1]) == 0:
+            raise ValueError(f"File has no data rows: {Path(file_path).name}")
+        return statistic
+
+    def read_values(self, file_path: Path) -> pd.Series:
+        return pd.Series(self._statistic(file_path)[1])
+
+    def read_object_values(self, file_path: Path) -> pd.Series:
+        object_ids, values = self._statistic(file_path)
+        return pd.Series(values, index=pd.Index(object_ids, name='ID'))
+
+    def iter_values(self, file_path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[np.ndarray]:
+        # The surface table is read as a whole; chunking bounds the temporaries
+        yield from iter_array_chunks(self.read_values(file_path).to_numpy(), chunk_rows)
+
+    def iter_object_values(self, file_path: Path,
+                           chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]:
+        object_ids, values = self._statistic(file_path)
+        yield from self._iter_array_pairs(object_ids, values, chunk_rows)
+
+    def get_distance_files(self, cell_id: str, source_organelle: str) -> List[Tuple[Path, str]]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return list(self._distance_entries.get((cell_id, source_organelle), []))
+
+    def distance_bytes(self, cell_id: str, source_organelle: str) -> int:
+        # Rough estimate: .ims file size times number of distance statistics
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        entries = self._distance_entries.get((cell_id, source_organelle), [])
+        if not entries:
+            return 0
+        ims_path = self._entries[entries[0][0]][0]
+        return ims_path.stat().st_size * len(entries)
+
+    def get_metric_file(self, cell_id: str, organelle: str, metric: str) -> Optional[Path]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return self._metric_entries.get((cell_id, organelle, metric))
+
+    def get_dataset_stats(self) -> Dict[str, int]:
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+        return {
+            'files': len(self._ims_files),
+            'bytes': sum(path.stat().st_size for path in self._ims_files),
+        }
+
+    def prefetch_headers(self, n_bytes: int = 4096, stop_event=None) -> int:
+        """Read the start of every .ims file (HDF5 superblock and root group)."""
+        if not self._is_validated:
+            raise DataStructureError("Must call find_cell_folders() first")
+
+        touched = 0
+        for ims_path in self._ims_files:
+            if stop_event is not None and stop_event.is_set():
+                break
+            try:
+                with open(ims_path, 'rb') as f:
+                    f.read(n_bytes)
+                touched += 1
+            except OSError as e:
+                logger.debug(f"Prefetch skipped {ims_path.name}: {e}")
+        return touched
@@ -12,27 +12,44 @@ For n target organelles, generates 2^n boolean combinations:
 - n-way: contact with all targets
 - No_contact: no targets in contact
 
+Optionally, inclusive counts ("at least these targets", including the
+per-target totals) are derived from the exact counts with a superset-sum
+transform and exported as a second table, and a targets x targets
+co-contact matrix (points touching both target i and j) is computed per
+cell and averaged per condition.
+
 Output Format:
     One Excel file per bait organelle
     Rows = cells, Columns = [Cell_ID, Surface_count, combo1, combo2, ..., No_contact]
+    or, with sparse_output, one row per observed pattern:
+    Columns = [Cell_ID, Surface_count, Pattern, Count]
 
 Author: Philipp Kaintoch
 Date: 2025-11-18
 """
 
 import itertools
+import warnings
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union
 from datetime import datetime
-from .data_loader import DataLoader
+from .data_loader import DataLoader, open_dataset
+from .worker_pool import WorkerPool
+from .contact_matrix import ContactMatrix
+from .streaming import DEFAULT_CHUNK_ROWS
 from ..utils.logging_config import get_logger
-from ..utils.sorting import sort_cell_ids
 from ..utils.metadata import generate_base_metadata
+from ..utils.sorting import cell_condition
 
 logger = get_logger(__name__)
 
+# Key of the inclusive counts inside a cell's counts dictionary
+INCLUSIVE_KEY = '_inclusive'
+# Key of the co-contact matrix (DataFrame) inside a cell's counts dictionary
+CO_CONTACT_KEY = '_co_contacts'
+
 
 class NWayInteractionAnalyzer:
     """
@@ -45,7 +62,13 @@ class NWayInteractionAnalyzer:
     4. Outputs counts per cell in a structured format
     """
 
-    def __init__(self, input_dir: str, threshold: float = 0.0):
+    def __init__(self, input_dir: str, threshold: float = 0.0,
+                 data_loader: Optional[DataLoader] = None,
+                 worker_pool: Optional[WorkerPool] = None,
+                 streaming: bool = False, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 inclusive_counts: bool = False, co_contacts: bool = False,
+                 sparse_output: bool = False,
+                 target_thresholds: Optional[Dict[Union[str, Tuple[str, str]], float]] = None):
         """
         Initialize the analyzer.
 
@@ -56,14 +79,60 @@ class NWayInteractionAnalyzer:
         threshold : float
             Distance threshold for contact (default: <= 0)
             Negative distances in Imaris indicate overlapping organelles
+        data_loader : DataLoader, optional
+            Already scanned loader for input_dir (e.g., from the GUI pre-scan).
+            Discovery is skipped in load_data() if it has been run.
+        worker_pool : WorkerPool, optional
+            If given, cells are analyzed in parallel worker processes
+        streaming : bool
+            Read all target files of a bait in lock-step chunks of chunk_rows
+            rows and accumulate combination counts, so memory is bounded by
+            the chunk size instead of file size x targets.
+        chunk_rows : int
+            Rows per chunk in streaming mode
+        inclusive_counts : bool
+            Also count surface points in contact with at least each target
+            combination (exported as an additional 'Inclusive' table)
+        co_contacts : bool
+            Also compute the targets x targets co-contact matrix per cell
+            (exported per cell and as the mean per condition)
+        sparse_output : bool
+            Report results in long format (Cell_ID, Surface_count, Pattern,
+            Count) listing only patterns observed in a cell, instead of one
+            column per each of the 2^n patterns
+        target_thresholds : Dict, optional
+            Contact thresholds overriding `threshold` per target organelle
+            ({'ER': 0.1}) or per bait and target ({('LD', 'Ly'): 0.05});
+            bait/target entries take precedence over target entries
         """
         self.input_dir = input_dir
         self.threshold = threshold
-        self.data_loader = DataLoader(input_dir)
+        self.data_loader = data_loader if data_loader is not None else open_dataset(input_dir)
+        self.worker_pool = worker_pool
+        self.streaming = streaming
+        self.chunk_rows = chunk_rows
+        self.inclusive_counts = inclusive_counts
+        self.co_contacts = co_contacts
+        self.sparse_output = sparse_output
+        self.target_thresholds = self._validated_threshold_map(target_thresholds or {})
         self.bait_organelles = None  # None = batch mode (all organelles)
+        self.target_organelles = None  # None = all other organelles
         self.results = {}  # bait -> DataFrame
+        self.inclusive_results = {}  # bait -> DataFrame (inclusive_counts only)
+        self.co_contact_results = {}  # bait -> DataFrame, rows = (cell, target) (co_contacts only)
+        self.co_contact_means = {}  # bait -> DataFrame, rows = (condition, target)
         self.metadata = {}
 
+    def __getstate__(self):
+        # Sent to worker processes: only the loader and settings are needed
+        state = self.__dict__.copy()
+        state['worker_pool'] = None
+        state['results'] = {}
+        state['inclusive_results'] = {}
+        state['co_contact_results'] = {}
+        state['co_contact_means'] = {}
+        return state
+
     def load_data(self):
         """
         Load and validate data using DataLoader.
@@ -71,8 +140,9 @@ class NWayInteractionAnalyzer:
         This method must be called before running analysis.
         """
         logger.info("Loading data...")
-        self.data_loader.detect_structure()
-        self.data_loader.find_cell_folders()
+        if not self.data_loader._is_validated:
+            self.data_loader.detect_structure()
+            self.data_loader.find_cell_folders()
 
         # Log summary
         summary = self.data_loader.get_summary()
@@ -108,6 +178,60 @@ class NWayInteractionAnalyzer:
         self.bait_organelles = baits
         logger.info(f"Set bait organelles: {baits}")
 
+    def set_target_organelles(self, targets: Optional[List[str]]):
+        """
+        Restrict the contact patterns to a subset of target organelles.
+
+        Parameters:
+        -----------
+        targets : List[str] or None
+            Target organelle names; None uses all other organelles. A bait
+            is never its own target, so it may be included.
+        """
+        if targets is not None:
+            available = set(self.data_loader.all_organelles)
+            for target in targets:
+                if target not in available:
+                    raise ValueError(f"Target '{target}' not found in data. Available: {available}")
+            if not targets:
+                raise ValueError("At least one target organelle is required")
+
+        self.target_organelles = list(targets) if targets is not None else None
+        logger.info(f"Set target organelles: {targets if targets is not None else 'all'}")
+
+    @staticmethod
+    def _validated_threshold_map(threshold_map: Dict) -> Dict:
+        validated = {}
+        for key, value in threshold_map.items():
+            if not (isinstance(key, str) or
+                    (isinstance(key, tuple) and len(key) == 2 and all(isinstance(k, str) for k in key))):
+                raise ValueError(f"Threshold keys must be a target or a (bait, target) tuple, got {key!r}")
+            try:
+                validated[key] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Threshold for {key!r} is not a number: {value!r}")
+        return validated
+
+    def thresholds_for(self, bait_organelle: str, targets: List[str]) -> Dict[str, float]:
+        """
+        Contact threshold of each target for a bait.
+
+        Precedence: (bait, target) entry, target entry, then `threshold`.
+        """
+        return {
+            target: self.target_thresholds.get(
+                (bait_organelle, target), self.target_thresholds.get(target, self.threshold)
+            )
+            for target in targets
+        }
+
+    def _select_targets(self, distance_files: List[Tuple[Path, str]]) -> List[Tuple[Path, str]]:
+        """Distance files of the selected target organelles."""
+        if self.target_organelles is None:
+            return distance_files
+        return [(file_path, target_org) for file_path, target_org in distance_files
+                if target_org in self.target_organelles]
+
     @staticmethod
     def generate_boolean_combinations(target_organelles: List[str]) -> List[Tuple[str, Set[str]]]:
         """
@@ -131,21 +255,28 @@ class NWayInteractionAnalyzer:
         # Generate all subsets from size 1 to n
         for r in range(1, len(sorted_targets) + 1):
             for combo in itertools.combinations(sorted_targets, r):
-                # Create name: "ER_only" for single, "ER+LD" for pairs
-                if r == 1:
-                    name = f"{combo[0]}_only"
-                else:
-                    name = "+".join(combo)
-
-                contact_set = set(combo)
-                combinations_list.append((name, contact_set))
+                combinations_list.append((NWayInteractionAnalyzer.combination_name(combo), set(combo)))
 
         # Add "No_contact" as final combination (empty set)
         combinations_list.append(("No_contact", set()))
 
         return combinations_list
 
-    def _evaluate_contacts(self, distance_data: Dict[str, pd.Series]) -> Dict[str, int]:
+    @staticmethod
+    def combination_name(combo: Tuple[str, ...]) -> str:
+        """
+        Column name of a contact pattern of sorted targets.
+
+        "ER_only" for single, "ER+LD" for pairs, "No_contact" for none.
+        """
+        if not combo:
+            return "No_contact"
+        if len(combo) == 1:
+            return f"{combo[0]}_only"
+        return "+".join(combo)
+
+    def _evaluate_contacts(self, distance_data: Dict[str, pd.Series],
+                           bait_organelle: Optional[str] = None) -> Dict[str, int]:
         """
         Evaluate contact patterns for surface points.
 
@@ -156,6 +287,8 @@ class NWayInteractionAnalyzer:
         -----------
         distance_data : Dict[str, pd.Series]
             Maps target organelle names to distance Series (all same length)
+        bait_organelle : str, optional
+            Bait name for bait-specific entries of target_thresholds
 
         Returns:
         --------
@@ -169,39 +302,80 @@ class NWayInteractionAnalyzer:
             logger.warning("No target organelles found")
             return {'Surface_count': 0}
 
-        # Get combinations for these targets
-        combos = self.generate_boolean_combinations(targets)
+        thresholds = self.thresholds_for(bait_organelle, targets)
+        matrix = ContactMatrix.from_distances(distance_data, thresholds=(thresholds,))
+        co_contacts = matrix.co_contacts() if self.co_contacts else None
+        return self._counts_from_histogram(targets, matrix.code_histogram(), co_contacts)
 
-        # Create contact matrix: True if distance <= threshold
-        contact_df = pd.DataFrame({
-            org: distances <= self.threshold
-            for org, distances in distance_data.items()
-        })
+    def _counts_from_histogram(self, targets: List[str], histogram: np.ndarray,
+                               co_contacts: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """
+        Translate a contact code histogram into named combination counts.
+
+        Code c = sum(2**i for targets i in contact) counts the points in
+        contact with exactly the targets in c (see ContactMatrix).
+        """
+        bits = {org: 1 << i for i, org in enumerate(targets)}
 
         # Initialize counts with surface count
-        counts = {'Surface_count': len(contact_df)}
+        counts = {'Surface_count': int(histogram.sum())}
+        if self.sparse_output:
+            counts.update(self._observed_counts(targets, histogram))
+        else:
+            for combo_name, expected_contacts in self.generate_boolean_combinations(targets):
+                # Exactly these organelles in contact (empty set = No_contact)
+                code = sum(bits[org] for org in expected_contacts)
+                counts[combo_name] = int(histogram[code])
+
+        if self.inclusive_counts:
+            counts[INCLUSIVE_KEY] = self._inclusive_from_histogram(targets, histogram)
+        if co_contacts is not None:
+            sorted_targets = sorted(targets)
+            frame = pd.DataFrame(co_contacts, index=targets, columns=targets)
+            counts[CO_CONTACT_KEY] = frame.loc[sorted_targets, sorted_targets]
 
-        # Evaluate each boolean combination
-        for combo_name, expected_contacts in combos:
-            if len(expected_contacts) == 0:
-                # No_contact: all organelles must be False (not in contact)
-                mask = ~contact_df.any(axis=1)
-            else:
-                # Specific combination: exactly these organelles in contact
-                # Step 1: All expected organelles must be in contact
-                in_contact = contact_df[list(expected_contacts)].all(axis=1)
+        return counts
 
-                # Step 2: All other organelles must NOT be in contact
-                others = [o for o in targets if o not in expected_contacts]
-                if others:
-                    not_in_contact = ~contact_df[others].any(axis=1)
-                    mask = in_contact & not_in_contact
-                else:
-                    # All targets are in the expected set
-                    mask = in_contact
+    def _observed_counts(self, targets: List[str], histogram: np.ndarray) -> Dict[str, int]:
+        """Counts of the patterns present in a histogram, in generate_boolean_combinations() order."""
+        observed = []
+        for code in np.flatnonzero(histogram):
+            combo = tuple(sorted(org for i, org in enumerate(targets) if code >> i & 1))
+            observed.append((len(combo) == 0, len(combo), combo, int(histogram[code])))
+        observed.sort()
+        return {self.combination_name(combo): count for _, _, combo, count in observed}
 
-            counts[combo_name] = int(mask.sum())
+    @staticmethod
+    def superset_sums(histogram: np.ndarray) -> np.ndarray:
+        """
+        Superset-sum (zeta) transform of a contact code histogram.
 
+        Entry c of the result counts the points in contact with at least the
+        targets in code c. Runs in O(n * 2^n) for n targets.
+        """
+        at_least = np.array(histogram, dtype=np.int64)
+        n_targets = len(at_least).bit_length() - 1
+        if len(at_least) != 1 << n_targets:
+            raise ValueError(f"Histogram length must be a power of 2, got {len(at_least)}")
+
+        for i in range(n_targets):
+            # Axis 1 is bit i: add each code with bit i set to the code without it
+            view = at_least.reshape(-1, 2, 1 << i)
+            view[:, 0, :] += view[:, 1, :]
+        return at_least
+
+    def _inclusive_from_histogram(self, targets: List[str], histogram: np.ndarray) -> Dict[str, int]:
+        """Counts of points in contact with at least each target combination."""
+        at_least = self.superset_sums(histogram)
+        bits = {org: 1 << i for i, org in enumerate(targets)}
+
+        # Sorted like generate_boolean_combinations() for consistent naming
+        sorted_targets = sorted(targets)
+        counts = {'Surface_count': int(at_least[0])}
+        for r in range(1, len(sorted_targets) + 1):
+            for combo in itertools.combinations(sorted_targets, r):
+                # Single targets are the per-target totals
+                counts["+".join(combo)] = int(at_least[sum(bits[org] for org in combo)])
         return counts
 
     def analyze_cell_for_bait(self, cell_id: str, bait_organelle: str) -> Dict[str, int]:
@@ -221,45 +395,186 @@ class NWayInteractionAnalyzer:
             {'Surface_count': N, 'ER_only': 150, 'ER+LD': 45, ..., 'No_contact': 892}
         """
         # Get distance files for the bait organelle
-        distance_files = self.data_loader.get_distance_files(cell_id, bait_organelle)
+        distance_files = self._select_targets(self.data_loader.get_distance_files(cell_id, bait_organelle))
 
         if not distance_files:
             logger.warning(f"No distance files found for {cell_id}/{bait_organelle}")
             return None
 
-        # Load distance data for each target organelle
-        distance_data = {}
-        reference_length = None
+        if self.streaming:
+            streamed = self._stream_histogram(cell_id, bait_organelle, distance_files)
+            if streamed is not None:
+                return self._counts_from_histogram(*streamed)
 
-        for file_path, target_org in distance_files:
-            try:
-                distances = self.data_loader.load_distance_file(file_path)
-
-                # Validate consistent length
-                if reference_length is None:
-                    reference_length = len(distances)
-                elif len(distances) != reference_length:
-                    logger.warning(
-                        f"Length mismatch in {cell_id}/{bait_organelle}: "
-                        f"{target_org} has {len(distances)} vs expected {reference_length}"
-                    )
-                    # Skip this target to maintain data integrity
-                    continue
-
-                distance_data[target_org] = distances
-
-            except Exception as e:
-                logger.error(f"Failed to load {file_path.name}: {str(e)}")
+        return self._count_contacts(
+            cell_id, bait_organelle, self._load_distance_data(cell_id, bait_organelle, distance_files)
+        )
+
+    def _load_distance_data(self, cell_id: str, bait_organelle: str,
+                            distance_files: List[Tuple[Path, str]]) -> Dict[str, pd.Series]:
+        """
+        Distances of each target, aligned on surface object ID (on row
+        position for files without IDs, see DataLoader.object_table).
+
+        Unreadable files are skipped. Surfaces without a distance to a
+        target (missing from its file) count as not in contact with it.
+        """
+        distance_data = self.data_loader.load_object_distances(
+            cell_id, bait_organelle, [target_org for _, target_org in distance_files]
+        )
+        for target_org, distances in distance_data.items():
+            n_missing = int(distances.isna().sum())
+            if n_missing:
+                logger.warning(
+                    f"{n_missing} of {len(distances)} {bait_organelle} surfaces in {cell_id} have no "
+                    f"distance to {target_org}; counted as not in contact"
+                )
+        return distance_data
+
+    def contact_matrix(self, cell_id: str, bait_organelle: str,
+                       thresholds: Optional[List] = None) -> Optional[ContactMatrix]:
+        """
+        Per-surface-point contact flags of one cell for downstream analyses.
+
+        Parameters:
+        -----------
+        cell_id : str
+            Cell identifier
+        bait_organelle : str
+            Bait organelle name
+        thresholds : List[float or Dict[str, float]], optional
+            Contact thresholds to evaluate (default: the analysis thresholds,
+            see thresholds_for())
+
+        Returns:
+        --------
+        ContactMatrix or None : Packed flags (1 bit per point, target and threshold),
+            None if the cell has no usable distance files
+        """
+        distance_files = self._select_targets(self.data_loader.get_distance_files(cell_id, bait_organelle))
+        if not distance_files:
+            logger.warning(f"No distance files found for {cell_id}/{bait_organelle}")
+            return None
+
+        distance_data = self._load_distance_data(cell_id, bait_organelle, distance_files)
+        if not distance_data:
+            logger.warning(f"No valid distance data for {cell_id}/{bait_organelle}")
+            return None
+        if not thresholds:
+            thresholds = [self.thresholds_for(bait_organelle, list(distance_data))]
+        return ContactMatrix.from_distances(distance_data, thresholds)
+
+    def export_contact_matrices(self, bait_organelle: str, output_dir: str,
+                                thresholds: Optional[List] = None) -> List[str]:
+        """
+        Save the contact matrix of every cell with a bait organelle as .npz.
+
+        Files are named <cell>_<bait>_contacts.npz and can be read back with
+        ContactMatrix.load().
+
+        Returns:
+        --------
+        List[str] : Paths of created files
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        created_files = []
+        for cell_id in self.data_loader.get_cells_by_organelle(bait_organelle):
+            matrix = self.contact_matrix(cell_id, bait_organelle, thresholds)
+            if matrix is None:
                 continue
+            file_path = matrix.save(output_path / f"{cell_id}_{bait_organelle}_contacts.npz")
+            created_files.append(str(file_path))
+
+        logger.info(f"Saved {len(created_files)} contact matrices for {bait_organelle} to {output_path}")
+        return created_files
+
+    def _stream_histogram(self, cell_id: str, bait_organelle: str,
+                          distance_files: List[Tuple[Path, str]]) -> Optional[Tuple]:
+        """
+        Contact code histogram from all target files read in lock-step chunks.
+
+        Returns (targets, histogram, co-contact matrix or None).
+
+        Rows are paired by position only while every chunk holds the same
+        object IDs in all files (or no file has IDs). Returns None if the
+        files cannot be streamed as aligned columns (read errors, NaN or
+        infinite values, different lengths or object IDs). The caller then
+        uses the in-memory path, which joins the files on object ID.
+        """
+        targets = [target_org for _, target_org in distance_files]
+        thresholds = self.thresholds_for(bait_organelle, targets)
+        readers = [self.data_loader.iter_object_values(file_path, self.chunk_rows)
+                   for file_path, _ in distance_files]
+        histogram = np.zeros(1 << len(targets), dtype=np.int64)
+        co_contacts = np.zeros((len(targets), len(targets)), dtype=np.int64) if self.co_contacts else None
+        max_abs = np.zeros(len(targets))
+
+        try:
+            while True:
+                chunks = [next(reader, None) for reader in readers]
+                if all(chunk is None for chunk in chunks):
+                    break
+                if any(chunk is None or len(chunk[1]) != len(chunks[0][1]) for chunk in chunks):
+                    return self._stream_fallback(cell_id, bait_organelle, "files differ in length")
+                if not self._same_object_ids([object_ids for object_ids, _ in chunks]):
+                    return self._stream_fallback(cell_id, bait_organelle, "files differ in object IDs")
+
+                chunks = [values for _, values in chunks]
+                for i, chunk in enumerate(chunks):
+                    if chunk.dtype.kind not in 'fi' or not np.isfinite(chunk).all():
+                        return self._stream_fallback(cell_id, bait_organelle, "non-finite values")
+                    max_abs[i] = max(max_abs[i], float(np.abs(chunk).max()))
+
+                chunk_matrix = ContactMatrix.from_distances(dict(zip(targets, chunks)), (thresholds,))
+                histogram += chunk_matrix.code_histogram()
+                if co_contacts is not None:
+                    co_contacts += chunk_matrix.co_contacts()
+        except Exception as e:
+            return self._stream_fallback(cell_id, bait_organelle, str(e))
+        finally:
+            for reader in readers:
+                reader.close()
+
+        if histogram.sum() == 0:
+            return self._stream_fallback(cell_id, bait_organelle, "no values")
+
+        for (file_path, _), value in zip(distance_files, max_abs):
+            if value > 100000:
+                warnings.warn(
+                    f"Unusually large distance values (>100 µm) found in {file_path.name}. "
+                    f"Max value: {value:.2f} nm. Please verify data quality.",
+                    UserWarning
+                )
+
+        return targets, histogram, co_contacts
+
+    @staticmethod
+    def _same_object_ids(chunk_ids: List[Optional[np.ndarray]]) -> bool:
+        """True if all files lack IDs, or all hold the same complete IDs."""
+        if all(object_ids is None for object_ids in chunk_ids):
+            return True
+        if any(object_ids is None for object_ids in chunk_ids):
+            return False
+        first = chunk_ids[0]
+        return bool(np.isfinite(first).all()) and all(np.array_equal(first, object_ids) for object_ids in chunk_ids[1:])
 
+    @staticmethod
+    def _stream_fallback(cell_id: str, bait_organelle: str, reason: str) -> None:
+        logger.debug(f"Streaming not possible for {cell_id}/{bait_organelle} ({reason}), loading files")
+        return None
+
+    def _count_contacts(self, cell_id: str, bait_organelle: str,
+                        distance_data: Dict[str, pd.Series]) -> Optional[Dict[str, int]]:
+        # Rows are aligned by the loader's object table (files that cannot
+        # be aligned leave the cell without distance data)
         if not distance_data:
             logger.warning(f"No valid distance data for {cell_id}/{bait_organelle}")
             return None
 
         # Evaluate boolean contact patterns
-        counts = self._evaluate_contacts(distance_data)
-
-        return counts
+        return self._evaluate_contacts(distance_data, bait_organelle)
 
     def analyze_bait(self, bait_organelle: str) -> pd.DataFrame:
         """
@@ -287,16 +602,45 @@ class NWayInteractionAnalyzer:
         logger.info(f"Found {total_cells} cells with {bait_organelle}")
 
         # Analyze each cell
-        results_list = []
-        for idx, cell_id in enumerate(cells_with_bait, 1):
-            logger.info(f"[{idx}/{total_cells}] Processing cell: {cell_id}")
+        if self.worker_pool is not None:
+            cell_results = self.worker_pool.map_method(
+                self, 'analyze_cell_for_bait',
+                [(cell_id, bait_organelle) for cell_id in cells_with_bait]
+            )
+        else:
+            cell_results = (
+                self.analyze_cell_for_bait(cell_id, bait_organelle)
+                for cell_id in cells_with_bait
+            )
 
-            cell_counts = self.analyze_cell_for_bait(cell_id, bait_organelle)
+        counts_by_cell = {}
+        for idx, (cell_id, cell_counts) in enumerate(zip(cells_with_bait, cell_results), 1):
+            logger.info(f"[{idx}/{total_cells}] Processed cell: {cell_id}")
+            counts_by_cell[cell_id] = cell_counts
 
+        return self._assemble_bait(bait_organelle, counts_by_cell)
+
+    def _assemble_bait(self, bait_organelle: str, counts_by_cell: Dict[str, Optional[Dict]]) -> pd.DataFrame:
+        """
+        Build the result tables of one bait from per-cell counts.
+
+        Stores inclusive and co-contact tables as a side effect and returns
+        the main results table (None if no cell had valid data).
+        """
+        results_list = []
+        inclusive_list = []
+        co_contact_frames = {}
+        for cell_id, cell_counts in counts_by_cell.items():
             if cell_counts is not None:
                 # Add cell ID as first column
                 row = {'Cell_ID': cell_id}
                 row.update(cell_counts)
+                inclusive = row.pop(INCLUSIVE_KEY, None)
+                if inclusive is not None:
+                    inclusive_list.append({'Cell_ID': cell_id, **inclusive})
+                co_contact_frame = row.pop(CO_CONTACT_KEY, None)
+                if co_contact_frame is not None:
+                    co_contact_frames[cell_id] = co_contact_frame
                 results_list.append(row)
 
         if not results_list:
@@ -304,17 +648,76 @@ class NWayInteractionAnalyzer:
             return None
 
         # Create DataFrame
-        df = pd.DataFrame(results_list)
+        if self.sparse_output:
+            df = self._sort_by_cell(self._long_format(results_list))
+        else:
+            df = self._sort_by_cell(pd.DataFrame(results_list))
+        if inclusive_list:
+            self.inclusive_results[bait_organelle] = self._sort_by_cell(pd.DataFrame(inclusive_list))
+        if co_contact_frames:
+            self.co_contact_results[bait_organelle], self.co_contact_means[bait_organelle] = \
+                self._co_contact_tables(co_contact_frames)
+
+        if self.sparse_output:
+            logger.info(f"Completed {bait_organelle}: {df['Cell_ID'].nunique()} cells, {len(df)} pattern rows")
+        else:
+            logger.info(f"Completed {bait_organelle}: {len(df)} cells, {len(df.columns)-1} columns")
+
+        return df
+
+    @staticmethod
+    def _long_format(rows: List[Dict]) -> pd.DataFrame:
+        """One row per (cell, observed pattern) from per-cell count dictionaries."""
+        records = [
+            (row['Cell_ID'], row['Surface_count'], pattern, count)
+            for row in rows
+            for pattern, count in row.items()
+            if pattern not in ('Cell_ID', 'Surface_count')
+        ]
+        return pd.DataFrame(records, columns=['Cell_ID', 'Surface_count', 'Pattern', 'Count'])
+
+    def _sort_by_cell(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Natural cell ID order (precomputed ranks)
+        ranks = self.data_loader.catalog.natural_ranks()
+        df = df.sort_values('Cell_ID', key=lambda ids: ids.map(ranks), kind='stable')
+        return df.reset_index(drop=True)
+
+    def _co_contact_tables(self, frames: Dict[str, pd.DataFrame]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Stack per-cell co-contact matrices and average them per condition.
 
-        # Sort by cell ID (natural sorting)
-        sorted_ids = sort_cell_ids(df['Cell_ID'].tolist())
-        df['_sort_key'] = df['Cell_ID'].apply(lambda x: sorted_ids.index(x))
-        df = df.sort_values('_sort_key').drop('_sort_key', axis=1)
-        df = df.reset_index(drop=True)
+        Every cell gets one row per target of the bait (union over cells);
+        targets missing in a cell are NaN and skipped by the mean.
+        """
+        cells = self.data_loader.catalog.sort_cells(list(frames))
+        targets = sorted(set().union(*(frame.columns for frame in frames.values())))
 
-        logger.info(f"Completed {bait_organelle}: {len(df)} cells, {len(df.columns)-1} columns")
+        per_cell = pd.concat(
+            [frames[cell_id].reindex(index=targets, columns=targets) for cell_id in cells],
+            keys=cells, names=['Cell_ID', 'Target']
+        ).reset_index()
 
-        return df
+        conditions = per_cell['Cell_ID'].map(cell_condition).rename('Condition')
+        means = per_cell[targets].groupby([conditions, per_cell['Target']], sort=False).mean()
+        return per_cell, means.reset_index()
+
+    def co_contact_array(self, bait: str) -> Tuple[List[str], List[str], np.ndarray]:
+        """
+        Co-contact matrices of a bait as one array.
+
+        Returns:
+        --------
+        Tuple[List[str], List[str], np.ndarray] : (cell IDs, targets, array of
+            shape (cells, targets, targets)); NaN where a cell lacks a target
+        """
+        if bait not in self.co_contact_results:
+            raise ValueError(f"No co-contact results for bait '{bait}'. Run with co_contacts=True.")
+
+        per_cell = self.co_contact_results[bait]
+        targets = [c for c in per_cell.columns if c not in ('Cell_ID', 'Target')]
+        cells = list(dict.fromkeys(per_cell['Cell_ID']))
+        values = per_cell[targets].to_numpy(dtype=np.float64).reshape(len(cells), len(targets), len(targets))
+        return cells, targets, values
 
     def analyze_all_baits(self):
         """
@@ -322,6 +725,9 @@ class NWayInteractionAnalyzer:
 
         If bait_organelles is set, analyzes only those.
         Otherwise, analyzes all organelles (batch mode).
+
+        With a worker_pool and several baits, all (cell, bait) pairs are
+        scheduled together, largest first (see _analyze_baits_scheduled).
         """
         logger.info("Starting N-Way Interaction Analysis")
 
@@ -335,6 +741,11 @@ class NWayInteractionAnalyzer:
         total_baits = len(baits_to_analyze)
         logger.info(f"Analyzing {total_baits} bait organelle(s): {', '.join(baits_to_analyze)}")
 
+        if self.worker_pool is not None and total_baits > 1:
+            self._analyze_baits_scheduled(baits_to_analyze)
+            logger.info(f"\nAnalysis complete. Generated results for {len(self.results)} baits.")
+            return
+
         # Analyze each bait
         for idx, bait in enumerate(baits_to_analyze, 1):
             logger.info(f"Bait {idx}/{total_baits}: {bait}")
@@ -346,11 +757,58 @@ class NWayInteractionAnalyzer:
 
         logger.info(f"\nAnalysis complete. Generated results for {len(self.results)} baits.")
 
+    def _schedule_work_items(self, baits: List[str]) -> List[Tuple[str, str]]:
+        """
+        (cell, bait) work items of all baits, largest first.
+
+        The cost of an item is estimated from the size of its distance
+        files (DataLoader.distance_bytes), so the slowest cells start first
+        and the pool is not left waiting for a large cell at the end.
+        """
+        items = [
+            (cell_id, bait)
+            for bait in baits
+            for cell_id in self.data_loader.get_cells_by_organelle(bait)
+        ]
+        costs = {item: self.data_loader.distance_bytes(*item) for item in items}
+        # Stable: equal costs keep bait and natural cell order
+        return sorted(items, key=costs.get, reverse=True)
+
+    def _analyze_baits_scheduled(self, baits: List[str]):
+        """
+        Analyze several baits as one flat list of (cell, bait) items on the worker pool.
+
+        Instead of one bait after another, all items are submitted at once
+        (largest first), so the pool stays busy across bait boundaries.
+        Per-bait tables are reassembled afterwards in natural cell order.
+        """
+        items = self._schedule_work_items(baits)
+        cells_by_bait = {bait: self.data_loader.get_cells_by_organelle(bait) for bait in baits}
+        logger.info(f"Scheduling {len(items)} cell/bait items on {self.worker_pool.max_workers} worker(s)")
+
+        item_results = self.worker_pool.map_method(self, 'analyze_cell_for_bait', items)
+
+        counts = {}
+        for idx, (item, cell_counts) in enumerate(zip(items, item_results), 1):
+            logger.info(f"[{idx}/{len(items)}] Processed {item[1]} in cell: {item[0]}")
+            counts[item] = cell_counts
+
+        for bait, cells in cells_by_bait.items():
+            if not cells:
+                logger.warning(f"No cells found with bait organelle: {bait}")
+                continue
+            result_df = self._assemble_bait(bait, {cell_id: counts[(cell_id, bait)] for cell_id in cells})
+            if result_df is not None:
+                self.results[bait] = result_df
+
     def _generate_metadata(self, bait: str) -> Dict[str, str]:
         if bait in self.results:
             df = self.results[bait]
-            combo_cols = [c for c in df.columns if c not in ['Cell_ID', 'Surface_count']]
-            num_combos = len(combo_cols)
+            if self.sparse_output:
+                num_combos = df['Pattern'].nunique()
+            else:
+                combo_cols = [c for c in df.columns if c not in ['Cell_ID', 'Surface_count']]
+                num_combos = len(combo_cols)
         else:
             num_combos = 'N/A'
 
@@ -359,11 +817,27 @@ class NWayInteractionAnalyzer:
             analysis_type='N-Way Interaction Analysis',
             Bait_Organelle=bait,
             Contact_Threshold=str(self.threshold),
+            Target_Thresholds=self._threshold_summary(bait),
             Total_Combinations=str(num_combos),
-            Total_Cells_Analyzed=str(len(self.results.get(bait, []))),
+            Inclusive_Counts='Yes' if bait in self.inclusive_results else 'No',
+            Co_Contacts='Yes' if bait in self.co_contact_results else 'No',
+            Total_Cells_Analyzed=str(self.results[bait]['Cell_ID'].nunique() if bait in self.results else 0),
+            Target_Organelles=', '.join(self.target_organelles) if self.target_organelles else 'All',
+            Output_Layout='Long (observed patterns)' if self.sparse_output else 'Wide',
             All_Organelles=', '.join(self.data_loader.all_organelles),
         )
 
+    def _threshold_summary(self, bait: str) -> str:
+        """Thresholds differing from Contact_Threshold for a bait, e.g. 'ER=0.1; LD=0.05'."""
+        targets = self.target_organelles or [org for org in self.data_loader.all_organelles if org != bait]
+        overrides = {
+            target: value for target, value in self.thresholds_for(bait, targets).items()
+            if value != self.threshold
+        }
+        if not overrides:
+            return 'Same for all targets'
+        return '; '.join(f"{target}={value}" for target, value in overrides.items())
+
     def export_to_excel(self, output_dir: str) -> List[str]:
         """
         Export results to Excel files (one per bait).
@@ -399,6 +873,15 @@ class NWayInteractionAnalyzer:
                 # Sheet 1: Results
                 df.to_excel(writer, sheet_name='Results', index=False)
 
+                # Optional sheet: at-least counts
+                if bait in self.inclusive_results:
+                    self.inclusive_results[bait].to_excel(writer, sheet_name='Inclusive', index=False)
+
+                # Optional sheets: co-contact matrices per cell and per condition
+                if bait in self.co_contact_results:
+                    self.co_contact_results[bait].to_excel(writer, sheet_name='Co_Contacts', index=False)
+                    self.co_contact_means[bait].to_excel(writer, sheet_name='Co_Contacts_Mean', index=False)
+
                 # Sheet 2: Metadata
                 metadata_df = pd.DataFrame(
                     list(metadata.items()),
@@ -442,6 +925,20 @@ class NWayInteractionAnalyzer:
             created_files.append(str(results_path))
             logger.info(f"Saved: {results_filename}")
 
+            if bait in self.inclusive_results:
+                inclusive_filename = f"nway_analysis_bait-{bait}_{timestamp}_inclusive.csv"
+                self.inclusive_results[bait].to_csv(output_dir / inclusive_filename, index=False)
+                created_files.append(str(output_dir / inclusive_filename))
+                logger.info(f"Saved: {inclusive_filename}")
+
+            if bait in self.co_contact_results:
+                for suffix, table in (('cocontacts', self.co_contact_results[bait]),
+                                      ('cocontacts_mean', self.co_contact_means[bait])):
+                    table_filename = f"nway_analysis_bait-{bait}_{timestamp}_{suffix}.csv"
+                    table.to_csv(output_dir / table_filename, index=False)
+                    created_files.append(str(output_dir / table_filename))
+                    logger.info(f"Saved: {table_filename}")
+
             # Metadata file
             metadata = self._generate_metadata(bait)
             metadata_filename = f"nway_analysis_bait-{bait}_{timestamp}_metadata.csv"
@@ -505,9 +1002,26 @@ class NWayInteractionAnalyzer:
         summary = []
         summary.append("N-Way Interaction Analysis Summary")
         summary.append(f"Threshold: <= {self.threshold}")
+        if self.target_thresholds:
+            overrides = ', '.join(
+                f"{'/'.join(key) if isinstance(key, tuple) else key} <= {value}"
+                for key, value in self.target_thresholds.items()
+            )
+            summary.append(f"Per-target thresholds: {overrides}")
         summary.append(f"Total baits analyzed: {len(self.results)}")
 
         for bait, df in self.results.items():
+            if self.sparse_output:
+                summary.append(f"\nBait: {bait}")
+                summary.append(f"  Cells: {df['Cell_ID'].nunique()}")
+                summary.append(f"  Observed patterns: {df['Pattern'].nunique()}")
+                total = df.drop_duplicates('Cell_ID')['Surface_count'].sum()
+                summary.append(f"  Total surfaces: {total}")
+                no_contact_total = df.loc[df['Pattern'] == 'No_contact', 'Count'].sum()
+                if total > 0:
+                    summary.append(f"  No contact: {no_contact_total / total * 100:.1f}%")
+                continue
+
             summary.append(f"\nBait: {bait}")
             summary.append(f"  Cells: {len(df)}")
             summary.append(f"  Columns: {len(df.columns)}")
@@ -526,3 +1040,49 @@ class NWayInteractionAnalyzer:
                     summary.append(f"  No contact: {pct:.1f}%")
 
         return "\n".join(summary)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    def target_threshold(entry: str) -> Tuple[Union[str, Tuple[str, str]], float]:
+        """Parse [BAIT:]TARGET=VALUE into (target or (bait, target), threshold)."""
+        key, _, value = entry.partition('=')
+        if not key or not value:
+            raise argparse.ArgumentTypeError(f"expected [BAIT:]TARGET=VALUE, got {entry!r}")
+        try:
+            threshold = float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"threshold in {entry!r} is not a number")
+        return (tuple(key.split(':', 1)) if ':' in key else key), threshold
+
+    parser = argparse.ArgumentParser(description="N-Way organelle contact pattern analysis")
+    parser.add_argument('input_dir', help="Imaris export directory (or dataset store/archive/.ims)")
+    parser.add_argument('output_dir', help="Directory for output files")
+    parser.add_argument('--bait', nargs='+', default=None,
+                        help="Bait organelle(s) (default: all organelles)")
+    parser.add_argument('--targets', nargs='+', default=None,
+                        help="Target organelles to include in patterns (default: all others)")
+    parser.add_argument('--threshold', type=float, default=0.0,
+                        help="Contact distance threshold (default: 0.0)")
+    parser.add_argument('--target-threshold', action='append', default=[], type=target_threshold,
+                        metavar='[BAIT:]TARGET=VALUE',
+                        help="Threshold for one target (or bait/target pair); repeatable")
+    parser.add_argument('--long', action='store_true',
+                        help="Long format listing only observed patterns")
+    parser.add_argument('--inclusive', action='store_true', help="Also export 'at least' counts")
+    parser.add_argument('--co-contacts', action='store_true', help="Also export co-contact matrices")
+    parser.add_argument('--format', choices=['excel', 'csv'], default='excel',
+                        help="Output format (default: excel)")
+    args = parser.parse_args()
+
+    target_thresholds = dict(args.target_threshold)
+
+    analyzer = NWayInteractionAnalyzer(args.input_dir, threshold=args.threshold,
+                                       inclusive_counts=args.inclusive, co_contacts=args.co_contacts,
+                                       sparse_output=args.long, target_thresholds=target_thresholds)
+    analyzer.load_data()
+    if args.bait:
+        analyzer.set_bait_organelles(args.bait)
+    analyzer.set_target_organelles(args.targets)
+    analyzer.run(args.output_dir, file_format=args.format)
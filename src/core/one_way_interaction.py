@@ -2,7 +2,11 @@
 One-Way Interaction Analysis Module
 
 This module analyzes one-way organelle interactions from Imaris-generated
-segmentation data. It calculates mean distances between organelles for each cell.
+segmentation data. It calculates mean distances between organelles for each cell
+and pairs each interaction with its reverse direction (A-to-B with B-to-A).
+Optionally, distance percentiles are estimated per cell and pooled per
+condition from mergeable quantile sketches, and fixed-bin distance
+histograms are counted per cell, both in the same pass over the values.
 
 Author: Philipp Kaintoch
 Date: 2025-11-18
@@ -11,14 +15,31 @@ Date: 2025-11-18
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List
-from .data_loader import DataLoader
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from .data_loader import DataLoader, open_dataset
+from .worker_pool import WorkerPool
+from .streaming import DEFAULT_CHUNK_ROWS, DEFAULT_SKETCH_ACCURACY, FixedBinHistogram, QuantileSketch
 from ..utils.logging_config import get_logger
-from ..utils.sorting import sort_cell_ids
+from ..utils.sorting import cell_condition, sort_cell_ids
 from ..utils.metadata import generate_base_metadata
 
 logger = get_logger(__name__)
 
+# Distance percentiles exported when enabled in the GUI
+DEFAULT_PERCENTILES = (10, 50, 90)
+# Distance histogram range and bin width (um) used by the GUI
+DEFAULT_HISTOGRAM_RANGE = (-1.0, 5.0)
+DEFAULT_HISTOGRAM_WIDTH = 0.1
+# Data rows per Excel sheet (1,048,576 minus the header)
+EXCEL_MAX_ROWS = 1_048_575
+# Columns of the reciprocal pairs table (Reciprocal_Pairs sheet)
+RECIPROCAL_COLUMNS = [
+    'Organelle_A', 'Organelle_B', 'Cell_ID',
+    'Mean_A_to_B', 'Mean_B_to_A', 'Mean_Difference', 'Mean_Ratio',
+    'Contacts_A_to_B', 'Points_A_to_B', 'Contact_Fraction_A_to_B',
+    'Contacts_B_to_A', 'Points_B_to_A', 'Contact_Fraction_B_to_A',
+]
+
 
 class OneWayInteractionAnalyzer:
     """
@@ -28,7 +49,12 @@ class OneWayInteractionAnalyzer:
     generates summary statistics per cell.
     """
 
-    def __init__(self, input_dir: str):
+    def __init__(self, input_dir: str, data_loader: Optional[DataLoader] = None,
+                 worker_pool: Optional[WorkerPool] = None,
+                 streaming: bool = False, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 percentiles: Sequence[float] = (), sketch_accuracy: float = DEFAULT_SKETCH_ACCURACY,
+                 histogram_range: Optional[Tuple[float, float]] = None,
+                 histogram_width: float = DEFAULT_HISTOGRAM_WIDTH):
         """
         Initialize the analyzer.
 
@@ -36,15 +62,61 @@ class OneWayInteractionAnalyzer:
         -----------
         input_dir : str
             Path to the directory containing the data
+        data_loader : DataLoader, optional
+            Already scanned loader for input_dir (e.g., from the GUI pre-scan).
+            Discovery is skipped in load_data() if it has been run.
+        worker_pool : WorkerPool, optional
+            If given, cells are analyzed in parallel worker processes
+        streaming : bool
+            Read distance files in chunks of chunk_rows values and keep only
+            running sums, so memory stays bounded for very large files.
+        chunk_rows : int
+            Values per chunk in streaming mode
+        percentiles : Sequence[float]
+            Distance percentiles (0-100) to export per cell and pooled per
+            condition, e.g. DEFAULT_PERCENTILES. Estimated from a
+            QuantileSketch per interaction and cell (constant memory, also
+            in streaming mode). Empty: no sketches are built.
+        sketch_accuracy : float
+            Relative accuracy of the percentile estimates
+        histogram_range : Tuple[float, float], optional
+            (start, stop) of a fixed-bin distance histogram per interaction
+            and cell, e.g. DEFAULT_HISTOGRAM_RANGE; values outside go to
+            open-ended under/overflow bins. None: no histograms.
+        histogram_width : float
+            Histogram bin width
         """
         self.input_dir = input_dir
-        self.data_loader = DataLoader(input_dir)
+        self.data_loader = data_loader if data_loader is not None else open_dataset(input_dir)
+        self.worker_pool = worker_pool
+        self.streaming = streaming
+        self.chunk_rows = chunk_rows
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError(f"Percentiles must be between 0 and 100, got {list(percentiles)}")
+        self.percentiles = list(percentiles)
+        self.sketch_accuracy = sketch_accuracy
+        if histogram_range is not None:
+            # Fail early on invalid bins
+            FixedBinHistogram(*histogram_range, histogram_width)
+        self.histogram_range = histogram_range
+        self.histogram_width = histogram_width
         self.results = {}
         self.mean_distance_df = None
         self.count_df = None
         self.missing_data_df = None  # Track data completeness
+        self.reciprocal_df = None  # A-to-B and B-to-A side by side, one row per (pair, cell)
+        self.quantile_df = None  # Percentiles per (interaction, cell)
+        self.condition_quantile_df = None  # Percentiles per (interaction, condition)
+        self.histogram_df = None  # Long format: one row per (interaction, cell, bin)
         self.metadata = {}  # Store provenance information
 
+    def __getstate__(self):
+        # Sent to worker processes: only the loader and settings are needed
+        state = self.__dict__.copy()
+        state['worker_pool'] = None
+        state['results'] = {}
+        return state
+
     def _generate_metadata(self) -> Dict[str, str]:
         metadata = generate_base_metadata(
             input_dir=self.input_dir,
@@ -53,6 +125,12 @@ class OneWayInteractionAnalyzer:
             Total_Organelles=str(len(self.data_loader.all_organelles)) if hasattr(self.data_loader, 'all_organelles') else 'N/A',
             Organelles_List=', '.join(self.data_loader.all_organelles) if hasattr(self.data_loader, 'all_organelles') else 'N/A',
             Total_Interactions=str(len(self.mean_distance_df)) if self.mean_distance_df is not None else 'N/A',
+            Percentiles=', '.join(f"{p:g}" for p in self.percentiles) if self.percentiles else 'None',
+            Percentile_Relative_Accuracy=str(self.sketch_accuracy) if self.percentiles else 'N/A',
+            Histogram_Bins=(
+                f"{self.histogram_range[0]:g} to {self.histogram_range[1]:g} by {self.histogram_width:g}"
+                if self.histogram_range is not None else 'None'
+            ),
         )
         self.metadata = metadata
         return metadata
@@ -64,8 +142,9 @@ class OneWayInteractionAnalyzer:
         This method must be called before running analysis.
         """
         logger.info("Loading data...")
-        self.data_loader.detect_structure()
-        self.data_loader.find_cell_folders()
+        if not self.data_loader._is_validated:
+            self.data_loader.detect_structure()
+            self.data_loader.find_cell_folders()
         # Get summary uses logger internally, so just call it
         summary = self.data_loader.get_summary()
         for line in summary.split('\n'):
@@ -85,58 +164,47 @@ class OneWayInteractionAnalyzer:
         --------
         dict : Dictionary of interactions
             {
-                'ER-to-LD': {'mean': 5.87, 'count': 2260},
-                'ER-to-Ly': {'mean': 0.27, 'count': 2260},
+                'ER-to-LD': {'mean': 5.87, 'count': 12, 'points': 2260},
+                'ER-to-Ly': {'mean': 0.27, 'count': 540, 'points': 2260},
                 ...
             }
+            With percentiles, each entry also holds a 'sketch' (QuantileSketch),
+            with a histogram range a 'histogram' (FixedBinHistogram).
         """
         interactions = {}
 
-        # Get all organelles for this cell
-        cell_folders = [
-            f for f in self.data_loader.cell_folders
-            if f['cell_id'] == cell_id
-        ]
-
-        # Process each source organelle
-        for folder_info in cell_folders:
-            source_org = folder_info['organelle']
-
+        # Process each source organelle present for this cell
+        for source_org in self.data_loader.catalog.organelles_of(cell_id):
             # Get distance files for this source organelle
             distance_files = self.data_loader.get_distance_files(cell_id, source_org)
+            if not self.streaming:
+                # Parsed once per (cell, organelle) via the loader's object table;
+                # each interaction is summarized on its own, so no alignment is needed
+                object_distances = self.data_loader.load_object_distances(cell_id, source_org, aligned=False)
 
             for file_path, target_org in distance_files:
                 # Create interaction name
                 interaction_name = f"{source_org}-to-{target_org}"
 
                 try:
-                    # Load distance data
-                    distances = self.data_loader.load_distance_file(file_path)
-
-                    # Calculate statistics
-                    mean_distance = distances.mean()
-                    count = (distances <= 0).sum()  
-
-                    # CRITICAL VALIDATION: Verify calculated mean is valid
-                    if pd.isna(mean_distance):
-                        raise ValueError(
-                            f"Calculated mean is NaN for {interaction_name} in cell {cell_id}. "
-                            f"This indicates a calculation error."
+                    if self.streaming:
+                        accumulators = self._new_accumulators()
+                        stats = self.data_loader.summarize_distance_file(
+                            file_path, self.chunk_rows, list(accumulators.values())
                         )
-
-                    if np.isinf(mean_distance):
-                        raise ValueError(
-                            f"Calculated mean is infinite for {interaction_name} in cell {cell_id}. "
-                            f"This indicates a calculation error."
+                        summary = self._validated_summary(
+                            cell_id, interaction_name, stats.mean, stats.contacts, stats.count
+                        )
+                        summary.update(accumulators)
+                        interactions[interaction_name] = summary
+                    else:
+                        if target_org not in object_distances:
+                            # Load or validation error, already logged
+                            continue
+                        distances = object_distances[target_org].dropna()
+                        interactions[interaction_name] = self._with_distribution(
+                            self._summarize_distances(cell_id, interaction_name, distances), distances
                         )
-
-                    # Store results
-                    interactions[interaction_name] = {
-                        'mean': mean_distance,
-                        'count': count
-                    }
-
-                    logger.debug(f"  {interaction_name}: mean={mean_distance:.3f}, count={count}")
 
                 except Exception as e:
                     logger.error(f"Failed to process {interaction_name}: {str(e)}")
@@ -144,6 +212,59 @@ class OneWayInteractionAnalyzer:
 
         return interactions
 
+    def _new_accumulators(self) -> Dict:
+        """Empty distribution accumulators of one interaction (summary key -> accumulator)."""
+        accumulators = {}
+        if self.percentiles:
+            accumulators['sketch'] = QuantileSketch(self.sketch_accuracy)
+        if self.histogram_range is not None:
+            accumulators['histogram'] = FixedBinHistogram(*self.histogram_range, self.histogram_width)
+        return accumulators
+
+    def _with_distribution(self, summary: Dict, distances: pd.Series) -> Dict:
+        """Add the enabled distribution accumulators of the distances to a summary."""
+        accumulators = self._new_accumulators()
+        if accumulators:
+            values = distances.to_numpy()
+            for key, accumulator in accumulators.items():
+                summary[key] = accumulator.update(values)
+        return summary
+
+    @staticmethod
+    def _summarize_distances(cell_id: str, interaction_name: str,
+                             distances: pd.Series) -> Dict[str, float]:
+        """Mean distance, contact count (distance <= 0) and number of points for one interaction."""
+        # Calculate statistics
+        mean_distance = distances.mean()
+        count = (distances <= 0).sum()
+        return OneWayInteractionAnalyzer._validated_summary(
+            cell_id, interaction_name, mean_distance, count, int(distances.count())
+        )
+
+    @staticmethod
+    def _validated_summary(cell_id: str, interaction_name: str,
+                           mean_distance: float, count: int, points: int) -> Dict[str, float]:
+        # CRITICAL VALIDATION: Verify calculated mean is valid
+        if pd.isna(mean_distance):
+            raise ValueError(
+                f"Calculated mean is NaN for {interaction_name} in cell {cell_id}. "
+                f"This indicates a calculation error."
+            )
+
+        if np.isinf(mean_distance):
+            raise ValueError(
+                f"Calculated mean is infinite for {interaction_name} in cell {cell_id}. "
+                f"This indicates a calculation error."
+            )
+
+        logger.debug(f"  {interaction_name}: mean={mean_distance:.3f}, count={count}")
+
+        return {
+            'mean': mean_distance,
+            'count': count,
+            'points': points
+        }
+
     def analyze_all_cells(self):
         """
         Analyze all cells in the dataset.
@@ -155,11 +276,19 @@ class OneWayInteractionAnalyzer:
         unique_cells = self.data_loader.unique_cells
         total_cells = len(unique_cells)
 
-        for idx, cell_id in enumerate(unique_cells, 1):
-            logger.info(f"[{idx}/{total_cells}] Processing cell: {cell_id}")
+        if self.worker_pool is not None:
+            cell_results = self.worker_pool.map_method(
+                self, 'analyze_cell', [(cell_id,) for cell_id in unique_cells]
+            )
+            for idx, (cell_id, cell_interactions) in enumerate(zip(unique_cells, cell_results), 1):
+                logger.info(f"[{idx}/{total_cells}] Processed cell: {cell_id}")
+                self.results[cell_id] = cell_interactions
+        else:
+            for idx, cell_id in enumerate(unique_cells, 1):
+                logger.info(f"[{idx}/{total_cells}] Processing cell: {cell_id}")
 
-            cell_interactions = self.analyze_cell(cell_id)
-            self.results[cell_id] = cell_interactions
+                cell_interactions = self.analyze_cell(cell_id)
+                self.results[cell_id] = cell_interactions
 
         logger.info(f"Completed analysis of {total_cells} cells")
 
@@ -171,6 +300,7 @@ class OneWayInteractionAnalyzer:
         - mean_distance_df: Mean distances for each interaction (rows) across cells (columns)
         - count_df: Count of measurements for each interaction (rows) across cells (columns)
         - missing_data_df: Data completeness tracking ('Present' or 'Missing')
+        and the reciprocal_df pairs table (see _build_reciprocal_table).
         """
         logger.info("Building summary tables...")
 
@@ -192,6 +322,7 @@ class OneWayInteractionAnalyzer:
         # Format: rows = interactions, columns = cells
         mean_data = []
         count_data = []
+        points_data = []
         missing_data = []
         missing_count = 0
 
@@ -199,6 +330,7 @@ class OneWayInteractionAnalyzer:
             # Build row for this interaction across all cells
             mean_row = {'Interaction': interaction}
             count_row = {'Interaction': interaction}
+            points_row = {'Interaction': interaction}
             missing_row = {'Interaction': interaction}
 
             for cell_id in all_cells:
@@ -207,17 +339,20 @@ class OneWayInteractionAnalyzer:
                 if interaction in cell_interactions:
                     mean_row[cell_id] = cell_interactions[interaction]['mean']
                     count_row[cell_id] = cell_interactions[interaction]['count']
+                    points_row[cell_id] = cell_interactions[interaction]['points']
                     missing_row[cell_id] = 'Present'
                 else:
                     # Use NaN for missing interactions
                     mean_row[cell_id] = np.nan
                     count_row[cell_id] = 0
+                    points_row[cell_id] = 0
                     missing_row[cell_id] = 'Missing'
                     missing_count += 1
                     logger.debug(f"Missing data: {interaction} not found in {cell_id}")
 
             mean_data.append(mean_row)
             count_data.append(count_row)
+            points_data.append(points_row)
             missing_data.append(missing_row)
 
         # Create DataFrames
@@ -235,6 +370,154 @@ class OneWayInteractionAnalyzer:
         else:
             logger.info("No missing data detected - complete dataset")
 
+        self._build_reciprocal_table(pd.DataFrame(points_data))
+        if self.percentiles:
+            self._build_quantile_tables(all_interactions, all_cells)
+        if self.histogram_range is not None:
+            self._build_histogram_table(all_interactions, all_cells)
+
+    def _build_reciprocal_table(self, points_df: pd.DataFrame):
+        """
+        Pair every interaction A-to-B with B-to-A: one row per (pair, cell).
+
+        Interactions are coded by their row in the summary tables; the
+        reverse direction of each row is looked up once per interaction,
+        and the per-cell values of both directions are taken from the
+        interaction x cell matrices by integer indexing. Contact fraction =
+        contacts / points of the bait surface (distance file) of that
+        direction. Directions missing in a cell are NaN (0 contacts/points).
+        Without any interactions the table is empty (RECIPROCAL_COLUMNS).
+        """
+        if self.mean_distance_df.empty:
+            self.reciprocal_df = pd.DataFrame(columns=RECIPROCAL_COLUMNS)
+            logger.info("Reciprocal pairs: no interactions found")
+            return
+
+        interactions = self.mean_distance_df['Interaction'].tolist()
+        cells = [column for column in self.mean_distance_df.columns if column != 'Interaction']
+        codes = {interaction: i for i, interaction in enumerate(interactions)}
+        directions = [interaction.split('-to-', 1) for interaction in interactions]
+        reverse = np.array([codes.get(f"{target}-to-{source}", -1) for source, target in directions],
+                           dtype=np.int64)
+
+        # Each pair once, from its alphabetically first direction
+        forward = np.flatnonzero(reverse > np.arange(len(interactions)))
+        backward = reverse[forward]
+
+        means = self.mean_distance_df[cells].to_numpy(dtype=np.float64)
+        contacts = self.count_df[cells].to_numpy(dtype=np.int64)
+        points = points_df[cells].to_numpy(dtype=np.int64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fractions = contacts / points
+            ratios = means[forward] / means[backward]
+
+        n_cells = len(cells)
+        self.reciprocal_df = pd.DataFrame({
+            'Organelle_A': np.repeat([directions[i][0] for i in forward], n_cells),
+            'Organelle_B': np.repeat([directions[i][1] for i in forward], n_cells),
+            'Cell_ID': np.tile(cells, len(forward)),
+            'Mean_A_to_B': means[forward].ravel(),
+            'Mean_B_to_A': means[backward].ravel(),
+            'Mean_Difference': (means[forward] - means[backward]).ravel(),
+            'Mean_Ratio': ratios.ravel(),
+            'Contacts_A_to_B': contacts[forward].ravel(),
+            'Points_A_to_B': points[forward].ravel(),
+            'Contact_Fraction_A_to_B': fractions[forward].ravel(),
+            'Contacts_B_to_A': contacts[backward].ravel(),
+            'Points_B_to_A': points[backward].ravel(),
+            'Contact_Fraction_B_to_A': fractions[backward].ravel(),
+        })
+        logger.info(f"Reciprocal pairs: {len(forward)} organelle pairs x {n_cells} cells")
+
+    def merged_sketch(self, interaction: str, cells: Optional[Iterable[str]] = None) -> QuantileSketch:
+        """
+        Distance sketch of an interaction pooled over cells.
+
+        Parameters:
+        -----------
+        interaction : str
+            Interaction name (e.g., "ER-to-LD")
+        cells : Iterable[str], optional
+            Cells to pool (default: all cells with this interaction)
+
+        Returns:
+        --------
+        QuantileSketch : call .quantile(q) for approximate quantiles
+        """
+        if not self.percentiles:
+            raise ValueError("No distance sketches. Run with percentiles enabled.")
+        cells = self.results if cells is None else cells
+        return QuantileSketch.merged(
+            self.results[cell_id][interaction]['sketch']
+            for cell_id in cells
+            if interaction in self.results.get(cell_id, {})
+        )
+
+    def _build_quantile_tables(self, interactions: List[str], cells: List[str]):
+        """Percentiles per (interaction, cell) and pooled per (interaction, condition)."""
+        columns = [f"P{p:g}" for p in self.percentiles]
+        q = np.array(self.percentiles, dtype=np.float64) / 100
+
+        cell_rows = []
+        condition_rows = []
+        for interaction in interactions:
+            conditions = {}
+            for cell_id in cells:
+                entry = self.results[cell_id].get(interaction)
+                if entry is None:
+                    continue
+                sketch = entry['sketch']
+                cell_rows.append([interaction, cell_id, sketch.count, *sketch.quantile(q)])
+                conditions.setdefault(cell_condition(cell_id), []).append(sketch)
+
+            for condition, sketches in conditions.items():
+                pooled = QuantileSketch.merged(sketches)
+                condition_rows.append([interaction, condition, len(sketches), pooled.count, *pooled.quantile(q)])
+
+        self.quantile_df = pd.DataFrame(cell_rows, columns=['Interaction', 'Cell_ID', 'Count', *columns])
+        self.condition_quantile_df = pd.DataFrame(
+            condition_rows, columns=['Interaction', 'Condition', 'Cells', 'Count', *columns]
+        )
+        logger.info(f"Distance percentiles ({', '.join(columns)}) for {len(cell_rows)} interaction/cell pairs")
+
+    def _build_histogram_table(self, interactions: List[str], cells: List[str]):
+        """
+        Long-format distance histograms: one row per (interaction, cell, bin).
+
+        Bins include the open-ended under/overflow bins (Bin_Start -inf,
+        Bin_End inf), so Cumulative_Fraction reaches 1 in every group.
+        """
+        keys = []
+        histograms = []
+        for interaction in interactions:
+            for cell_id in cells:
+                entry = self.results[cell_id].get(interaction)
+                if entry is not None:
+                    keys.append((interaction, cell_id))
+                    histograms.append(entry['histogram'].counts)
+
+        edges = FixedBinHistogram(*self.histogram_range, self.histogram_width).edges
+        starts = np.concatenate(([-np.inf], edges))
+        ends = np.concatenate((edges, [np.inf]))
+        n_rows = len(starts)
+
+        counts = np.array(histograms, dtype=np.int64).reshape(len(keys), n_rows)
+        totals = counts.sum(axis=1, keepdims=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fractions = counts / totals
+            cumulative = counts.cumsum(axis=1) / totals
+
+        self.histogram_df = pd.DataFrame({
+            'Interaction': np.repeat([interaction for interaction, _ in keys], n_rows),
+            'Cell_ID': np.repeat([cell_id for _, cell_id in keys], n_rows),
+            'Bin_Start': np.tile(starts, len(keys)),
+            'Bin_End': np.tile(ends, len(keys)),
+            'Count': counts.ravel(),
+            'Fraction': fractions.ravel(),
+            'Cumulative_Fraction': cumulative.ravel(),
+        })
+        logger.info(f"Distance histograms: {len(keys)} interaction/cell pairs x {n_rows} bins")
+
     def export_to_excel(self, output_path: str):
         """
         Export results to Excel file with separate sheets for mean, count, and data completeness.
@@ -276,6 +559,27 @@ class OneWayInteractionAnalyzer:
                     index=False
                 )
 
+            # Write reciprocal interaction pairs
+            if self.reciprocal_df is not None:
+                self.reciprocal_df.to_excel(writer, sheet_name='Reciprocal_Pairs', index=False)
+
+            # Write distance percentiles
+            if self.quantile_df is not None:
+                self.quantile_df.to_excel(writer, sheet_name='Distance_Percentiles', index=False)
+                self.condition_quantile_df.to_excel(writer, sheet_name='Condition_Percentiles', index=False)
+
+            # Write distance histograms (CSV next to the workbook if too long for a sheet)
+            if self.histogram_df is not None:
+                if len(self.histogram_df) <= EXCEL_MAX_ROWS:
+                    self.histogram_df.to_excel(writer, sheet_name='Distance_Histogram', index=False)
+                else:
+                    histogram_path = output_path.with_name(f"{output_path.stem}_histogram.csv")
+                    self.histogram_df.to_csv(histogram_path, index=False)
+                    logger.warning(
+                        f"Histogram has {len(self.histogram_df)} rows (Excel limit {EXCEL_MAX_ROWS}); "
+                        f"saved to {histogram_path.name}"
+                    )
+
             # Write metadata for data provenance
             metadata_df = pd.DataFrame(list(metadata.items()), columns=['Parameter', 'Value'])
             metadata_df.to_excel(
@@ -283,9 +587,10 @@ class OneWayInteractionAnalyzer:
                 sheet_name='Metadata',
                 index=False
             )
+            sheet_names = list(writer.sheets)
 
         logger.info(f"Results exported to: {output_path}")
-        logger.info("Excel file contains 4 sheets: Mean_Distance, Count, Data_Completeness, Metadata")
+        logger.info(f"Excel file contains {len(sheet_names)} sheets: {', '.join(sheet_names)}")
 
     def export_to_csv(self, output_dir: str):
         """
@@ -323,6 +628,26 @@ class OneWayInteractionAnalyzer:
             self.missing_data_df.to_csv(missing_path, index=False)
             logger.info(f"Data completeness saved to: {missing_path.name}")
 
+        # Export reciprocal interaction pairs
+        if self.reciprocal_df is not None:
+            reciprocal_path = output_dir / "one_way_interactions_reciprocal_pairs.csv"
+            self.reciprocal_df.to_csv(reciprocal_path, index=False)
+            logger.info(f"Reciprocal pairs saved to: {reciprocal_path.name}")
+
+        # Export distance percentiles
+        if self.quantile_df is not None:
+            quantile_path = output_dir / "one_way_interactions_percentiles.csv"
+            self.quantile_df.to_csv(quantile_path, index=False)
+            condition_path = output_dir / "one_way_interactions_condition_percentiles.csv"
+            self.condition_quantile_df.to_csv(condition_path, index=False)
+            logger.info(f"Distance percentiles saved to: {quantile_path.name}, {condition_path.name}")
+
+        # Export distance histograms
+        if self.histogram_df is not None:
+            histogram_path = output_dir / "one_way_interactions_histogram.csv"
+            self.histogram_df.to_csv(histogram_path, index=False)
+            logger.info(f"Distance histograms saved to: {histogram_path.name}")
+
         # Export metadata for data provenance
         metadata_df = pd.DataFrame(list(metadata.items()), columns=['Parameter', 'Value'])
         metadata_path = output_dir / "one_way_interactions_metadata.csv"
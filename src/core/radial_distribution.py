@@ -7,17 +7,26 @@ center using distance-from-origin measurements from Imaris.
 Author: Philipp Kaintoch
 """
 
+import re
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional
-from .data_loader import DataLoader
+from typing import Dict, List, Optional, Sequence, Union
+from .data_loader import DataLoader, open_dataset
+from .worker_pool import WorkerPool
 from ..utils.logging_config import get_logger
 from ..utils.sorting import sort_cell_ids
 from ..utils.metadata import generate_base_metadata
 
 logger = get_logger(__name__)
 
+ALL_ORGANELLES = '*'  # set_parameters() selection: every organelle of the dataset
+EXCEL_SHEET_NAME_LIMIT = 31
+# Batch Excel output: Metadata parameter '<prefix><organelle>' -> sheet name of that organelle
+SHEET_METADATA_PREFIX = 'Sheet_'
+# Summary columns in front of the cell columns of each batch sheet
+SUMMARY_COLUMNS = ('Mean', 'SD')
+
 
 class RadialDistributionAnalyzer:
     """
@@ -27,32 +36,63 @@ class RadialDistributionAnalyzer:
     per surface object, bins distances, and sums volume per bin to produce
     a radial volume profile per cell.
 
+    Several organelles (batch mode) are binned in one pass over the cells;
+    the (cell, organelle) items of a cell are processed together, on the
+    worker pool if one is given.
+
     Output Format:
     --------------
     Excel file with sheets:
     - Per_Cell_Data: Rows = distance bins, Columns = cells
     - Summary: Mean +/- SD across cells per bin
     - Metadata: Analysis provenance
+
+    In batch mode, one sheet per organelle (Mean, SD, then one column per
+    cell) plus Metadata, which maps each organelle to its sheet
+    (SHEET_METADATA_PREFIX). CSV output always has one file set per organelle.
+    to_heatmap_datasets() feeds visualization.generate_radial_heatmap().
     """
 
-    def __init__(self, input_dir: str):
+    def __init__(self, input_dir: str, data_loader: Optional[DataLoader] = None,
+                 worker_pool: Optional[WorkerPool] = None):
         self.input_dir = Path(input_dir)
         if not self.input_dir.exists():
             raise FileNotFoundError(f"Input directory does not exist: {self.input_dir}")
 
-        self.data_loader = DataLoader(input_dir)
-        self.organelle = None
+        # Reuse an already scanned loader (e.g., from the GUI pre-scan) if given
+        self.data_loader = data_loader if data_loader is not None else open_dataset(input_dir)
+        # Optional process pool for per-cell work
+        self.worker_pool = worker_pool
+        self.organelle = None  # single-organelle mode only
+        self.organelles = []
         self.bin_width = 0.25
         self.max_distance = 80.0
         self.results = {}
         self.per_cell_df = None
         self.summary_df = None
+        # Per-organelle results (single and batch mode)
+        self.organelle_results = {}
+        self.per_cell_dfs = {}
+        self.summary_dfs = {}
         self.metadata = {}
 
+    def __getstate__(self):
+        # Sent to worker processes: only the loader and settings are needed
+        state = self.__dict__.copy()
+        state['worker_pool'] = None
+        state['results'] = {}
+        state['per_cell_df'] = None
+        state['summary_df'] = None
+        state['organelle_results'] = {}
+        state['per_cell_dfs'] = {}
+        state['summary_dfs'] = {}
+        return state
+
     def load_data(self):
         logger.info("Loading data...")
-        self.data_loader.detect_structure()
-        self.data_loader.find_cell_folders()
+        if not self.data_loader._is_validated:
+            self.data_loader.detect_structure()
+            self.data_loader.find_cell_folders()
 
         summary = self.data_loader.get_summary()
         for line in summary.split('\n'):
@@ -62,9 +102,37 @@ class RadialDistributionAnalyzer:
     def get_available_organelles(self) -> List[str]:
         return self.data_loader.all_organelles
 
-    def set_parameters(self, organelle: str, bin_width: float, max_distance: float):
-        if self.data_loader.all_organelles and organelle not in self.data_loader.all_organelles:
-            raise ValueError(f"Organelle '{organelle}' not found. Available: {', '.join(self.data_loader.all_organelles)}")
+    @property
+    def is_batch(self) -> bool:
+        """True if several organelles are analyzed together."""
+        return len(self.organelles) > 1
+
+    @property
+    def n_bins(self) -> int:
+        return round(self.max_distance / self.bin_width)
+
+    def set_parameters(self, organelle: Union[str, Sequence[str]], bin_width: float, max_distance: float):
+        """
+        Parameters:
+        -----------
+        organelle : str or Sequence[str]
+            Organelle to analyze, a list of organelles (batch mode), or
+            ALL_ORGANELLES for every organelle of the dataset
+        bin_width : float
+            Width of the distance bins in um
+        max_distance : float
+            Upper edge of the last bin in um
+        """
+        available = self.data_loader.all_organelles
+        if isinstance(organelle, str):
+            organelles = list(available) if organelle == ALL_ORGANELLES else [organelle]
+        else:
+            organelles = list(dict.fromkeys(organelle))
+        if not organelles:
+            raise ValueError("No organelle selected")
+        for name in organelles:
+            if available and name not in available:
+                raise ValueError(f"Organelle '{name}' not found. Available: {', '.join(available)}")
         if bin_width <= 0:
             raise ValueError(f"Bin width must be positive, got {bin_width}")
         if max_distance <= 0:
@@ -72,7 +140,8 @@ class RadialDistributionAnalyzer:
         if max_distance <= bin_width:
             raise ValueError(f"Max distance ({max_distance}) must be greater than bin width ({bin_width})")
 
-        self.organelle = organelle
+        self.organelles = organelles
+        self.organelle = organelles[0] if len(organelles) == 1 else None
         self.bin_width = bin_width
         self.max_distance = max_distance
 
@@ -83,28 +152,8 @@ class RadialDistributionAnalyzer:
         Returns raw Series WITHOUT dropna to preserve row alignment for pairing.
         """
         try:
-            df = pd.read_csv(file_path, skiprows=4, header=None, encoding='utf-8')
-
-            if df.shape[1] < 1:
-                raise ValueError(f"File has no columns: {file_path.name}")
-            if df.shape[0] < 1:
-                raise ValueError(f"File has no data rows: {file_path.name}")
-
-            values = df.iloc[:, 0]
-
-            if values.dropna().empty:
-                raise ValueError(f"No valid {metric_name} values in {file_path.name}")
-            if not pd.api.types.is_numeric_dtype(values):
-                raise ValueError(f"{metric_name} data is not numeric in {file_path.name}")
-            if np.isinf(values).any():
-                raise ValueError(f"Infinite {metric_name} values found in {file_path.name}")
-
-            if metric_name == "Volume":
-                non_nan = values.dropna()
-                if (non_nan < 0).any():
-                    raise ValueError(f"Negative volume values found in {file_path.name}")
-
-            return values
+            values = self.data_loader.read_values(file_path)
+            return self._validate_metric(values, metric_name, file_path.name)
 
         except pd.errors.EmptyDataError:
             raise ValueError(f"File is empty or has no data: {file_path.name}")
@@ -113,40 +162,66 @@ class RadialDistributionAnalyzer:
                 raise
             raise IOError(f"Failed to read {file_path.name}: {e}")
 
-    def analyze_cell(self, cell_id: str) -> Optional[pd.Series]:
-        folder = self.data_loader.get_folder_path(cell_id, self.organelle)
+    @staticmethod
+    def _validate_metric(values: pd.Series, metric_name: str, file_name: str) -> pd.Series:
+        """Validation of load_metric_file() (NaN allowed)."""
+        if values.dropna().empty:
+            raise ValueError(f"No valid {metric_name} values in {file_name}")
+        if not pd.api.types.is_numeric_dtype(values):
+            raise ValueError(f"{metric_name} data is not numeric in {file_name}")
+        if np.isinf(values).any():
+            raise ValueError(f"Infinite {metric_name} values found in {file_name}")
+
+        if metric_name == "Volume":
+            non_nan = values.dropna()
+            if (non_nan < 0).any():
+                raise ValueError(f"Negative volume values found in {file_name}")
+
+        return values
+
+    def analyze_cell(self, cell_id: str, organelle: Optional[str] = None) -> Optional[pd.Series]:
+        """Radial volume profile of one cell (organelle defaults to the selected one)."""
+        organelle = organelle or self.organelle
+        folder = self.data_loader.get_folder_path(cell_id, organelle)
         if folder is None:
             return None
 
-        vol_file = folder / f"{cell_id}_{self.organelle}_Volume.csv"
-        dist_file = folder / f"{cell_id}_{self.organelle}_Distance_from_Origin_Reference_Frame.csv"
+        vol_file = self.data_loader.get_metric_file(cell_id, organelle, "Volume")
+        dist_file = self.data_loader.get_metric_file(
+            cell_id, organelle, "Distance_from_Origin_Reference_Frame"
+        )
+
+        if vol_file is None or dist_file is None:
+            logger.warning(f"Missing file(s) for {cell_id} ({organelle})")
+            return None
 
-        if not vol_file.exists() or not dist_file.exists():
-            logger.warning(f"Missing file(s) for {cell_id} ({self.organelle})")
+        # Volume and distance of the same surface, joined on object ID
+        columns = ["Volume", "Distance_from_Origin_Reference_Frame"]
+        table = self.data_loader.object_table(cell_id, organelle, columns)
+        if any(column not in table.columns for column in columns):
+            logger.error(f"Failed to load data for {cell_id}")
             return None
 
         try:
-            volumes = self.load_metric_file(vol_file, "Volume")
-            distances = self.load_metric_file(dist_file, "Distance")
+            volumes = self._validate_metric(table["Volume"], "Volume", vol_file.name)
+            distances = self._validate_metric(
+                table["Distance_from_Origin_Reference_Frame"], "Distance", dist_file.name
+            )
         except Exception as e:
             logger.error(f"Failed to load data for {cell_id}: {e}")
             return None
 
-        if len(volumes) != len(distances):
-            logger.warning(f"Row mismatch for {cell_id}: Vol={len(volumes)}, Dist={len(distances)}")
-            return None
-
         df = pd.DataFrame({'Vol': volumes.values, 'Dist': distances.values})
+        n_unpaired = int((df['Vol'].isna() != df['Dist'].isna()).sum())
+        if n_unpaired > 0:
+            logger.warning(f"{n_unpaired} surfaces in {cell_id} have only one of Volume/Distance and are skipped")
         df = df.dropna(subset=['Vol', 'Dist'])
 
         if df.empty:
             logger.warning(f"No valid data after NaN removal for {cell_id}")
             return None
 
-        n_bins = round(self.max_distance / self.bin_width)
-        bin_edges = np.linspace(0, self.max_distance, n_bins + 1)
-
-        df['Dist_bin'] = pd.cut(df['Dist'], bins=bin_edges, include_lowest=True)
+        df['Dist_bin'] = pd.cut(df['Dist'], bins=self._bin_edges(), include_lowest=True)
 
         n_unbinned = df['Dist_bin'].isna().sum()
         if n_unbinned > 0:
@@ -155,37 +230,111 @@ class RadialDistributionAnalyzer:
         binned = df.groupby('Dist_bin', observed=False)['Vol'].sum()
         return binned
 
+    def _bin_edges(self) -> np.ndarray:
+        return np.linspace(0, self.max_distance, self.n_bins + 1)
+
     def analyze(self) -> pd.DataFrame:
-        if self.organelle is None:
+        """
+        Bin all selected organelles in one pass over the cells.
+
+        Returns:
+        --------
+        pd.DataFrame : Per-cell profiles (bins x cells); in batch mode the
+            columns are (organelle, cell)
+        """
+        if not self.organelles:
             raise ValueError("Must call set_parameters() before analyze()")
-        if self.data_loader.all_organelles and self.organelle not in self.data_loader.all_organelles:
-            raise ValueError(f"Organelle '{self.organelle}' not found. Available: {', '.join(self.data_loader.all_organelles)}")
+        available = self.data_loader.all_organelles
+        for organelle in self.organelles:
+            if available and organelle not in available:
+                raise ValueError(f"Organelle '{organelle}' not found. Available: {', '.join(available)}")
+
+        cells_by_organelle = {}
+        for organelle in self.organelles:
+            cells = self.data_loader.get_cells_by_organelle(organelle)
+            if not cells:
+                if not self.is_batch:
+                    raise ValueError(f"No cells found for organelle: {organelle}")
+                logger.warning(f"No cells found for organelle: {organelle}")
+            cells_by_organelle[organelle] = set(cells)
+
+        # The (cell, organelle) items of a cell are adjacent: one pass over the cells
+        all_cells = sort_cell_ids(list(set().union(*cells_by_organelle.values())))
+        work_items = [
+            (cell_id, organelle) for cell_id in all_cells
+            for organelle in self.organelles if cell_id in cells_by_organelle[organelle]
+        ]
+        if not work_items:
+            raise ValueError(f"No cells found for organelles: {', '.join(self.organelles)}")
 
-        cells = self.data_loader.get_cells_by_organelle(self.organelle)
-        if not cells:
-            raise ValueError(f"No cells found for organelle: {self.organelle}")
+        if self.is_batch:
+            logger.info(f"Analyzing {len(all_cells)} cells for {len(self.organelles)} organelles "
+                        f"({', '.join(self.organelles)})")
+        else:
+            logger.info(f"Analyzing {len(all_cells)} cells for {self.organelle}")
 
-        logger.info(f"Analyzing {len(cells)} cells for {self.organelle}")
+        if self.worker_pool is not None:
+            profiles = self.worker_pool.map_method(self, 'analyze_cell', work_items)
+        else:
+            profiles = (self.analyze_cell(cell_id, organelle) for cell_id, organelle in work_items)
 
-        for cell_id in cells:
-            profile = self.analyze_cell(cell_id)
+        self.organelle_results = {organelle: {} for organelle in self.organelles}
+        for (cell_id, organelle), profile in zip(work_items, profiles):
             if profile is not None:
-                self.results[cell_id] = profile
-
-        if not self.results:
-            raise ValueError(f"No valid data for {self.organelle}")
-
-        self.per_cell_df = pd.DataFrame(self.results)
-        sorted_cols = sort_cell_ids(list(self.per_cell_df.columns))
-        self.per_cell_df = self.per_cell_df[sorted_cols]
-
-        self.summary_df = pd.DataFrame({
-            'Mean': self.per_cell_df.mean(axis=1),
-            'SD': self.per_cell_df.std(axis=1, ddof=1),
-        })
+                self.organelle_results[organelle][cell_id] = profile
+
+        self.per_cell_dfs = {}
+        self.summary_dfs = {}
+        for organelle, results in self.organelle_results.items():
+            if not results:
+                if not self.is_batch:
+                    raise ValueError(f"No valid data for {organelle}")
+                logger.warning(f"No valid data for {organelle}")
+                continue
+
+            per_cell_df = pd.DataFrame(results)
+            per_cell_df = per_cell_df[sort_cell_ids(list(per_cell_df.columns))]
+            self.per_cell_dfs[organelle] = per_cell_df
+            self.summary_dfs[organelle] = pd.DataFrame({
+                'Mean': per_cell_df.mean(axis=1),
+                'SD': per_cell_df.std(axis=1, ddof=1),
+            })
+            logger.info(f"Processed {len(results)} cells, {len(per_cell_df)} bins"
+                        + (f" for {organelle}" if self.is_batch else ""))
+
+        if not self.per_cell_dfs:
+            raise ValueError(f"No valid data for {', '.join(self.organelles)}")
+
+        if not self.is_batch:
+            self.results = self.organelle_results[self.organelle]
+            self.per_cell_df = self.per_cell_dfs[self.organelle]
+            self.summary_df = self.summary_dfs[self.organelle]
+            return self.per_cell_df
+
+        return pd.concat(self.per_cell_dfs, axis=1, names=['Organelle', 'Cell'])
+
+    def to_heatmap_datasets(self) -> List[dict]:
+        """
+        Summary profiles as visualization.load_radial_output() returns them.
 
-        logger.info(f"Processed {len(self.results)} cells, {len(self.per_cell_df)} bins")
-        return self.per_cell_df
+        Pass the list to visualization.generate_radial_heatmap() to render
+        the analyzed organelles without writing and re-reading Excel files.
+        """
+        if not self.summary_dfs:
+            raise ValueError("Must call analyze() before to_heatmap_datasets()")
+
+        bin_edges = self._bin_edges()
+        return [
+            {
+                'organelle': organelle,
+                'bin_width': float(self.bin_width),
+                'max_distance': float(self.max_distance),
+                'n_bins': self.n_bins,
+                'mean_values': np.nan_to_num(summary_df['Mean'].to_numpy(dtype=float), nan=0.0),
+                'bin_edges': bin_edges.copy(),
+            }
+            for organelle, summary_df in self.summary_dfs.items()
+        ]
 
     def run(self, output_path: str, file_format: str = 'excel'):
         logger.info("Starting Radial Distribution Analysis")
@@ -193,10 +342,13 @@ class RadialDistributionAnalyzer:
 
         self.load_data()
 
-        if self.organelle is None:
+        if not self.organelles:
             raise ValueError("Must call set_parameters() before run()")
 
-        logger.info(f"Organelle: {self.organelle}")
+        if self.is_batch:
+            logger.info(f"Organelles: {', '.join(self.organelles)}")
+        else:
+            logger.info(f"Organelle: {self.organelle}")
         logger.info(f"Binning: {self.bin_width} um steps, 0 - {self.max_distance} um")
 
         self.analyze()
@@ -209,21 +361,54 @@ class RadialDistributionAnalyzer:
         logger.info(f"Results saved to: {output_path}")
         logger.info("Analysis Complete")
 
-    def _generate_metadata(self) -> dict:
-        n_bins = round(self.max_distance / self.bin_width)
+    def _generate_metadata(self, organelle: Optional[str] = None) -> dict:
+        """Metadata of one organelle, or of the whole batch if none is given."""
+        if organelle is None and self.is_batch:
+            organelle_fields = {'Organelles': ', '.join(self.per_cell_dfs)}
+            cells_analyzed = ', '.join(
+                f"{name}: {len(self.organelle_results[name])}" for name in self.per_cell_dfs
+            )
+        else:
+            organelle = organelle or self.organelle
+            organelle_fields = {'Organelle': organelle}
+            cells_analyzed = str(len(self.organelle_results[organelle]))
+
         metadata = generate_base_metadata(
             input_dir=self.input_dir,
             analysis_type='Radial Distribution',
-            Organelle=self.organelle,
+            **organelle_fields,
             Bin_Width_um=str(self.bin_width),
             Max_Distance_um=str(self.max_distance),
-            Total_Bins=str(n_bins),
-            Cells_Analyzed=str(len(self.results)),
+            Total_Bins=str(self.n_bins),
+            Cells_Analyzed=cells_analyzed,
         )
         self.metadata = metadata
         return metadata
 
+    def _sheet_names(self) -> Dict[str, str]:
+        """
+        Excel sheet name of each organelle: invalid characters replaced and
+        length limited. Names that collide (Excel compares them ignoring
+        case) or equal 'Metadata' get a numeric suffix.
+        """
+        sheet_names = {}
+        taken = {'metadata'}
+        for organelle in self.per_cell_dfs:
+            base = re.sub(r'[\\/*?:\[\]]', '_', organelle).strip("'") or 'Organelle'
+            sheet_name = base[:EXCEL_SHEET_NAME_LIMIT]
+            suffix = 1
+            while sheet_name.lower() in taken:
+                suffix += 1
+                sheet_name = f"{base[:EXCEL_SHEET_NAME_LIMIT - len(str(suffix)) - 1]}_{suffix}"
+            taken.add(sheet_name.lower())
+            sheet_names[organelle] = sheet_name
+        return sheet_names
+
     def _save_excel(self, output_path: str):
+        if self.is_batch:
+            self._save_excel_batch(output_path)
+            return
+
         with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
             per_cell_export = self.per_cell_df.copy()
             per_cell_export.index = per_cell_export.index.astype(str)
@@ -239,33 +424,66 @@ class RadialDistributionAnalyzer:
 
         logger.info(f"Saved radial distribution to Excel: {output_path}")
 
+    def _save_excel_batch(self, output_path: str):
+        """
+        One sheet per organelle: Mean, SD, then one column per cell.
+
+        Cells named like a summary column are written as 'Cell_<name>' so
+        every column header of a sheet is unique.
+        """
+        sheet_names = self._sheet_names()
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            for organelle, per_cell_df in self.per_cell_dfs.items():
+                reserved = [cell_id for cell_id in per_cell_df.columns if cell_id in SUMMARY_COLUMNS]
+                if reserved:
+                    logger.warning(f"Cells {', '.join(reserved)} of {organelle} written as "
+                                   f"{', '.join(f'Cell_{cell_id}' for cell_id in reserved)}")
+                    per_cell_df = per_cell_df.rename(columns={cell_id: f"Cell_{cell_id}" for cell_id in reserved})
+                sheet_export = pd.concat([self.summary_dfs[organelle], per_cell_df], axis=1)
+                sheet_export.index = sheet_export.index.astype(str)
+                sheet_export.to_excel(writer, sheet_name=sheet_names[organelle], index=True)
+
+            metadata = self._generate_metadata()
+            metadata.update((f"{SHEET_METADATA_PREFIX}{organelle}", sheet_name)
+                            for organelle, sheet_name in sheet_names.items())
+            metadata_df = pd.DataFrame(list(metadata.items()), columns=['Parameter', 'Value'])
+            metadata_df.to_excel(writer, sheet_name='Metadata', index=False)
+
+        logger.info(f"Saved radial distribution of {len(self.per_cell_dfs)} organelles to Excel: {output_path}")
+
     def _save_csv(self, output_dir: str):
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        per_cell_export = self.per_cell_df.copy()
-        per_cell_export.index = per_cell_export.index.astype(str)
-        per_cell_export.to_csv(output_path / f"radial_distribution_{self.organelle}_per_cell.csv", index=True)
+        for organelle, per_cell_df in self.per_cell_dfs.items():
+            per_cell_export = per_cell_df.copy()
+            per_cell_export.index = per_cell_export.index.astype(str)
+            per_cell_export.to_csv(output_path / f"radial_distribution_{organelle}_per_cell.csv", index=True)
 
-        summary_export = self.summary_df.copy()
-        summary_export.index = summary_export.index.astype(str)
-        summary_export.to_csv(output_path / f"radial_distribution_{self.organelle}_summary.csv", index=True)
+            summary_export = self.summary_dfs[organelle].copy()
+            summary_export.index = summary_export.index.astype(str)
+            summary_export.to_csv(output_path / f"radial_distribution_{organelle}_summary.csv", index=True)
 
-        metadata = self._generate_metadata()
-        metadata_df = pd.DataFrame(list(metadata.items()), columns=['Parameter', 'Value'])
-        metadata_df.to_csv(output_path / f"radial_distribution_{self.organelle}_metadata.csv", index=False)
+            metadata = self._generate_metadata(organelle)
+            metadata_df = pd.DataFrame(list(metadata.items()), columns=['Parameter', 'Value'])
+            metadata_df.to_csv(output_path / f"radial_distribution_{organelle}_metadata.csv", index=False)
 
         logger.info(f"Saved radial distribution CSVs to {output_dir}")
 
     def get_results_summary(self) -> str:
-        if not self.results:
+        if not self.per_cell_dfs:
             return "No results available"
 
-        n_bins = round(self.max_distance / self.bin_width)
-        summary = [
-            "Radial Distribution Analysis Summary",
-            f"  Organelle: {self.organelle}",
-            f"  Cells analyzed: {len(self.results)}",
-            f"  Bins: {n_bins} ({self.bin_width} um steps, 0 - {self.max_distance} um)",
-        ]
+        summary = ["Radial Distribution Analysis Summary"]
+        if self.is_batch:
+            summary.append("  Organelles: " + ', '.join(
+                f"{organelle} ({len(self.organelle_results[organelle])} cells)"
+                for organelle in self.per_cell_dfs
+            ))
+        else:
+            summary += [
+                f"  Organelle: {self.organelle}",
+                f"  Cells analyzed: {len(self.results)}",
+            ]
+        summary.append(f"  Bins: {self.n_bins} ({self.bin_width} um steps, 0 - {self.max_distance} um)")
         return "\n".join(summary)
@@ -0,0 +1,339 @@
+"""
+Streaming Aggregation Module
+
+Running accumulators for statistics over values that arrive in chunks, so
+very large Imaris files can be summarized with bounded memory (see
+DataLoader.iter_values), plus mergeable quantile sketches and fixed-bin
+histograms for distance distributions per file or pooled over many files.
+
+Author: Philipp Kaintoch
+"""
+
+from typing import Iterable, Iterator
+import numpy as np
+
+# Rows per chunk when streaming files (8 MB of float64 values)
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def iter_array_chunks(values: np.ndarray, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[np.ndarray]:
+    """Yield consecutive slices (views) of an array with at most chunk_rows rows."""
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be at least 1, got {chunk_rows}")
+    for start in range(0, len(values), chunk_rows):
+        yield values[start:start + chunk_rows]
+
+
+class RunningStats:
+    """
+    Count, compensated sum, min/max and contact count over chunked values.
+
+    NaN values are skipped, as pandas does. Chunk sums use NumPy's pairwise
+    summation and are combined with Neumaier compensation, so the mean is
+    at least as accurate as Series.mean() on the full column (results can
+    differ in the last bits).
+
+    Usage:
+        stats = RunningStats()
+        for chunk in data_loader.iter_values(file_path):
+            stats.update(chunk)
+        stats.mean, stats.contacts
+
+    Parameters:
+    -----------
+    contact_threshold : float
+        Values <= threshold are counted as contacts (default: 0.0, i.e.
+        touching or overlapping surfaces)
+    """
+
+    __slots__ = ('contact_threshold', 'count', 'contacts', 'min', 'max', '_sum', '_compensation')
+
+    def __init__(self, contact_threshold: float = 0.0):
+        self.contact_threshold = contact_threshold
+        self.count = 0
+        self.contacts = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def update(self, values: np.ndarray) -> 'RunningStats':
+        """
+        Add a chunk of values.
+
+        Raises:
+        -------
+        ValueError : If the chunk is not numeric
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in 'fiub':
+            raise ValueError("values are not numeric")
+        if values.dtype.kind == 'f':
+            values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.count += len(values)
+        self.contacts += int(np.count_nonzero(values <= self.contact_threshold))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._add(float(values.sum(dtype=np.float64)))
+        return self
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combine with stats accumulated elsewhere (e.g., another worker)."""
+        if other.contact_threshold != self.contact_threshold:
+            raise ValueError("Cannot merge RunningStats with different contact thresholds")
+        self.count += other.count
+        self.contacts += other.contacts
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._add(other._sum)
+        self._add(other._compensation)
+        return self
+
+    def _add(self, value: float):
+        # Neumaier's variant of Kahan summation
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    @property
+    def sum(self) -> float:
+        return self._sum + self._compensation
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else np.nan
+
+    @property
+    def has_inf(self) -> bool:
+        return bool(self.count) and (np.isinf(self.min) or np.isinf(self.max))
+
+    def __repr__(self) -> str:
+        return (f"RunningStats(count={self.count}, mean={self.mean:.6g}, min={self.min:.6g}, "
+                f"max={self.max:.6g}, contacts={self.contacts})")
+
+
+# Relative accuracy of QuantileSketch quantiles (1 %)
+DEFAULT_SKETCH_ACCURACY = 0.01
+# |values| below this fall into the sketch's zero bin (1e-4 um = 0.1 nm)
+DEFAULT_SKETCH_MIN_VALUE = 1e-4
+
+
+class QuantileSketch:
+    """
+    Mergeable fixed log-bin histogram for approximate quantiles.
+
+    Bin boundaries are fixed by the relative accuracy alone: bin i covers
+    magnitudes in (min_value * g**(i-1), min_value * g**i] with
+    g = (1 + a) / (1 - a), mirrored for negative values, plus one bin for
+    |x| < min_value. Any quantile is then within a relative error a of the
+    exact (lower-rank) value. Only occupied bins are stored, so a sketch
+    takes a few KB regardless of the number of values, and sketches with
+    the same settings merge by adding bin counts (cells -> conditions).
+
+    Usage:
+        sketch = QuantileSketch()
+        for chunk in data_loader.iter_values(file_path):
+            sketch.update(chunk)
+        pooled = QuantileSketch.merged([sketch, other_sketch])
+        pooled.quantile([0.1, 0.5, 0.9])
+
+    Parameters:
+    -----------
+    relative_accuracy : float
+        Relative error bound a of quantile estimates (0 < a < 1)
+    min_value : float
+        Magnitudes below this are counted as zero
+    """
+
+    __slots__ = ('relative_accuracy', 'min_value', 'count', 'min', 'max', '_keys', '_counts', '_log_gamma')
+
+    def __init__(self, relative_accuracy: float = DEFAULT_SKETCH_ACCURACY,
+                 min_value: float = DEFAULT_SKETCH_MIN_VALUE):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be between 0 and 1, got {relative_accuracy}")
+        if min_value <= 0:
+            raise ValueError(f"min_value must be positive, got {min_value}")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        # Sorted signed bin keys (0 = zero bin, +-(i+1) = bin i) and their counts
+        self._keys = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._log_gamma = np.log((1 + relative_accuracy) / (1 - relative_accuracy))
+
+    def _bin_keys(self, values: np.ndarray) -> np.ndarray:
+        magnitudes = np.abs(values)
+        keys = np.zeros(len(values), dtype=np.int64)
+        nonzero = magnitudes >= self.min_value
+        bins = np.ceil(np.log(magnitudes[nonzero] / self.min_value) / self._log_gamma).astype(np.int64)
+        keys[nonzero] = np.where(values[nonzero] < 0, -(bins + 1), bins + 1)
+        return keys
+
+    def _add_bins(self, keys: np.ndarray, counts: np.ndarray):
+        keys = np.concatenate((self._keys, keys))
+        counts = np.concatenate((self._counts, counts))
+        self._keys, inverse = np.unique(keys, return_inverse=True)
+        self._counts = np.zeros(len(self._keys), dtype=np.int64)
+        np.add.at(self._counts, inverse.ravel(), counts)
+
+    def update(self, values: np.ndarray) -> 'QuantileSketch':
+        """
+        Add a chunk of values (NaN values are skipped).
+
+        Raises:
+        -------
+        ValueError : If the chunk is not numeric or contains infinite values
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in 'fiub':
+            raise ValueError("values are not numeric")
+        values = values.astype(np.float64, copy=False)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        if np.isinf(values).any():
+            raise ValueError("values contain infinite values")
+
+        keys, counts = np.unique(self._bin_keys(values), return_counts=True)
+        self._add_bins(keys, counts.astype(np.int64))
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Add the counts of another sketch with the same settings."""
+        if (other.relative_accuracy, other.min_value) != (self.relative_accuracy, self.min_value):
+            raise ValueError("Cannot merge QuantileSketch objects with different settings")
+        if other.count:
+            self._add_bins(other._keys, other._counts)
+            self.count += other.count
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    @classmethod
+    def merged(cls, sketches: Iterable['QuantileSketch']) -> 'QuantileSketch':
+        """New sketch holding the counts of all given sketches."""
+        sketches = list(sketches)
+        if not sketches:
+            return cls()
+        result = cls(sketches[0].relative_accuracy, sketches[0].min_value)
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
+
+    def quantile(self, q):
+        """
+        Approximate q-quantile(s), 0 <= q <= 1 (NaN for an empty sketch).
+
+        Returns the representative value of the bin holding the lower rank
+        floor(q * (count - 1)), clipped to the exact min/max.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if self.count == 0:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+
+        ranks = np.floor(q * (self.count - 1))
+        positions = np.searchsorted(np.cumsum(self._counts), ranks, side='right')
+        keys = self._keys[positions]
+        # Bin midpoint in the relative sense: within relative_accuracy of every value in the bin
+        magnitudes = (self.min_value * np.exp((np.abs(keys) - 1) * self._log_gamma)
+                      * 2 / (1 + np.exp(self._log_gamma)))
+        estimates = np.clip(np.sign(keys) * magnitudes, self.min, self.max)
+        return estimates if q.ndim else float(estimates)
+
+    @property
+    def n_bins(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return (f"QuantileSketch(count={self.count}, bins={self.n_bins}, "
+                f"relative_accuracy={self.relative_accuracy})")
+
+
+class FixedBinHistogram:
+    """
+    Mergeable counts of values in fixed-width bins.
+
+    Bin k covers [start + k * width, start + (k + 1) * width); values below
+    start and at or above the last edge go to an underflow and an overflow
+    bin, so every value is counted and the cumulative distribution ends
+    at 1. NaN values are skipped.
+
+    Usage:
+        histogram = FixedBinHistogram(-1.0, 5.0, 0.1)
+        for chunk in data_loader.iter_values(file_path):
+            histogram.update(chunk)
+        histogram.edges, histogram.counts
+
+    Parameters:
+    -----------
+    start : float
+        Lower edge of the first bin
+    stop : float
+        Upper edge of the last bin (rounded up to a whole number of bins)
+    width : float
+        Bin width
+    """
+
+    __slots__ = ('start', 'width', 'n_bins', 'counts')
+
+    def __init__(self, start: float, stop: float, width: float):
+        if width <= 0:
+            raise ValueError(f"Bin width must be positive, got {width}")
+        if stop <= start:
+            raise ValueError(f"Histogram range must be increasing, got ({start}, {stop})")
+        self.start = float(start)
+        self.width = float(width)
+        self.n_bins = int(np.ceil((stop - start) / width - 1e-9))
+        # [underflow, bin 0, ..., bin n_bins - 1, overflow]
+        self.counts = np.zeros(self.n_bins + 2, dtype=np.int64)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """The n_bins + 1 bin edges."""
+        return self.start + self.width * np.arange(self.n_bins + 1)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values: np.ndarray) -> 'FixedBinHistogram':
+        """
+        Add a chunk of values.
+
+        Raises:
+        -------
+        ValueError : If the chunk is not numeric
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in 'fiub':
+            raise ValueError("values are not numeric")
+        if values.dtype.kind == 'f':
+            values = values[~np.isnan(values)]
+        # Index 0 = underflow, k + 1 = bin k, n_bins + 1 = overflow
+        indices = np.searchsorted(self.edges, values, side='right')
+        self.counts += np.bincount(indices, minlength=len(self.counts))
+        return self
+
+    def merge(self, other: 'FixedBinHistogram') -> 'FixedBinHistogram':
+        """Add the counts of a histogram with the same bins."""
+        if (other.start, other.width, other.n_bins) != (self.start, self.width, self.n_bins):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+        return self
+
+    def __repr__(self) -> str:
+        return (f"FixedBinHistogram({self.n_bins} bins of {self.width:g} from {self.start:g}, "
+                f"count={self.count})")
@@ -2,23 +2,44 @@
 Volume and Sphericity Metrics Analysis Module
 
 Analyzes volume and sphericity statistics for organelles from Imaris-generated
-CSV files.
+CSV files. The values of all cells of an organelle are read in parallel and
+reduced per cell in one pass over a flat array (np.add.reduceat).
+Optional extended statistics (min, median, SD, percentiles, volume size
+classes) are computed from the same arrays.
 
 Author: Philipp Kaintoch
 Date: 2025-11-18
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict
-from .data_loader import DataLoader
+from typing import Dict, List, Optional, Sequence
+from .data_loader import DataLoader, open_dataset
+from .worker_pool import WorkerPool
+from .streaming import DEFAULT_CHUNK_ROWS, RunningStats
 from ..utils.logging_config import get_logger
 from ..utils.sorting import sort_cell_ids
 from ..utils.metadata import generate_base_metadata
 
 logger = get_logger(__name__)
 
+METRIC_ROWS = [
+    'Mean_Sphericity', 'Count_Sphericity',
+    'Mean_Volume', 'Count_Volume', 'Total_Volume', 'Max_Volume'
+]
+
+# Extended statistics, exported as '<statistic>_Sphericity' and '<statistic>_Volume'
+# rows; 'P<q>' is the q-th percentile (linear interpolation, as pandas)
+EXTENDED_STATISTICS = ('Min', 'Median', 'SD')
+DEFAULT_EXTENDED_STATISTICS = ('Min', 'Median', 'SD', 'P10', 'P90')
+# Volume size class edges in um^3 (classes [edge_i, edge_i+1), open at both ends)
+DEFAULT_VOLUME_CLASSES = (0.1, 1.0, 10.0)
+_PERCENTILE_PATTERN = re.compile(r'^P(\d+(?:\.\d+)?)$')
+
 
 class VolSpherMetricsAnalyzer:
     """
@@ -29,22 +50,108 @@ class VolSpherMetricsAnalyzer:
     Excel file with one sheet per organelle:
     - Rows: Metrics (Mean_Sphericity, Count_Sphericity, Mean_Volume, Count_Volume, Total_Volume, Max_Volume)
     - Columns: Cells (numerically sorted)
+    - Optional extra rows: extended statistics (e.g., Median_Volume,
+      SD_Sphericity, P90_Volume) and volume size class counts
+      (e.g., Count_Volume_0.1-1)
     """
 
-    def __init__(self, input_dir: str):
+    def __init__(self, input_dir: str, data_loader: Optional[DataLoader] = None,
+                 worker_pool: Optional[WorkerPool] = None,
+                 streaming: bool = False, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 max_threads: Optional[int] = None, statistics: Sequence[str] = (),
+                 volume_classes: Optional[Sequence[float]] = None):
+        """
+        Parameters:
+        -----------
+        input_dir : str
+            Path to the Imaris export (or a packed store / archive / .ims files)
+        data_loader : DataLoader, optional
+            Already scanned loader to reuse
+        worker_pool : WorkerPool, optional
+            Process pool; metric files are read in worker processes
+        streaming : bool
+            Read metric files in chunks and keep running sums only (one cell at a time)
+        chunk_rows : int
+            Rows per chunk in streaming mode
+        max_threads : int, optional
+            Reader threads without a worker_pool (default: CPU count, at most 8)
+        statistics : Sequence[str]
+            Extended statistics for Volume and Sphericity: 'Min', 'Median',
+            'SD' (ddof=1, as pandas) and percentiles 'P<q>' (e.g., 'P90');
+            see DEFAULT_EXTENDED_STATISTICS. Not available in streaming mode.
+        volume_classes : Sequence[float], optional
+            Increasing volume class edges in um^3 (e.g., DEFAULT_VOLUME_CLASSES);
+            adds one object count row per class. Not available in streaming mode.
+        """
         self.input_dir = Path(input_dir)
         if not self.input_dir.exists():
             raise FileNotFoundError(f"Input directory does not exist: {self.input_dir}")
 
-        self.data_loader = DataLoader(input_dir)
+        # Reuse an already scanned loader (e.g., from the GUI pre-scan) if given
+        self.data_loader = data_loader if data_loader is not None else open_dataset(input_dir)
+        # Optional process pool for per-cell work
+        self.worker_pool = worker_pool
+        # Streaming mode: read metric files in chunks, keep running sums only
+        self.streaming = streaming
+        self.chunk_rows = chunk_rows
+        self.max_threads = max_threads or min(8, os.cpu_count() or 1)
+        self.statistics = self._validated_statistics(statistics)
+        if volume_classes is not None:
+            volume_classes = [float(edge) for edge in volume_classes]
+            if not volume_classes or np.any(np.diff(volume_classes) <= 0):
+                raise ValueError(f"Volume class edges must be increasing, got {volume_classes}")
+        self.volume_classes = volume_classes
         self.results = {}
         self.metadata = {}
 
+    def __getstate__(self):
+        # Sent to worker processes: only the loader and settings are needed
+        state = self.__dict__.copy()
+        state['worker_pool'] = None
+        state['results'] = {}
+        return state
+
+    @staticmethod
+    def _validated_statistics(statistics: Sequence[str]) -> List[str]:
+        validated = []
+        for statistic in statistics:
+            match = _PERCENTILE_PATTERN.match(statistic)
+            if statistic not in EXTENDED_STATISTICS and not (match and float(match.group(1)) <= 100):
+                raise ValueError(
+                    f"Unknown statistic '{statistic}' (use {', '.join(EXTENDED_STATISTICS)} or P0-P100)"
+                )
+            validated.append(statistic)
+        return validated
+
+    @property
+    def has_extended_statistics(self) -> bool:
+        return bool(self.statistics) or self.volume_classes is not None
+
+    def _volume_class_rows(self) -> List[str]:
+        edges = [f"{edge:g}" for edge in self.volume_classes]
+        return (
+            [f"Count_Volume_<{edges[0]}"]
+            + [f"Count_Volume_{low}-{high}" for low, high in zip(edges[:-1], edges[1:])]
+            + [f"Count_Volume_>={edges[-1]}"]
+        )
+
+    def metric_rows(self) -> List[str]:
+        """Row order of the result tables (extended rows only without streaming)."""
+        rows = list(METRIC_ROWS)
+        if self.streaming:
+            return rows
+        for metric in ("Sphericity", "Volume"):
+            rows.extend(f"{statistic}_{metric}" for statistic in self.statistics)
+        if self.volume_classes is not None:
+            rows.extend(self._volume_class_rows())
+        return rows
+
     def load_data(self):
         """Load and validate data using DataLoader."""
         logger.info("Loading data...")
-        self.data_loader.detect_structure()
-        self.data_loader.find_cell_folders()
+        if not self.data_loader._is_validated:
+            self.data_loader.detect_structure()
+            self.data_loader.find_cell_folders()
 
         summary = self.data_loader.get_summary()
         for line in summary.split('\n'):
@@ -58,38 +165,90 @@ class VolSpherMetricsAnalyzer:
         Raises ValueError if data validation fails.
         """
         try:
-            df = pd.read_csv(file_path, skiprows=4, header=None, encoding='utf-8')
+            values = self.data_loader.read_values(file_path).dropna()
+            return self._validate_metric(values, metric_name, file_path.name)
+
+        except pd.errors.EmptyDataError:
+            raise ValueError(f"File is empty or has no data: {file_path.name}")
+        except Exception as e:
+            raise IOError(f"Failed to read {file_path.name}: {e}")
 
-            if df.shape[1] < 1:
-                raise ValueError(f"File has no columns: {file_path.name}")
-            if df.shape[0] < 1:
-                raise ValueError(f"File has no data rows: {file_path.name}")
+    def load_object_metric(self, cell_id: str, organelle: str, file_path: Path,
+                           metric_name: str) -> pd.Series:
+        """
+        Same as load_metric_file(), reading the column of the loader's
+        per-object table (shared with other analyses on the same loader).
+        """
+        table = self.data_loader.object_table(cell_id, organelle, [metric_name])
+        if metric_name not in table.columns:
+            raise IOError(f"Failed to read {file_path.name}")
+        try:
+            return self._validate_metric(table[metric_name].dropna(), metric_name, file_path.name)
+        except Exception as e:
+            raise IOError(f"Failed to read {file_path.name}: {e}")
 
-            values = df.iloc[:, 0].dropna()
+    @staticmethod
+    def _validate_metric(values: pd.Series, metric_name: str, file_name: str) -> pd.Series:
+        """Validation of load_metric_file() on values without NaN."""
+        if len(values) == 0:
+            raise ValueError(f"No valid {metric_name} values in {file_name}")
+        if not pd.api.types.is_numeric_dtype(values):
+            raise ValueError(f"{metric_name} data is not numeric in {file_name}")
+        if np.isinf(values).any():
+            raise ValueError(f"Infinite {metric_name} values found in {file_name}")
+
+        if metric_name == "Sphericity":
+            if (values < 0).any() or (values > 1).any():
+                logger.warning(
+                    f"Sphericity values outside expected range [0, 1] in {file_name}. "
+                    f"Min: {values.min():.3f}, Max: {values.max():.3f}"
+                )
+        elif metric_name == "Volume":
+            if (values < 0).any():
+                raise ValueError(f"Negative volume values found in {file_name}")
+            if (values > 1000).any():
+                logger.warning(
+                    f"Unusually large volume values (>1000 um^3) in {file_name}. "
+                    f"Max: {values.max():.3f}"
+                )
+
+        return values
+
+    def stream_metric_file(self, file_path: Path, metric_name: str) -> RunningStats:
+        """
+        Streaming counterpart of load_metric_file() with the same validation.
 
-            if len(values) == 0:
+        Raises ValueError if data validation fails.
+        """
+        try:
+            stats = RunningStats()
+            for chunk in self.data_loader.iter_values(file_path, self.chunk_rows):
+                try:
+                    stats.update(chunk)
+                except ValueError:
+                    raise ValueError(f"{metric_name} data is not numeric in {file_path.name}")
+
+            if stats.count == 0:
                 raise ValueError(f"No valid {metric_name} values in {file_path.name}")
-            if not pd.api.types.is_numeric_dtype(values):
-                raise ValueError(f"{metric_name} data is not numeric in {file_path.name}")
-            if np.isinf(values).any():
+            if stats.has_inf:
                 raise ValueError(f"Infinite {metric_name} values found in {file_path.name}")
 
             if metric_name == "Sphericity":
-                if (values < 0).any() or (values > 1).any():
+                if stats.min < 0 or stats.max > 1:
                     logger.warning(
                         f"Sphericity values outside expected range [0, 1] in {file_path.name}. "
-                        f"Min: {values.min():.3f}, Max: {values.max():.3f}"
+                        f"Min: {stats.min:.3f}, Max: {stats.max:.3f}"
                     )
             elif metric_name == "Volume":
-                if (values < 0).any():
+                if stats.min < 0:
                     raise ValueError(f"Negative volume values found in {file_path.name}")
-                if (values > 1000).any():
+                if stats.max > 1000:
                     logger.warning(
                         f"Unusually large volume values (>1000 um^3) in {file_path.name}. "
-                        f"Max: {values.max():.3f}"
+                        f"Max: {stats.max:.3f}"
                     )
 
-            return values
+            return stats
 
         except pd.errors.EmptyDataError:
             raise ValueError(f"File is empty or has no data: {file_path.name}")
@@ -110,67 +269,232 @@ class VolSpherMetricsAnalyzer:
 
         logger.info(f"Found {len(cells)} cells for {organelle}")
 
-        results_dict = {}
+        if not self.streaming:
+            df = self._analyze_organelle_batch(cells, organelle)
+        else:
+            if self.worker_pool is not None:
+                cell_results = self.worker_pool.map_method(
+                    self, 'analyze_cell', [(cell_id, organelle) for cell_id in cells]
+                )
+            else:
+                cell_results = (self.analyze_cell(cell_id, organelle) for cell_id in cells)
 
-        for cell_id in cells:
-            folder = self.data_loader.get_folder_path(cell_id, organelle)
-            if folder is None:
-                continue
+            results_dict = {
+                cell_id: cell_metrics
+                for cell_id, cell_metrics in zip(cells, cell_results)
+                if cell_metrics is not None
+            }
+            df = pd.DataFrame(results_dict)
 
-            volume_file = folder / f"{cell_id}_{organelle}_Volume.csv"
-            sphericity_file = folder / f"{cell_id}_{organelle}_Sphericity.csv"
+        if not df.empty:
+            df = df[sort_cell_ids(list(df.columns))]
+            df = df.reindex(self.metric_rows())
 
-            cell_metrics = {}
+        return df
 
-            # Volume metrics
-            if volume_file.exists():
-                try:
-                    volumes = self.load_metric_file(volume_file, "Volume")
-                    cell_metrics['Mean_Volume'] = volumes.mean()
-                    cell_metrics['Count_Volume'] = len(volumes)
-                    cell_metrics['Total_Volume'] = volumes.sum()
-                    cell_metrics['Max_Volume'] = volumes.max()
-                except Exception as e:
-                    logger.error(f"Failed to process {volume_file.name}: {e}")
-                    cell_metrics['Mean_Volume'] = np.nan
-                    cell_metrics['Count_Volume'] = 0
-                    cell_metrics['Total_Volume'] = np.nan
-                    cell_metrics['Max_Volume'] = np.nan
+    def _analyze_organelle_batch(self, cells: List[str], organelle: str) -> pd.DataFrame:
+        """
+        Metrics of all cells from one flat array per metric.
+
+        Files are read in the worker pool (or reader threads); the values of
+        all cells are concatenated and every metric is computed with one
+        segmented reduction per metric instead of per-cell Series operations.
+        Extended statistics use one segmented sort of the same arrays.
+        """
+        if self.worker_pool is not None:
+            cell_values = list(self.worker_pool.map_method(
+                self, 'load_cell_values', [(cell_id, organelle) for cell_id in cells]
+            ))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_threads,
+                                    thread_name_prefix='volspher-read') as executor:
+                cell_values = list(executor.map(
+                    lambda cell_id: self.load_cell_values(cell_id, organelle), cells
+                ))
+
+        loaded = [(cell_id, values) for cell_id, values in zip(cells, cell_values) if values is not None]
+        if not loaded:
+            return pd.DataFrame()
+
+        rows = {}
+        for metric in ("Volume", "Sphericity"):
+            rows.update(self._segment_stats([values[metric] for _, values in loaded], metric))
+
+        row_order = self.metric_rows()
+        return pd.DataFrame(
+            np.vstack([rows[row] for row in row_order]).astype(np.float64),
+            index=row_order, columns=[cell_id for cell_id, _ in loaded]
+        )
+
+    def _segment_stats(self, arrays: List[Optional[np.ndarray]], metric: str) -> Dict[str, np.ndarray]:
+        """
+        Per-array statistics of one metric via segmented reductions.
+
+        Count, total, mean and max use np.add/np.maximum.reduceat over the
+        concatenated values. Extended statistics sort the values once within
+        each array (np.lexsort on cell code and value), so quantiles are
+        plain index lookups. Arrays that are None (missing or invalid file)
+        or empty give count 0 and NaN for the other statistics.
+
+        Returns:
+        --------
+        Dict[str, np.ndarray] : row name (e.g., 'Mean_Volume') -> one value per array
+        """
+        counts = np.array([0 if values is None else len(values) for values in arrays], dtype=np.int64)
+        present = counts > 0
+        n_present = counts[present]
+
+        def per_array(values: np.ndarray) -> np.ndarray:
+            result = np.full(len(arrays), np.nan)
+            result[present] = values
+            return result
+
+        if present.any():
+            flat = np.concatenate([values for values in arrays if values is not None and len(values)])
+        else:
+            flat = np.empty(0)
+        # Segments of the non-empty arrays only; empty ones stay NaN via per_array
+        starts = np.cumsum(n_present) - n_present
+        reduce = len(flat) > 0
+
+        sums = np.add.reduceat(flat, starts) if reduce else np.empty(0)
+        means = sums / n_present
+        stats = {
+            f'Count_{metric}': counts,
+            f'Total_{metric}': per_array(sums),
+            f'Mean_{metric}': per_array(means),
+            f'Max_{metric}': per_array(np.maximum.reduceat(flat, starts) if reduce else np.empty(0)),
+        }
+
+        if self.streaming or not self.has_extended_statistics:
+            return stats
+
+        codes = np.repeat(np.arange(len(n_present)), n_present)
+        ordered = flat[np.lexsort((flat, codes))]
+        for statistic in self.statistics:
+            if statistic == 'Min':
+                values = ordered[starts]
+            elif statistic == 'Median':
+                values = self._segment_quantile(ordered, starts, n_present, 0.5)
+            elif statistic == 'SD':
+                deviations = flat - np.repeat(means, n_present)
+                squares = np.add.reduceat(deviations * deviations, starts) if reduce else np.empty(0)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    values = np.where(n_present > 1, np.sqrt(squares / (n_present - 1)), np.nan)
             else:
-                logger.warning(f"Missing volume file for {cell_id} ({organelle})")
+                q = float(_PERCENTILE_PATTERN.match(statistic).group(1)) / 100
+                values = self._segment_quantile(ordered, starts, n_present, q)
+            stats[f'{statistic}_{metric}'] = per_array(values)
+
+        if metric == 'Volume' and self.volume_classes is not None:
+            n_classes = len(self.volume_classes) + 1
+            classes = np.searchsorted(self.volume_classes, flat, side='right')
+            class_counts = np.zeros((len(arrays), n_classes), dtype=np.int64)
+            class_counts[present] = np.bincount(
+                codes * n_classes + classes, minlength=len(n_present) * n_classes
+            ).reshape(len(n_present), n_classes)
+            stats.update(zip(self._volume_class_rows(), class_counts.T))
+
+        return stats
+
+    @staticmethod
+    def _segment_quantile(ordered: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                          q: float) -> np.ndarray:
+        """
+        q-quantile of each sorted segment, interpolated linearly between
+        the closest ranks (same result as Series.quantile).
+        """
+        position = q * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, counts - 1)
+        fraction = position - lower
+        low = ordered[starts + lower]
+        high = ordered[starts + upper]
+        # np.quantile's interpolation: from the nearer rank for stability
+        difference = high - low
+        return np.where(fraction >= 0.5, high - difference * (1 - fraction), low + difference * fraction)
+
+    def load_cell_values(self, cell_id: str, organelle: str) -> Optional[Dict[str, Optional[np.ndarray]]]:
+        """
+        Validated Volume and Sphericity values of one cell and organelle.
+
+        Returns None if the cell has no folder for this organelle; a metric
+        is None if its file is missing or fails validation (logged).
+        """
+        folder = self.data_loader.get_folder_path(cell_id, organelle)
+        if folder is None:
+            return None
+
+        cell_values = {}
+        for metric in ("Volume", "Sphericity"):
+            file_path = self.data_loader.get_metric_file(cell_id, organelle, metric)
+            if file_path is None:
+                logger.warning(f"Missing {metric.lower()} file for {cell_id} ({organelle})")
+                cell_values[metric] = None
+                continue
+            try:
+                values = self.load_object_metric(cell_id, organelle, file_path, metric)
+                cell_values[metric] = values.to_numpy(dtype=np.float64)
+            except Exception as e:
+                logger.error(f"Failed to process {file_path.name}: {e}")
+                cell_values[metric] = None
+
+        return cell_values
+
+    def analyze_cell(self, cell_id: str, organelle: str) -> Optional[Dict[str, float]]:
+        """
+        Compute volume and sphericity metrics for one cell and organelle
+        from streamed files (streaming mode; otherwise analyze_organelle()
+        computes all cells at once, see _analyze_organelle_batch).
+
+        Returns None if the cell has no folder for this organelle.
+        """
+        folder = self.data_loader.get_folder_path(cell_id, organelle)
+        if folder is None:
+            return None
+
+        volume_file = self.data_loader.get_metric_file(cell_id, organelle, "Volume")
+        sphericity_file = self.data_loader.get_metric_file(cell_id, organelle, "Sphericity")
+
+        cell_metrics = {}
+
+        # Volume metrics
+        if volume_file is not None:
+            try:
+                stats = self.stream_metric_file(volume_file, "Volume")
+                cell_metrics['Mean_Volume'] = stats.mean
+                cell_metrics['Count_Volume'] = stats.count
+                cell_metrics['Total_Volume'] = stats.sum
+                cell_metrics['Max_Volume'] = stats.max
+            except Exception as e:
+                logger.error(f"Failed to process {volume_file.name}: {e}")
                 cell_metrics['Mean_Volume'] = np.nan
                 cell_metrics['Count_Volume'] = 0
                 cell_metrics['Total_Volume'] = np.nan
                 cell_metrics['Max_Volume'] = np.nan
-
-            # Sphericity metrics
-            if sphericity_file.exists():
-                try:
-                    sphericity = self.load_metric_file(sphericity_file, "Sphericity")
-                    cell_metrics['Mean_Sphericity'] = sphericity.mean()
-                    cell_metrics['Count_Sphericity'] = len(sphericity)
-                except Exception as e:
-                    logger.error(f"Failed to process {sphericity_file.name}: {e}")
-                    cell_metrics['Mean_Sphericity'] = np.nan
-                    cell_metrics['Count_Sphericity'] = 0
-            else:
-                logger.warning(f"Missing sphericity file for {cell_id} ({organelle})")
+        else:
+            logger.warning(f"Missing volume file for {cell_id} ({organelle})")
+            cell_metrics['Mean_Volume'] = np.nan
+            cell_metrics['Count_Volume'] = 0
+            cell_metrics['Total_Volume'] = np.nan
+            cell_metrics['Max_Volume'] = np.nan
+
+        # Sphericity metrics
+        if sphericity_file is not None:
+            try:
+                stats = self.stream_metric_file(sphericity_file, "Sphericity")
+                cell_metrics['Mean_Sphericity'] = stats.mean
+                cell_metrics['Count_Sphericity'] = stats.count
+            except Exception as e:
+                logger.error(f"Failed to process {sphericity_file.name}: {e}")
                 cell_metrics['Mean_Sphericity'] = np.nan
                 cell_metrics['Count_Sphericity'] = 0
+        else:
+            logger.warning(f"Missing sphericity file for {cell_id} ({organelle})")
+            cell_metrics['Mean_Sphericity'] = np.nan
+            cell_metrics['Count_Sphericity'] = 0
 
-            results_dict[cell_id] = cell_metrics
-
-        df = pd.DataFrame(results_dict)
-
-        if not df.empty:
-            df = df[sort_cell_ids(list(df.columns))]
-            row_order = [
-                'Mean_Sphericity', 'Count_Sphericity',
-                'Mean_Volume', 'Count_Volume', 'Total_Volume', 'Max_Volume'
-            ]
-            df = df.reindex(row_order)
-
-        return df
+        return cell_metrics
 
     def run(self, output_path: str, file_format: str = 'excel'):
         """Run the analysis for all organelles."""
@@ -185,6 +509,9 @@ class VolSpherMetricsAnalyzer:
         if not organelles:
             raise ValueError("No organelles detected")
 
+        if self.streaming and self.has_extended_statistics:
+            logger.warning("Extended statistics need all values in memory; skipped in low-memory mode")
+
         for organelle in organelles:
             logger.info(f"Analyzing organelle: {organelle}")
             df = self.analyze_organelle(organelle)
@@ -212,6 +539,11 @@ class VolSpherMetricsAnalyzer:
             analysis_type='Vol/Spher Metrics',
             Organelles_Analyzed=', '.join(sorted(self.results.keys())),
             Total_Cells=str(max(df.shape[1] for df in self.results.values()) if self.results else 0),
+            Extended_Statistics=', '.join(self.statistics) if self.statistics and not self.streaming else 'None',
+            Volume_Classes=(
+                ', '.join(f"{edge:g}" for edge in self.volume_classes)
+                if self.volume_classes is not None and not self.streaming else 'None'
+            ),
         )
         self.metadata = metadata
         return metadata
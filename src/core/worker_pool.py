@@ -0,0 +1,244 @@
+"""
+Persistent Worker Pool Module
+
+Keeps a pool of worker processes alive between analysis runs. Workers
+pre-import NumPy, pandas and the analysis modules when they start, so a
+second run in the same session starts computing immediately. Idle workers
+are shut down after a configurable timeout and respawned on demand.
+
+Log records of the workers are sent back through a queue and handed to
+the root logger's handlers in the main process (e.g., the GUI log).
+
+Author: Philipp Kaintoch
+"""
+
+import os
+import logging
+import logging.handlers
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _initialize_worker(log_queue=None):
+    """Forward log records to the main process and pre-import heavy modules."""
+    if log_queue is not None:
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    from . import preload
+    preload()
+
+
+class _RootLogHandler(logging.Handler):
+    """Hands records from worker processes to the main process's root handlers."""
+
+    def emit(self, record: logging.LogRecord):
+        # Module loggers of the worker already wrote to its console; only
+        # handlers attached to the root logger (e.g., the GUI log) get the record
+        for handler in logging.getLogger().handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _call_method_chunk(obj: Any, method_name: str, arg_chunk: Sequence[tuple]) -> List[Any]:
+    """Run obj.method(*args) for every args tuple in the chunk."""
+    method = getattr(obj, method_name)
+    return [method(*args) for args in arg_chunk]
+
+
+class WorkerPool:
+    """
+    Process pool shared by all analyzers of a session.
+
+    Usage:
+        pool = WorkerPool(idle_timeout=600)
+        analyzer = OneWayInteractionAnalyzer(input_dir, worker_pool=pool)
+        analyzer.run(output_path)
+        ...
+        pool.shutdown()
+
+    Notes:
+    ------
+    - Uses the 'spawn' start method on all platforms (fork is unsafe with
+      the Tk event loop and background threads)
+    - Objects sent to workers must be picklable; analyzers drop their
+      worker_pool reference and results when pickled
+    - Worker log records reach handlers attached to the root logger of the
+      main process, so warnings about individual files are not lost
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, idle_timeout: float = 600.0):
+        """
+        Parameters:
+        -----------
+        max_workers : int, optional
+            Number of worker processes (default: CPU count - 1, at least 1)
+        idle_timeout : float
+            Seconds without running tasks after which workers are shut down.
+            Use 0 or a negative value to keep them alive until shutdown().
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+
+        self._executor = None
+        self._log_listener = None
+        # Re-entrant: cancelling futures runs _task_finished in the calling thread
+        self._lock = threading.RLock()
+        self._active_tasks = 0
+        self._idle_timer = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        # Caller must hold self._lock
+        if self._executor is None:
+            logger.debug(f"Starting worker pool with {self.max_workers} process(es)")
+            context = multiprocessing.get_context('spawn')
+            log_queue = context.Queue()
+            self._log_listener = logging.handlers.QueueListener(log_queue, _RootLogHandler())
+            self._log_listener.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_initialize_worker,
+                initargs=(log_queue,),
+            )
+        return self._executor
+
+    def _stop_log_listener(self, listener: Optional[logging.handlers.QueueListener]):
+        # Flushes records already queued by the workers
+        if listener is not None:
+            listener.stop()
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Submit fn(*args) to a worker process."""
+        with self._lock:
+            executor = self._ensure_executor()
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            self._active_tasks += 1
+            try:
+                future = executor.submit(fn, *args)
+            except BrokenProcessPool:
+                self._active_tasks -= 1
+                self._discard_executor()
+                raise
+        future.add_done_callback(self._task_finished)
+        return future
+
+    def map_method(self, obj: Any, method_name: str, arg_list: Iterable[tuple],
+                   chunksize: Optional[int] = None) -> Iterator[Any]:
+        """
+        Call obj.method_name(*args) in worker processes for each args tuple.
+
+        obj is pickled once per chunk, not once per call. Results are
+        yielded in input order as they become available.
+
+        Parameters:
+        -----------
+        obj : Any
+            Picklable object whose method is called
+        method_name : str
+            Name of the method to call
+        arg_list : Iterable[tuple]
+            Positional arguments for each call
+        chunksize : int, optional
+            Calls per task (default: spread over ~4 tasks per worker)
+        """
+        arg_list = [tuple(args) for args in arg_list]
+        if not arg_list:
+            return iter(())
+
+        if chunksize is None:
+            chunksize = max(1, -(-len(arg_list) // (4 * self.max_workers)))
+
+        futures = [
+            self.submit(_call_method_chunk, obj, method_name, arg_list[i:i + chunksize])
+            for i in range(0, len(arg_list), chunksize)
+        ]
+        return self._iter_results(futures)
+
+    def _iter_results(self, futures: List[Future]) -> Iterator[Any]:
+        try:
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool:
+            with self._lock:
+                self._discard_executor()
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def warm_up(self):
+        """Start all worker processes now (non-blocking)."""
+        for _ in range(self.max_workers):
+            self.submit(_ping)
+
+    def shutdown(self, wait: bool = True):
+        """Stop all worker processes. The pool restarts on the next submit."""
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            executor = self._executor
+            self._executor = None
+            listener = self._log_listener
+            self._log_listener = None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        self._stop_log_listener(listener)
+
+    def _task_finished(self, _future: Future):
+        with self._lock:
+            self._active_tasks -= 1
+            if self._active_tasks == 0 and self._executor is not None and self.idle_timeout > 0:
+                self._idle_timer = threading.Timer(self.idle_timeout, self._idle_shutdown)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def _idle_shutdown(self):
+        with self._lock:
+            if self._active_tasks > 0 or self._executor is None:
+                return
+            executor = self._executor
+            self._executor = None
+            self._idle_timer = None
+            listener = self._log_listener
+            self._log_listener = None
+        logger.debug(f"Worker pool idle for {self.idle_timeout:.0f} s, shutting down")
+        executor.shutdown(wait=True)
+        self._stop_log_listener(listener)
+
+    def _discard_executor(self):
+        # Caller must hold self._lock
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._stop_log_listener(self._log_listener)
+        self._log_listener = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
@@ -1,8 +1,8 @@
 """
 Bait Selection Dialog for N-Way Analysis
 
-Modal dialog for selecting a bait organelle after data has been loaded
-and organelles detected.
+Modal dialog for selecting a bait organelle (and optionally a subset of
+target organelles) after data has been loaded and organelles detected.
 
 Author: Philipp Kaintoch
 Date: 2025-11-18
@@ -23,18 +23,20 @@ class BaitSelectionDialog:
 
         if dialog.result:
             selected_baits = dialog.result
+            selected_targets = dialog.targets  # None = all other organelles
     """
 
     def __init__(self, parent: tk.Tk, available_organelles: List[str]):
         self.parent = parent
         self.available_organelles = sorted(available_organelles)
         self.result = None
+        self.targets = None
         self._create_dialog()
 
     def _create_dialog(self):
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Select Bait Organelle")
-        self.dialog.geometry("350x400")
+        self.dialog.geometry("420x420")
         self.dialog.resizable(False, False)
 
         self.dialog.transient(self.parent)
@@ -53,36 +55,48 @@ class BaitSelectionDialog:
             main_frame,
             text="Choose the organelle to use as bait.\n"
                  "The analysis will count contacts between\n"
-                 "the bait and all other organelles.",
+                 "the bait and the selected target organelles.",
             font=('Arial', 9),
             justify=tk.CENTER
         ).pack(pady=(0, 15))
 
-        selection_frame = ttk.LabelFrame(main_frame, text="Available Organelles", padding="10")
-        selection_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        lists_frame = ttk.Frame(main_frame)
+        lists_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+
+        selection_frame = ttk.LabelFrame(lists_frame, text="Bait", padding="10")
+        selection_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
 
         self.selection_var = tk.StringVar()
 
         for organelle in self.available_organelles:
             ttk.Radiobutton(
                 selection_frame, text=organelle,
-                variable=self.selection_var, value=organelle
+                variable=self.selection_var, value=organelle,
+                command=self._update_targets
             ).pack(anchor=tk.W, pady=2)
 
-        if self.available_organelles:
-            self.selection_var.set(self.available_organelles[0])
+        target_frame = ttk.LabelFrame(lists_frame, text="Targets", padding="10")
+        target_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
 
-        n_targets = len(self.available_organelles) - 1
-        if n_targets > 0:
-            n_combos = 2 ** n_targets
-            info_text = f"With {n_targets} target organelles, this will generate\n{n_combos} boolean combinations + 'No_contact'"
-        else:
-            info_text = "At least 2 organelles required for analysis"
-
-        ttk.Label(
-            main_frame, text=info_text, font=('Arial', 8),
+        self.target_vars = {}
+        self.target_checks = {}
+        for organelle in self.available_organelles:
+            var = tk.BooleanVar(value=True)
+            check = ttk.Checkbutton(target_frame, text=organelle, variable=var,
+                                    command=self._update_info)
+            check.pack(anchor=tk.W, pady=2)
+            self.target_vars[organelle] = var
+            self.target_checks[organelle] = check
+
+        self.info_label = ttk.Label(
+            main_frame, text="", font=('Arial', 8),
             foreground='#666666', justify=tk.CENTER
-        ).pack(pady=(0, 10))
+        )
+        self.info_label.pack(pady=(0, 10))
+
+        if self.available_organelles:
+            self.selection_var.set(self.available_organelles[0])
+        self._update_targets()
 
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
@@ -108,9 +122,36 @@ class BaitSelectionDialog:
         y = parent_y + (parent_height - dialog_height) // 2
         self.dialog.geometry(f"+{x}+{y}")
 
+    def _selected_targets(self) -> List[str]:
+        bait = self.selection_var.get()
+        return [org for org, var in self.target_vars.items() if var.get() and org != bait]
+
+    def _update_targets(self):
+        # The bait is never its own target
+        bait = self.selection_var.get()
+        for organelle, check in self.target_checks.items():
+            check.state(['disabled'] if organelle == bait else ['!disabled'])
+        self._update_info()
+
+    def _update_info(self):
+        n_targets = len(self._selected_targets())
+        if n_targets > 0:
+            n_combos = 2 ** n_targets
+            info_text = f"With {n_targets} target organelles, this will generate\n{n_combos} boolean combinations + 'No_contact'"
+        else:
+            info_text = "At least 1 target organelle required for analysis"
+        self.info_label.config(text=info_text)
+
     def _on_ok(self):
         selected = self.selection_var.get()
-        self.result = [selected] if selected else None
+        targets = self._selected_targets()
+        if not selected or not targets:
+            return
+
+        self.result = [selected]
+        # None = all other organelles (also picks up targets missing in some cells)
+        other_organelles = [org for org in self.available_organelles if org != selected]
+        self.targets = None if targets == other_organelles else targets
         self.dialog.destroy()
 
     def _on_cancel(self):
@@ -0,0 +1,111 @@
+"""
+Background Dataset Pre-Scan
+
+Runs DataLoader discovery in a worker thread as soon as an input directory
+is selected, so the dataset summary can be shown immediately and the
+"Run Analysis" step can reuse the scanned loader.
+
+Author: Philipp Kaintoch
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+
+class DatasetPrescan:
+    """
+    Discovers a dataset in the background.
+
+    Usage:
+        scan = DatasetPrescan(input_dir, on_done=callback)
+        scan.start()
+        ...
+        loader = scan.get_loader()  # waits for discovery, None on failure
+
+    The callback is invoked from the worker thread with the scan object once
+    discovery finished (successfully or not). Header prefetching continues
+    afterwards and does not delay get_loader().
+    """
+
+    def __init__(self, input_dir: str, on_done: Optional[Callable] = None,
+                 prefetch_headers: bool = True):
+        self.input_dir = input_dir
+        self.on_done = on_done
+        self.prefetch_headers = prefetch_headers
+
+        self.loader = None
+        self.stats = None
+        self.error = None
+
+        self._discovered = threading.Event()
+        self._cancelled = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop header prefetching; discovery results already obtained are kept."""
+        self._cancelled.set()
+
+    def matches(self, input_dir: str) -> bool:
+        return str(input_dir) == str(self.input_dir)
+
+    def get_loader(self, timeout: Optional[float] = None):
+        """
+        Wait for discovery and return the scanned DataLoader.
+
+        Returns:
+        --------
+        DataLoader or None : None if discovery failed or timed out
+        """
+        if not self._discovered.wait(timeout):
+            return None
+        return self.loader if self.error is None else None
+
+    def _run(self):
+        try:
+            from ..core.data_loader import open_dataset
+
+            loader = open_dataset(self.input_dir)
+            loader.detect_structure()
+            loader.find_cell_folders()
+            self.stats = loader.get_dataset_stats()
+            self.loader = loader
+        except Exception as e:
+            self.error = e
+        finally:
+            self._discovered.set()
+
+        if self.on_done is not None and not self._cancelled.is_set():
+            self.on_done(self)
+
+        if self.error is None and self.prefetch_headers:
+            try:
+                self.loader.prefetch_headers(stop_event=self._cancelled)
+            except Exception:
+                logging.getLogger(__name__).debug("Header prefetch failed", exc_info=True)
+
+    def describe(self) -> str:
+        """One-line dataset summary for display."""
+        if self.error is not None:
+            return f"Not a valid dataset: {self.error}"
+        if self.loader is None:
+            return "Scanning dataset..."
+
+        organelles = self.loader.all_organelles
+        return (
+            f"{len(self.loader.unique_cells)} cells, "
+            f"{len(organelles)} organelles ({', '.join(organelles)}), "
+            f"{self.stats['files']} files, {_format_bytes(self.stats['bytes'])}"
+        )
+
+
+def _format_bytes(n_bytes: int) -> str:
+    size = float(n_bytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
@@ -15,14 +15,21 @@ import threading
 from pathlib import Path
 from datetime import datetime
 
-from ..core.one_way_interaction import OneWayInteractionAnalyzer
-from ..core.vol_spher_metrics import VolSpherMetricsAnalyzer
-from ..core.nway_interaction import NWayInteractionAnalyzer
-from ..core.radial_distribution import RadialDistributionAnalyzer
+# Analyzers (and with them pandas/NumPy) are imported on demand inside
+# run_analysis_thread and warmed up in the background, see _preload_modules().
 from .bait_selection_dialog import BaitSelectionDialog
 from .radial_distribution_dialog import RadialDistributionDialog
+from .dataset_prescan import DatasetPrescan
+from ..core.worker_pool import WorkerPool
+from ..utils.profiling import profile_section
 from ..__version__ import __version__
 
+# Single-file inputs: packed store, zip/tar archive of an export, Imaris file
+DATASET_FILE_TYPES = [
+    ("Dataset files", "*.orgaplex *.zip *.tar *.tar.gz *.tgz *.tar.bz2 *.tar.xz *.ims"),
+    ("All files", "*.*"),
+]
+
 
 class GUILogHandler(logging.Handler):
     """Redirects log records to a GUI callback."""
@@ -75,7 +82,8 @@ class ToolTip:
 class OrganelleAnalysisGUI:
     """Main GUI window for organelle analysis software."""
 
-    def __init__(self, root):
+    def __init__(self, root, profile: bool = False, workers: int = None,
+                 worker_idle_timeout: float = 600.0):
         self.root = root
         self.root.title(f"Organelle Analysis Software v{__version__}")
         self.root.geometry("850x720")
@@ -85,11 +93,39 @@ class OrganelleAnalysisGUI:
         self.output_dir = tk.StringVar()
         self.file_format = tk.StringVar(value='excel')
         self.analysis_type = tk.StringVar(value='one_way')
+        self.profile_enabled = tk.BooleanVar(value=profile)
+        self.streaming_enabled = tk.BooleanVar(value=False)
+        self.nway_inclusive = tk.BooleanVar(value=False)
+        self.nway_co_contacts = tk.BooleanVar(value=False)
+        self.nway_sparse = tk.BooleanVar(value=False)
+        self.extended_statistics = tk.BooleanVar(value=False)
+        self.dataset_info = tk.StringVar(value="")
+        self._prescan = None
+
+        # Process pool kept alive across runs and shared by all analyzers;
+        # workers start when a dataset is selected and stop after idling
+        self.worker_pool = WorkerPool(max_workers=workers, idle_timeout=worker_idle_timeout)
 
         self.output_dir.set(str(Path.home()))
         self.setup_ui()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Start warming up heavy imports once the window has been drawn
+        self.root.after(200, self._start_background_imports)
+
+    def _start_background_imports(self):
+        threading.Thread(target=self._preload_modules, daemon=True).start()
+
+    @staticmethod
+    def _preload_modules():
+        """Import analysis modules, pandas, NumPy and openpyxl off the UI thread."""
+        try:
+            from .. import core
+            core.preload()
+            import openpyxl  # noqa: F401 - used by pandas for .xlsx export
+        except Exception:
+            logging.getLogger(__name__).debug("Background import warm-up failed", exc_info=True)
+
     def setup_ui(self):
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -110,9 +146,21 @@ class OrganelleAnalysisGUI:
         ttk.Entry(main_frame, textvariable=self.input_dir, width=50).grid(
             row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
 
-        input_browse_btn = ttk.Button(main_frame, text="Browse...", command=self.browse_input_dir)
-        input_browse_btn.grid(row=row, column=2, padx=(5, 0), pady=(0, 5))
-        ToolTip(input_browse_btn, "Select folder containing *_Statistics directories from Imaris")
+        input_buttons = ttk.Frame(main_frame)
+        input_buttons.grid(row=row, column=2, padx=(5, 0), pady=(0, 5))
+
+        input_browse_btn = ttk.Button(input_buttons, text="Browse...", command=self.browse_input_dir)
+        input_browse_btn.pack(side=tk.LEFT)
+        ToolTip(input_browse_btn, "Select folder containing *_Statistics directories (or .ims files) from Imaris")
+
+        input_file_btn = ttk.Button(input_buttons, text="File...", command=self.browse_input_file)
+        input_file_btn.pack(side=tk.LEFT, padx=(5, 0))
+        ToolTip(input_file_btn, "Select a dataset file: packed store (.orgaplex), "
+                                "zip/tar archive of an export, or Imaris .ims file")
+
+        row += 1
+        ttk.Label(main_frame, textvariable=self.dataset_info, font=('Arial', 9),
+                  foreground='#666666').grid(row=row, column=0, columnspan=3, sticky=tk.W)
 
         # Output Directory
         row += 1
@@ -152,6 +200,15 @@ class OrganelleAnalysisGUI:
         volspher_radio.pack(side=tk.LEFT, padx=5)
         ToolTip(volspher_radio, "Calculate volume and sphericity statistics per organelle")
 
+        extended_check = ttk.Checkbutton(analysis_frame, text="Extended statistics",
+                                         variable=self.extended_statistics)
+        extended_check.pack(side=tk.LEFT, padx=(20, 0))
+        ToolTip(extended_check, "One-Way: also export approximate 10th/50th/90th distance percentiles "
+                                "per cell and pooled per condition, and distance histograms "
+                                "(-1 to 5 um, 0.1 um bins). Vol/Spher: also export min, median, "
+                                "SD, 10th/90th percentiles and volume size class counts per cell "
+                                "(not in low-memory mode)")
+
         row += 1
         nway_frame = ttk.Frame(main_frame)
         nway_frame.grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=5)
@@ -168,6 +225,24 @@ class OrganelleAnalysisGUI:
         nway_batch_radio.pack(side=tk.LEFT, padx=5)
         ToolTip(nway_batch_radio, "Analyze ALL organelles as baits (generates one file per organelle)")
 
+        inclusive_check = ttk.Checkbutton(nway_frame, text="Inclusive counts",
+                                          variable=self.nway_inclusive)
+        inclusive_check.pack(side=tk.LEFT, padx=(20, 0))
+        ToolTip(inclusive_check, "Also export 'at least' counts per target combination, "
+                                 "including per-target totals (extra sheet / CSV file)")
+
+        co_contact_check = ttk.Checkbutton(nway_frame, text="Co-contact matrix",
+                                           variable=self.nway_co_contacts)
+        co_contact_check.pack(side=tk.LEFT, padx=(10, 0))
+        ToolTip(co_contact_check, "Also export a target x target matrix of surface points touching "
+                                  "both targets, per cell and averaged per condition")
+
+        sparse_check = ttk.Checkbutton(nway_frame, text="Observed patterns only",
+                                       variable=self.nway_sparse)
+        sparse_check.pack(side=tk.LEFT, padx=(10, 0))
+        ToolTip(sparse_check, "Long format (Cell_ID, Pattern, Count) listing only patterns that "
+                              "occur, instead of one column per combination (for many organelles)")
+
         row += 1
         radial_frame = ttk.Frame(main_frame)
         radial_frame.grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=5)
@@ -213,6 +288,18 @@ class OrganelleAnalysisGUI:
         viz_btn.pack(side=tk.LEFT)
         ToolTip(viz_btn, "Generate heatmaps from radial distribution output files")
 
+        profile_check = ttk.Checkbutton(viz_frame, text="Profile run",
+                                        variable=self.profile_enabled)
+        profile_check.pack(side=tk.LEFT, padx=(20, 0))
+        ToolTip(profile_check, "Save cProfile (.pstats) and flame-graph (.collapsed.txt) "
+                               "files to the output directory")
+
+        streaming_check = ttk.Checkbutton(viz_frame, text="Low-memory mode",
+                                          variable=self.streaming_enabled)
+        streaming_check.pack(side=tk.LEFT, padx=(20, 0))
+        ToolTip(streaming_check, "Read large files in chunks instead of loading them at once "
+                                 "(One-Way, Vol/Spher, N-Way)")
+
         row += 1
         ttk.Separator(main_frame, orient='horizontal').grid(
             row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=20)
@@ -258,6 +345,37 @@ class OrganelleAnalysisGUI:
         directory = filedialog.askdirectory(title="Select Input Directory")
         if directory:
             self.input_dir.set(directory)
+            self._start_prescan(directory)
+
+    def browse_input_file(self):
+        file_path = filedialog.askopenfilename(title="Select Dataset File", filetypes=DATASET_FILE_TYPES)
+        if file_path:
+            self.input_dir.set(file_path)
+            self._start_prescan(file_path)
+
+    def _start_prescan(self, directory: str):
+        """Discover the dataset in the background so Run Analysis can reuse it."""
+        if self._prescan is not None:
+            self._prescan.cancel()
+
+        self._prescan = DatasetPrescan(
+            directory,
+            on_done=lambda scan: self.root.after(0, self._on_prescan_done, scan)
+        )
+        self.dataset_info.set("Scanning dataset...")
+        self._prescan.start()
+        self.worker_pool.warm_up()
+
+    def _on_prescan_done(self, scan: DatasetPrescan):
+        # Ignore results from a scan that was superseded by a newer selection
+        if scan is self._prescan:
+            self.dataset_info.set(scan.describe())
+
+    def _get_prescanned_loader(self, input_dir: str):
+        """Return the pre-scanned DataLoader for input_dir, or None to scan afresh."""
+        if self._prescan is None or not self._prescan.matches(input_dir):
+            return None
+        return self._prescan.get_loader()
 
     def browse_output_dir(self):
         directory = filedialog.askdirectory(title="Select Output Directory")
@@ -285,10 +403,10 @@ class OrganelleAnalysisGUI:
 
     def validate_inputs(self) -> bool:
         if not self.input_dir.get():
-            messagebox.showerror("Error", "Please select an input directory")
+            messagebox.showerror("Error", "Please select an input directory or dataset file")
             return False
         if not Path(self.input_dir.get()).exists():
-            messagebox.showerror("Error", "Input directory does not exist")
+            messagebox.showerror("Error", "Input path does not exist")
             return False
         if not self.output_dir.get():
             messagebox.showerror("Error", "Please select an output directory")
@@ -321,29 +439,62 @@ class OrganelleAnalysisGUI:
                 output_dir = Path(self.output_dir.get())
                 file_format = self.file_format.get()
                 analysis_type = self.analysis_type.get()
+                profile = self.profile_enabled.get()
+                streaming = self.streaming_enabled.get()
+                data_loader = self._get_prescanned_loader(input_dir)
 
                 if analysis_type == 'one_way':
+                    from ..core.one_way_interaction import OneWayInteractionAnalyzer
+
                     if file_format == 'excel':
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         output_path = output_dir / f"One_Way_Interactions_{timestamp}.xlsx"
                     else:
                         output_path = output_dir / "One_Way_Interactions"
 
-                    analyzer = OneWayInteractionAnalyzer(input_dir)
-                    analyzer.run(str(output_path), file_format=file_format)
+                    from ..core.one_way_interaction import DEFAULT_HISTOGRAM_RANGE, DEFAULT_PERCENTILES
+
+                    extended = self.extended_statistics.get()
+                    analyzer = OneWayInteractionAnalyzer(
+                        input_dir, data_loader=data_loader, worker_pool=self.worker_pool,
+                        streaming=streaming,
+                        percentiles=DEFAULT_PERCENTILES if extended else (),
+                        histogram_range=DEFAULT_HISTOGRAM_RANGE if extended else None
+                    )
+                    with profile_section('one_way', output_dir, profile):
+                        analyzer.run(str(output_path), file_format=file_format)
 
                 elif analysis_type == 'vol_spher':
+                    from ..core.vol_spher_metrics import (
+                        VolSpherMetricsAnalyzer, DEFAULT_EXTENDED_STATISTICS, DEFAULT_VOLUME_CLASSES
+                    )
+
                     if file_format == 'excel':
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         output_path = output_dir / f"Vol_Spher_Metrics_{timestamp}.xlsx"
                     else:
                         output_path = output_dir / "Vol_Spher_Metrics"
 
-                    analyzer = VolSpherMetricsAnalyzer(input_dir)
-                    analyzer.run(str(output_path), file_format=file_format)
+                    extended = self.extended_statistics.get()
+                    analyzer = VolSpherMetricsAnalyzer(
+                        input_dir, data_loader=data_loader, worker_pool=self.worker_pool,
+                        streaming=streaming,
+                        statistics=DEFAULT_EXTENDED_STATISTICS if extended else (),
+                        volume_classes=DEFAULT_VOLUME_CLASSES if extended else None
+                    )
+                    with profile_section('vol_spher', output_dir, profile):
+                        analyzer.run(str(output_path), file_format=file_format)
 
                 elif analysis_type == 'nway_single':
-                    analyzer = NWayInteractionAnalyzer(input_dir, threshold=0.0)
+                    from ..core.nway_interaction import NWayInteractionAnalyzer
+
+                    analyzer = NWayInteractionAnalyzer(input_dir, threshold=0.0,
+                                                       data_loader=data_loader,
+                                                       worker_pool=self.worker_pool,
+                                                       streaming=streaming,
+                                                       inclusive_counts=self.nway_inclusive.get(),
+                                                       co_contacts=self.nway_co_contacts.get(),
+                                                       sparse_output=self.nway_sparse.get())
                     analyzer.load_data()
                     available_orgs = analyzer.get_available_organelles()
 
@@ -355,16 +506,28 @@ class OrganelleAnalysisGUI:
                     return
 
                 elif analysis_type == 'nway_batch':
+                    from ..core.nway_interaction import NWayInteractionAnalyzer
+
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     batch_output_dir = output_dir / f"NWay_Analysis_Batch_{timestamp}"
 
-                    analyzer = NWayInteractionAnalyzer(input_dir, threshold=0.0)
-                    output_files = analyzer.run(str(batch_output_dir), file_format=file_format)
+                    analyzer = NWayInteractionAnalyzer(input_dir, threshold=0.0,
+                                                       data_loader=data_loader,
+                                                       worker_pool=self.worker_pool,
+                                                       streaming=streaming,
+                                                       inclusive_counts=self.nway_inclusive.get(),
+                                                       co_contacts=self.nway_co_contacts.get(),
+                                                       sparse_output=self.nway_sparse.get())
+                    with profile_section('nway_batch', output_dir, profile):
+                        output_files = analyzer.run(str(batch_output_dir), file_format=file_format)
 
                     self.update_status(f"\n[SUCCESS] Created {len(output_files)} output files")
 
                 elif analysis_type == 'radial_distribution':
-                    analyzer = RadialDistributionAnalyzer(input_dir)
+                    from ..core.radial_distribution import RadialDistributionAnalyzer
+
+                    analyzer = RadialDistributionAnalyzer(input_dir, data_loader=data_loader,
+                                                          worker_pool=self.worker_pool)
                     analyzer.load_data()
                     available_orgs = analyzer.get_available_organelles()
 
@@ -408,6 +571,7 @@ class OrganelleAnalysisGUI:
         if dialog.result:
             selected_bait = dialog.result[0]
             self._nway_analyzer.set_bait_organelles([selected_bait])
+            self._nway_analyzer.set_target_organelles(dialog.targets)
 
             self.analysis_thread = threading.Thread(
                 target=self._continue_nway_analysis, daemon=False
@@ -430,12 +594,13 @@ class OrganelleAnalysisGUI:
                 bait_name = analyzer.bait_organelles[0] if analyzer.bait_organelles else "unknown"
                 final_output_dir = output_dir / f"NWay_Analysis_{bait_name}_{timestamp}"
 
-                analyzer.analyze_all_baits()
+                with profile_section('nway_single', output_dir, self.profile_enabled.get()):
+                    analyzer.analyze_all_baits()
 
-                if file_format == 'excel':
-                    output_files = analyzer.export_to_excel(str(final_output_dir))
-                else:
-                    output_files = analyzer.export_to_csv(str(final_output_dir))
+                    if file_format == 'excel':
+                        output_files = analyzer.export_to_excel(str(final_output_dir))
+                    else:
+                        output_files = analyzer.export_to_csv(str(final_output_dir))
 
                 self.update_status(f"\n[SUCCESS] Analysis complete! Created {len(output_files)} file(s)")
 
@@ -462,8 +627,9 @@ class OrganelleAnalysisGUI:
         self.root.wait_window(dialog.dialog)
 
         if dialog.result:
-            organelle, bin_width, max_distance = dialog.result
-            self._radial_analyzer.set_parameters(organelle, bin_width, max_distance)
+            organelles, bin_width, max_distance = dialog.result
+            self._radial_analyzer.set_parameters(organelles, bin_width, max_distance)
+            self._radial_heatmap = dialog.generate_heatmap
 
             self.analysis_thread = threading.Thread(
                 target=self._continue_radial_analysis, daemon=False
@@ -483,19 +649,27 @@ class OrganelleAnalysisGUI:
                 file_format = self._radial_file_format
 
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                organelle = analyzer.organelle
+                organelle = '_'.join(analyzer.organelles)
 
                 if file_format == 'excel':
                     output_path = output_dir / f"Radial_Distribution_{organelle}_{timestamp}.xlsx"
                 else:
                     output_path = output_dir / f"Radial_Distribution_{organelle}_{timestamp}"
 
-                analyzer.analyze()
+                with profile_section('radial_distribution', output_dir, self.profile_enabled.get()):
+                    analyzer.analyze()
 
-                if file_format == 'excel':
-                    analyzer._save_excel(str(output_path))
-                else:
-                    analyzer._save_csv(str(output_path))
+                    if file_format == 'excel':
+                        analyzer._save_excel(str(output_path))
+                    else:
+                        analyzer._save_csv(str(output_path))
+
+                    if self._radial_heatmap:
+                        # Rendered from the in-memory profiles, not the saved file
+                        from ..visualization import generate_radial_heatmap
+                        heatmap_path = output_dir / f"Radial_Heatmap_{organelle}_{timestamp}.png"
+                        generate_radial_heatmap(analyzer.to_heatmap_datasets(), str(heatmap_path))
+                        self.update_status(f"Heatmap saved to: {heatmap_path.name}")
 
                 self.update_status(f"\n[SUCCESS] Radial distribution analysis complete!")
 
@@ -513,13 +687,13 @@ class OrganelleAnalysisGUI:
             self.progress_bar.stop()
             self.run_button.config(state='normal')
 
-            for attr in ('_radial_analyzer', '_radial_output_dir', '_radial_file_format'):
+            for attr in ('_radial_analyzer', '_radial_output_dir', '_radial_file_format', '_radial_heatmap'):
                 if hasattr(self, attr):
                     delattr(self, attr)
 
     def _open_visualization(self):
         from .visualization_dialog import VisualizationDialog
-        VisualizationDialog(self.root)
+        VisualizationDialog(self.root, profile=self.profile_enabled.get())
 
     def on_closing(self):
         if hasattr(self, 'analysis_thread') and self.analysis_thread.is_alive():
@@ -534,12 +708,14 @@ class OrganelleAnalysisGUI:
                     "Warning",
                     "Forcing quit may result in incomplete output files."
                 )
+        self.worker_pool.shutdown(wait=False)
         self.root.destroy()
 
 
-def launch_gui():
+def launch_gui(profile: bool = False, workers: int = None, worker_idle_timeout: float = 600.0):
     root = tk.Tk()
-    app = OrganelleAnalysisGUI(root)
+    app = OrganelleAnalysisGUI(root, profile=profile, workers=workers,
+                               worker_idle_timeout=worker_idle_timeout)
     root.mainloop()
 
 
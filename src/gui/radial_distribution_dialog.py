@@ -1,8 +1,8 @@
 """
 Radial Distribution Configuration Dialog
 
-Modal dialog for selecting an organelle and configuring binning parameters
-for radial distribution analysis.
+Modal dialog for selecting one or more organelles and configuring binning
+parameters for radial distribution analysis.
 
 Author: Philipp Kaintoch
 """
@@ -21,19 +21,21 @@ class RadialDistributionDialog:
         parent.wait_window(dialog.dialog)
 
         if dialog.result:
-            organelle, bin_width, max_distance = dialog.result
+            organelles, bin_width, max_distance = dialog.result
+            # dialog.generate_heatmap: render a heatmap of the selected organelles
     """
 
     def __init__(self, parent: tk.Tk, available_organelles: List[str]):
         self.parent = parent
         self.available_organelles = sorted(available_organelles)
         self.result = None
+        self.generate_heatmap = False
         self._create_dialog()
 
     def _create_dialog(self):
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Radial Distribution Configuration")
-        self.dialog.geometry("400x520")
+        self.dialog.geometry("400x560")
         self.dialog.resizable(False, False)
 
         self.dialog.transient(self.parent)
@@ -50,27 +52,28 @@ class RadialDistributionDialog:
 
         ttk.Label(
             main_frame,
-            text="Analyze the radial volume distribution of an\n"
-                 "organelle relative to the cell center.\n"
+            text="Analyze the radial volume distribution of\n"
+                 "organelles relative to the cell center.\n"
                  "Configure the distance binning below.",
             font=('Arial', 9),
             justify=tk.CENTER
         ).pack(pady=(0, 15))
 
         # Organelle selection
-        org_frame = ttk.LabelFrame(main_frame, text="Select Organelle", padding="10")
+        org_frame = ttk.LabelFrame(main_frame, text="Select Organelles", padding="10")
         org_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
-        self.selection_var = tk.StringVar()
+        # Several organelles are binned in one pass (one sheet per organelle)
+        self.organelle_vars = {}
+        for i, organelle in enumerate(self.available_organelles):
+            var = tk.BooleanVar(value=(i == 0))
+            ttk.Checkbutton(org_frame, text=organelle, variable=var).pack(anchor=tk.W, pady=2)
+            self.organelle_vars[organelle] = var
 
-        for organelle in self.available_organelles:
-            ttk.Radiobutton(
-                org_frame, text=organelle,
-                variable=self.selection_var, value=organelle
-            ).pack(anchor=tk.W, pady=2)
-
-        if self.available_organelles:
-            self.selection_var.set(self.available_organelles[0])
+        self.heatmap_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            org_frame, text="Generate heatmap", variable=self.heatmap_var
+        ).pack(anchor=tk.W, pady=(8, 0))
 
         # Binning parameters
         bin_frame = ttk.LabelFrame(main_frame, text="Binning Parameters", padding="10")
@@ -160,12 +163,13 @@ class RadialDistributionDialog:
                                  parent=self.dialog)
             return
 
-        selected = self.selection_var.get()
+        selected = [org for org, var in self.organelle_vars.items() if var.get()]
         if not selected:
-            messagebox.showerror("No Selection", "Please select an organelle.", parent=self.dialog)
+            messagebox.showerror("No Selection", "Please select at least one organelle.", parent=self.dialog)
             return
 
         self.result = (selected, bw, md)
+        self.generate_heatmap = self.heatmap_var.get()
         self.dialog.destroy()
 
     def _on_cancel(self):
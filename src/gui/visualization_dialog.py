@@ -12,14 +12,16 @@ from tkinter import ttk, filedialog, messagebox
 import threading
 from pathlib import Path
 
-from ..visualization import load_radial_output, generate_radial_heatmap
+from ..visualization import load_radial_outputs, generate_radial_heatmap
+from ..utils.profiling import profile_section
 
 
 class VisualizationDialog:
     """Modal dialog for generating radial distribution heatmaps."""
 
-    def __init__(self, parent: tk.Tk):
+    def __init__(self, parent: tk.Tk, profile: bool = False):
         self.parent = parent
+        self.profile = profile
         self.datasets = []
         self._create_dialog()
 
@@ -105,11 +107,16 @@ class VisualizationDialog:
             return
 
         try:
-            data = load_radial_output(path)
+            datasets = load_radial_outputs(path)
         except Exception as e:
             messagebox.showerror("Load Error", str(e), parent=self.dialog)
             return
 
+        # Batch outputs hold one dataset per organelle
+        for data in datasets:
+            self._add_dataset(data, Path(path).name)
+
+    def _add_dataset(self, data: dict, fname: str):
         existing = [d['organelle'] for d in self.datasets]
         if data['organelle'] in existing:
             messagebox.showwarning(
@@ -133,7 +140,6 @@ class VisualizationDialog:
                 return
 
         self.datasets.append(data)
-        fname = Path(path).name
         self.listbox.insert(tk.END, f"{data['organelle']}  \u2014  {fname}")
         self.status_label.config(text=f"{len(self.datasets)} organelle(s) loaded")
 
@@ -172,13 +178,14 @@ class VisualizationDialog:
 
         def _run():
             try:
-                generate_radial_heatmap(
-                    self.datasets,
-                    output_path,
-                    condition_label=self.condition_var.get().strip(),
-                    dpi=dpi,
-                    ref_line_spacing=ref_spacing,
-                )
+                with profile_section('radial_heatmap', Path(output_path).parent, self.profile):
+                    generate_radial_heatmap(
+                        self.datasets,
+                        output_path,
+                        condition_label=self.condition_var.get().strip(),
+                        dpi=dpi,
+                        ref_line_spacing=ref_spacing,
+                    )
                 self.dialog.after(0, lambda: self._on_success(output_path))
             except Exception as e:
                 self.dialog.after(0, lambda: self._on_error(str(e)))
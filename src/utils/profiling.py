@@ -0,0 +1,176 @@
+"""
+Profiling Utilities for Orgaplex-Analyzer
+
+Wraps analysis steps in cProfile and writes two files per profiled step:
+- <label>_<timestamp>.pstats: raw profile, readable with pstats/snakeviz
+- <label>_<timestamp>.collapsed.txt: collapsed stacks for flamegraph.pl/speedscope
+
+Author: Philipp Kaintoch
+"""
+
+import cProfile
+import pstats
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@contextmanager
+def profile_section(label: str, output_dir: str, enabled: bool = True):
+    """
+    Profile the enclosed block with cProfile and save the results.
+
+    Parameters:
+    -----------
+    label : str
+        Name used as file prefix (e.g., "one_way")
+    output_dir : str
+        Directory where the profile files are written
+    enabled : bool
+        If False, the block runs unprofiled (no files are written)
+
+    Examples:
+    ---------
+    >>> with profile_section('one_way', output_dir, enabled=True):
+    ...     analyzer.run(output_path)
+
+    Notes:
+    ------
+    - Only the calling thread is profiled; work submitted to worker
+      processes or threads does not appear in the profile. The time spent
+      waiting for it is reported when the profile is saved
+    """
+    if not enabled:
+        yield None
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        try:
+            write_profile(profiler, output_dir, label)
+        except Exception as e:
+            logger.error(f"Failed to write profile for {label}: {e}")
+
+
+def write_profile(profiler: cProfile.Profile, output_dir: str, label: str) -> Tuple[Path, Path]:
+    """
+    Write a .pstats file and a collapsed-stack text file for a profiler.
+
+    Returns:
+    --------
+    Tuple[Path, Path] : (pstats_path, collapsed_path)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    pstats_path = output_dir / f"{label}_{timestamp}.pstats"
+    collapsed_path = output_dir / f"{label}_{timestamp}.collapsed.txt"
+
+    profiler.dump_stats(str(pstats_path))
+    stats = pstats.Stats(profiler)
+    write_collapsed_stacks(stats, collapsed_path)
+
+    logger.info(f"Profile saved to: {pstats_path.name}, {collapsed_path.name}")
+    waited = worker_wait_time(stats)
+    if waited > 0:
+        logger.info(f"Profile excludes work done in worker processes/threads "
+                    f"({waited:.2f} s spent waiting for results)")
+    return pstats_path, collapsed_path
+
+
+def worker_wait_time(stats: pstats.Stats) -> float:
+    """Seconds the profiled thread spent blocked on concurrent.futures results."""
+    waited = 0.0
+    for (filename, _, funcname), entry in stats.stats.items():
+        parts = Path(filename).parts
+        if parts[-2:] == ('futures', '_base.py') and funcname in ('result', 'as_completed', 'wait'):
+            waited += entry[3]
+    return waited
+
+
+def _format_function(func: Tuple[str, int, str]) -> str:
+    filename, lineno, funcname = func
+    if filename == '~':
+        label = funcname
+    else:
+        label = f"{funcname} ({Path(filename).name}:{lineno})"
+    # ';' separates frames in the collapsed format
+    return label.replace(';', ',')
+
+
+def write_collapsed_stacks(stats: pstats.Stats, output_path: Path,
+                           min_fraction: float = 1e-4, max_depth: int = 64):
+    """
+    Convert cProfile statistics into collapsed-stack format.
+
+    cProfile records caller/callee edges, not full stacks. Stacks are
+    reconstructed by walking the call graph from its roots and splitting
+    each function's time across its callers in proportion to the
+    cumulative time of each call edge (the same approximation used by
+    gprof2dot). Each output line is "frame;frame;frame <microseconds>".
+
+    Parameters:
+    -----------
+    stats : pstats.Stats
+        Profile statistics
+    output_path : Path
+        Destination text file
+    min_fraction : float
+        Paths contributing less than this fraction of total time are pruned
+    max_depth : int
+        Maximum reconstructed stack depth
+    """
+    entries = stats.stats
+
+    callees: Dict[tuple, Dict[tuple, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    total_time = sum(entries[func][3] for func in roots) or 1.0
+    min_time = total_time * min_fraction
+
+    collapsed: Dict[str, int] = defaultdict(int)
+
+    def walk(func, stack, on_stack, share):
+        _, _, tottime, _, _ = entries[func]
+        self_us = int(round(tottime * share * 1e6))
+        if self_us > 0:
+            collapsed[';'.join(stack)] += self_us
+
+        if len(stack) >= max_depth:
+            return
+
+        for callee, edge_time in callees.get(func, {}).items():
+            if callee in on_stack or callee not in entries:
+                continue
+            callee_time = entries[callee][3]
+            if callee_time <= 0:
+                continue
+            path_time = share * edge_time
+            if path_time < min_time:
+                continue
+            on_stack.add(callee)
+            stack.append(_format_function(callee))
+            walk(callee, stack, on_stack, path_time / callee_time)
+            stack.pop()
+            on_stack.discard(callee)
+
+    for root in roots:
+        walk(root, [_format_function(root)], {root}, 1.0)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for stack, value in sorted(collapsed.items()):
+            f.write(f"{stack} {value}\n")
@@ -7,6 +7,9 @@ Author: Philipp Kaintoch
 import re
 from typing import List, Union
 
+# Trailing replicate number of a cell ID ("1h LPS 10", "control_2")
+_REPLICATE_SUFFIX = re.compile(r'[\s_\-]*\d+$')
+
 
 def natural_sort_key(text: str) -> List:
     """
@@ -106,3 +109,26 @@ def sort_cell_ids(cell_ids: List[str]) -> List[str]:
         raise TypeError("All cell IDs must be strings")
 
     return sorted(cell_ids, key=natural_sort_key)
+
+
+def cell_condition(cell_id: str) -> str:
+    """
+    Condition name of a cell ID (the ID without its trailing replicate number).
+
+    Examples:
+    ---------
+    >>> cell_condition("1h LPS 10")
+    '1h LPS'
+
+    >>> cell_condition("control_2")
+    'control'
+
+    >>> cell_condition("IgE")
+    'IgE'
+
+    Notes:
+    ------
+    - IDs that consist only of a number are returned unchanged
+    """
+    condition = _REPLICATE_SUFFIX.sub('', cell_id)
+    return condition if condition else cell_id
@@ -11,6 +11,7 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import List, Optional
+from .core.radial_distribution import SHEET_METADATA_PREFIX
 
 
 def load_radial_output(file_path: str) -> dict:
@@ -37,6 +38,55 @@ def load_radial_output(file_path: str) -> dict:
     if 'Mean' not in summary_df.columns:
         raise ValueError(f"Missing 'Mean' column in Summary sheet of {file_path.name}")
 
+    return _radial_dataset(str(meta['Organelle']), meta, summary_df)
+
+
+def load_radial_outputs(file_path: str) -> List[dict]:
+    """
+    Load a Radial Distribution Excel output and return one data dict per organelle.
+
+    Accepts single-organelle outputs (see load_radial_output()) and batch
+    outputs with one sheet per organelle; organelle names are read from the
+    organelle -> sheet entries of the Metadata sheet.
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    xls = pd.ExcelFile(file_path, engine='openpyxl')
+    if 'Summary' in xls.sheet_names:
+        return [load_radial_output(file_path)]
+    if 'Metadata' not in xls.sheet_names:
+        raise ValueError(f"Missing 'Metadata' sheet in {file_path.name}")
+
+    # As text: sheet names such as '1.50' must not be read as numbers
+    meta_df = pd.read_excel(xls, sheet_name='Metadata', dtype=str)
+    meta = dict(zip(meta_df['Parameter'], meta_df['Value']))
+
+    for key in ('Organelles', 'Bin_Width_um', 'Max_Distance_um', 'Total_Bins'):
+        if key not in meta:
+            raise ValueError(f"Missing metadata key '{key}' in {file_path.name}")
+
+    sheets = {
+        key[len(SHEET_METADATA_PREFIX):]: sheet_name for key, sheet_name in meta.items()
+        if key.startswith(SHEET_METADATA_PREFIX)
+    }
+    if not sheets:
+        raise ValueError(f"No organelle sheets listed in the Metadata sheet of {file_path.name}")
+
+    datasets = []
+    for organelle, sheet_name in sheets.items():
+        if sheet_name not in xls.sheet_names:
+            raise ValueError(f"Missing '{sheet_name}' sheet ({organelle}) in {file_path.name}")
+        profile_df = pd.read_excel(xls, sheet_name=sheet_name, index_col=0)
+        if 'Mean' not in profile_df.columns:
+            raise ValueError(f"Missing 'Mean' column in {sheet_name} sheet of {file_path.name}")
+        datasets.append(_radial_dataset(organelle, meta, profile_df))
+    return datasets
+
+
+def _radial_dataset(organelle: str, meta: dict, summary_df: pd.DataFrame) -> dict:
+    """Parsed data dict of one organelle (Mean column indexed by bin interval)."""
     mean_values = summary_df['Mean'].values.astype(float)
     mean_values = np.nan_to_num(mean_values, nan=0.0)
 
@@ -50,7 +100,7 @@ def load_radial_output(file_path: str) -> dict:
     bin_edges = np.array(bin_edges)
 
     return {
-        'organelle': str(meta['Organelle']),
+        'organelle': organelle,
         'bin_width': float(meta['Bin_Width_um']),
         'max_distance': float(meta['Max_Distance_um']),
         'n_bins': int(meta['Total_Bins']),
@@ -0,0 +1,53 @@
+"""
+Shared fixtures: small generated Imaris statistics exports.
+"""
+
+import pytest
+
+
+def write_statistic(path, name, values, object_ids=True):
+    """
+    Write an Imaris statistics CSV (title rows, column names, one row per
+    object ID); without object_ids, the ID column is left out.
+    """
+    statistic, _, target = name.partition('_Surfaces=')
+    label = statistic.replace('_', ' ')
+    columns = [label, 'Unit', 'Category'] + (['Surfaces'] if target else []) + ['Time']
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f" \n{label}\n====================\n")
+        f.write(','.join(columns + (['ID'] if object_ids else [])) + ',\n')
+        for object_id, value in values.items():
+            row = [value, 'um', 'Surface'] + ([f'Surfaces={target}'] if target else []) + [1]
+            f.write(','.join(map(str, row + ([object_id] if object_ids else []))) + ',\n')
+
+
+@pytest.fixture
+def write_export(tmp_path):
+    """
+    Factory writing an export tree and returning its directory.
+
+    Takes {(cell_id, organelle): {statistic: {object ID: value}}}, where
+    statistic is the file name suffix, e.g. 'Volume' or
+    'Shortest_Distance_to_Surfaces_Surfaces=LD'.
+    """
+    def write(statistics, name='export', object_ids=True):
+        root = tmp_path / name
+        for (cell_id, organelle), files in statistics.items():
+            folder = root / f"{cell_id}_{organelle}_Statistics"
+            folder.mkdir(parents=True)
+            for statistic, values in files.items():
+                write_statistic(folder / f"{cell_id}_{organelle}_{statistic}.csv", statistic, values,
+                                object_ids)
+        return root
+    return write
+
+
+@pytest.fixture
+def make_analyzer(tmp_path):
+    """
+    Factory for analyzers of an empty input directory, for tests of
+    methods that work on results already in memory.
+    """
+    def make(analyzer_class, **kwargs):
+        return analyzer_class(str(tmp_path), **kwargs)
+    return make
@@ -0,0 +1,59 @@
+"""
+Tests for reading zipped and tarred exports through ArchiveDatasetLoader.
+"""
+
+import shutil
+
+import pandas as pd
+import pytest
+
+from src.core.archive_loader import ArchiveDatasetLoader
+from src.core.data_loader import open_dataset
+from src.core.nway_interaction import NWayInteractionAnalyzer
+from src.core.one_way_interaction import OneWayInteractionAnalyzer
+from src.core.vol_spher_metrics import VolSpherMetricsAnalyzer
+
+STATISTICS = {
+    (cell_id, organelle): {
+        **{f'Shortest_Distance_to_Surfaces_Surfaces={target}': {
+            object_id: round(0.3 * (object_id - offset) - 0.4, 2) for object_id in range(5 + offset)
+        } for target in ('ER', 'LD', 'Ly') if target != organelle},
+        'Volume': {object_id: 0.5 + object_id for object_id in range(5 + offset)},
+        'Sphericity': {object_id: 0.9 - 0.1 * object_id for object_id in range(5 + offset)},
+    }
+    for offset, cell_id in enumerate(['control_1', 'control_2', '1h LPS 1'])
+    for organelle in ('ER', 'LD', 'Ly')
+}
+
+
+def analyzer_results(input_path):
+    one_way = OneWayInteractionAnalyzer(input_path)
+    one_way.load_data()
+    one_way.analyze_all_cells()
+    one_way.build_summary_tables()
+
+    nway = NWayInteractionAnalyzer(input_path)
+    nway.load_data()
+
+    vol_spher = VolSpherMetricsAnalyzer(input_path)
+    vol_spher.load_data()
+
+    return {
+        'one_way_mean': one_way.mean_distance_df,
+        'one_way_count': one_way.count_df,
+        **{f'nway_{bait}': nway.analyze_bait(bait) for bait in ('ER', 'LD', 'Ly')},
+        **{f'vol_spher_{organelle}': vol_spher.analyze_organelle(organelle) for organelle in ('ER', 'LD', 'Ly')},
+    }
+
+
+@pytest.mark.parametrize('archive_format', ['zip', 'gztar'])
+def test_archive_matches_directory(write_export, tmp_path, archive_format):
+    root = write_export(STATISTICS)
+    archive = shutil.make_archive(str(tmp_path / 'archive'), archive_format, root)
+
+    assert isinstance(open_dataset(archive), ArchiveDatasetLoader)
+    expected = analyzer_results(str(root))
+    actual = analyzer_results(archive)
+
+    for name, table in expected.items():
+        pd.testing.assert_frame_equal(actual[name], table, obj=name)
@@ -0,0 +1,90 @@
+"""
+Tests for ContactMatrix against unpacked boolean flags.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.core.contact_matrix import ContactMatrix, _BLOCK_BYTES
+
+TARGETS = ['ER', 'LD', 'Ly', 'Mito']
+
+
+def random_distances(n_points, seed=0):
+    rng = np.random.default_rng(seed)
+    return {target: rng.uniform(-0.5, 1.0, n_points) for target in TARGETS}
+
+
+def test_packed_bits():
+    distances = {
+        'ER': [0.0, 0.5, -0.2, 0.0, 1.0, 1.0, 1.0, -1.0, 0.0, 2.0],
+        'LD': [1.0, 0.0, 0.0, 0.3, 0.0, 0.2, 0.0, 0.1, 0.0, 0.0],
+    }
+    matrix = ContactMatrix.from_distances(distances)
+
+    # Point 0 is the most significant bit of byte 0; padding bits are zero
+    np.testing.assert_array_equal(matrix.packed, [[0b10110001, 0b10000000],
+                                                  [0b01101010, 0b11000000]])
+    np.testing.assert_array_equal(matrix.contacts('LD'), np.array(distances['LD']) <= 0)
+    assert matrix.count_exact(['ER', 'LD']) == 2
+    assert matrix.count_exact([]) == 1
+
+
+# The largest size spans two unpacking blocks and ends in a partial byte
+@pytest.mark.parametrize('n_points', [1, 1003, _BLOCK_BYTES * 8 + 5])
+def test_counts_match_flags(n_points):
+    distances = random_distances(n_points)
+    matrix = ContactMatrix.from_distances(distances, thresholds=(0.1,))
+    flags = np.column_stack([distances[target] <= 0.1 for target in TARGETS])
+
+    for target in TARGETS:
+        assert matrix.count(target) == flags[:, TARGETS.index(target)].sum()
+    for r in range(len(TARGETS) + 1):
+        for combo in itertools.combinations(range(len(TARGETS)), r):
+            inside = np.isin(np.arange(len(TARGETS)), combo)
+            names = [TARGETS[i] for i in combo]
+            assert matrix.count_all(names) == flags[:, inside].all(axis=1).sum()
+            assert matrix.count_exact(names) == (flags == inside).all(axis=1).sum()
+
+    codes = (flags.astype(np.int64) << np.arange(len(TARGETS))).sum(axis=1)
+    np.testing.assert_array_equal(matrix.code_histogram(),
+                                  np.bincount(codes, minlength=1 << len(TARGETS)))
+
+    co_contacts = flags.T.astype(np.int64) @ flags.astype(np.int64)
+    np.testing.assert_array_equal(matrix.co_contacts(), co_contacts)
+
+
+def test_per_target_thresholds():
+    distances = random_distances(1003, seed=2)
+    thresholds = {'ER': 0.1, 'LD': 0.0, 'Ly': 0.2, 'Mito': 0.0}
+    matrix = ContactMatrix.from_distances(distances, thresholds=(thresholds, 0.0))
+    flags = np.column_stack([distances[target] <= thresholds[target] for target in TARGETS])
+
+    codes = (flags.astype(np.int64) << np.arange(len(TARGETS))).sum(axis=1)
+    np.testing.assert_array_equal(matrix.code_histogram(thresholds),
+                                  np.bincount(codes, minlength=1 << len(TARGETS)))
+    assert matrix.thresholds == (thresholds, 0.0)
+    assert matrix.count('ER', 0.0) == (distances['ER'] <= 0.0).sum()
+
+
+def test_thresholds_are_selected():
+    distances = random_distances(500, seed=1)
+    matrix = ContactMatrix.from_distances(distances, thresholds=(0.0, 0.1))
+
+    for threshold in (0.0, 0.1):
+        flags = np.column_stack([distances[target] <= threshold for target in TARGETS])
+        assert matrix.count_exact(['ER', 'LD'], threshold) == \
+            (flags == [True, True, False, False]).all(axis=1).sum()
+    with pytest.raises(ValueError):
+        matrix.count('ER')
+
+
+def test_save_and_load(tmp_path):
+    matrix = ContactMatrix.from_distances(random_distances(77), thresholds=(0.0, 0.2))
+    loaded = ContactMatrix.load(matrix.save(tmp_path / 'cell.npz'))
+
+    assert loaded.targets == matrix.targets
+    assert loaded.thresholds == matrix.thresholds
+    np.testing.assert_array_equal(loaded.packed, matrix.packed)
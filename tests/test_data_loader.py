@@ -0,0 +1,102 @@
+"""
+Tests for object ID alignment across statistics files of a surface.
+"""
+
+import shutil
+
+import numpy as np
+import pytest
+
+from src.core.data_loader import open_dataset
+from src.core.dataset_store import pack_dataset
+from src.core.nway_interaction import NWayInteractionAnalyzer
+from src.core.one_way_interaction import OneWayInteractionAnalyzer
+
+# ER surfaces 10-13; the LD and Ly files each miss a different object
+STATISTICS = {
+    ('control_1', 'ER'): {
+        'Shortest_Distance_to_Surfaces_Surfaces=LD': {10: -0.1, 11: 0.0, 12: 0.5},
+        'Shortest_Distance_to_Surfaces_Surfaces=Ly': {11: 0.5, 12: 0.5, 13: -0.2},
+        'Volume': {10: 1.0, 11: 2.0, 12: 3.0, 13: 4.0},
+    },
+    ('control_1', 'LD'): {
+        'Shortest_Distance_to_Surfaces_Surfaces=ER': {0: 0.0, 1: 1.0},
+        'Shortest_Distance_to_Surfaces_Surfaces=Ly': {0: 1.0, 1: 1.0},
+    },
+    ('control_1', 'Ly'): {
+        'Shortest_Distance_to_Surfaces_Surfaces=ER': {0: -0.2},
+        'Shortest_Distance_to_Surfaces_Surfaces=LD': {0: 2.0},
+    },
+}
+
+
+@pytest.fixture(params=['directory', 'zip', 'packed'])
+def dataset(request, write_export, tmp_path):
+    root = write_export(STATISTICS)
+    if request.param == 'zip':
+        return shutil.make_archive(str(tmp_path / 'export'), 'zip', root)
+    if request.param == 'packed':
+        return str(pack_dataset(open_dataset(str(root)), str(tmp_path / 'export'), dtype='float64'))
+    return str(root)
+
+
+def scanned_loader(dataset):
+    loader = open_dataset(str(dataset))
+    loader.detect_structure()
+    loader.find_cell_folders()
+    return loader
+
+
+def test_object_table_joins_on_ids(dataset):
+    table = scanned_loader(dataset).object_table(
+        'control_1', 'ER', ['Distance_to_LD', 'Distance_to_Ly', 'Volume']
+    )
+
+    assert table.index.tolist() == [10, 11, 12, 13]
+    np.testing.assert_array_equal(table['Distance_to_LD'], [-0.1, 0.0, 0.5, np.nan])
+    np.testing.assert_array_equal(table['Distance_to_Ly'], [np.nan, 0.5, 0.5, -0.2])
+    np.testing.assert_array_equal(table['Volume'], [1.0, 2.0, 3.0, 4.0])
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_nway_counts_use_ids(dataset, streaming):
+    analyzer = NWayInteractionAnalyzer(dataset, streaming=streaming, chunk_rows=2)
+    analyzer.load_data()
+
+    counts = analyzer.analyze_cell_for_bait('control_1', 'ER')
+
+    assert counts['Surface_count'] == 4
+    assert (counts['LD_only'], counts['Ly_only'], counts['LD+Ly'], counts['No_contact']) == (2, 1, 0, 1)
+
+
+def test_files_without_ids_pair_rows(write_export):
+    statistics = {key: {name: dict(enumerate(values.values())) for name, values in files.items()}
+                  for key, files in STATISTICS.items()}
+    statistics['control_1', 'ER']['Volume'] = {0: 1.0, 1: 2.0, 2: 3.0}
+    loader = scanned_loader(write_export(statistics, object_ids=False))
+
+    table = loader.object_table('control_1', 'ER', ['Distance_to_LD', 'Distance_to_Ly', 'Volume'])
+
+    assert table.index.name == 'Row'
+    np.testing.assert_array_equal(table['Distance_to_LD'], [-0.1, 0.0, 0.5])
+    np.testing.assert_array_equal(table['Distance_to_Ly'], [0.5, 0.5, -0.2])
+
+
+def test_files_without_ids_of_unequal_length_are_skipped(write_export):
+    statistics = {key: dict(files) for key, files in STATISTICS.items()}
+    statistics['control_1', 'ER']['Shortest_Distance_to_Surfaces_Surfaces=Ly'] = {0: 0.5, 1: 0.5, 2: -0.2, 3: 1.0}
+    dataset = write_export(statistics, object_ids=False)
+
+    table = scanned_loader(dataset).object_table('control_1', 'ER', ['Distance_to_LD', 'Distance_to_Ly'])
+    assert table.empty and list(table.columns) == []
+
+    analyzer = NWayInteractionAnalyzer(str(dataset))
+    analyzer.load_data()
+    assert analyzer.analyze_cell_for_bait('control_1', 'ER') is None
+
+    # Per-target statistics do not need aligned rows
+    one_way = OneWayInteractionAnalyzer(str(dataset))
+    one_way.load_data()
+    interactions = one_way.analyze_cell('control_1')
+    assert interactions['ER-to-LD']['points'] == 3
+    assert interactions['ER-to-Ly']['points'] == 4
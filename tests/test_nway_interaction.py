@@ -0,0 +1,33 @@
+"""
+Tests for the N-Way combination counts.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.nway_interaction import NWayInteractionAnalyzer
+
+
+@pytest.mark.parametrize('n_targets', [0, 1, 3, 6])
+def test_superset_sums_match_brute_force(n_targets):
+    histogram = np.random.default_rng(n_targets).integers(0, 1000, 1 << n_targets)
+
+    at_least = NWayInteractionAnalyzer.superset_sums(histogram)
+
+    codes = np.arange(len(histogram))
+    expected = [histogram[(codes & code) == code].sum() for code in codes]
+    np.testing.assert_array_equal(at_least, expected)
+    assert at_least.dtype == np.int64
+
+
+def test_superset_sums_leave_histogram_unchanged():
+    histogram = np.array([4, 3, 2, 1])
+
+    NWayInteractionAnalyzer.superset_sums(histogram)
+
+    np.testing.assert_array_equal(histogram, [4, 3, 2, 1])
+
+
+def test_superset_sums_reject_other_lengths():
+    with pytest.raises(ValueError):
+        NWayInteractionAnalyzer.superset_sums(np.zeros(6))
@@ -0,0 +1,42 @@
+"""
+Tests for the One-Way summary tables.
+"""
+
+import numpy as np
+
+from src.core.one_way_interaction import OneWayInteractionAnalyzer, RECIPROCAL_COLUMNS
+
+
+def interaction(mean, count, points):
+    return {'mean': mean, 'count': count, 'points': points}
+
+
+def test_reciprocal_table_pairs_both_directions(make_analyzer):
+    analyzer = make_analyzer(OneWayInteractionAnalyzer)
+    analyzer.results = {
+        'Control_1': {'ER-to-LD': interaction(2.0, 3, 10), 'LD-to-ER': interaction(4.0, 1, 4),
+                      'ER-to-M': interaction(1.0, 2, 8)},
+        'Control_2': {'ER-to-LD': interaction(1.0, 5, 20)},
+    }
+    analyzer.build_summary_tables()
+
+    reciprocal = analyzer.reciprocal_df
+    assert list(reciprocal.columns) == RECIPROCAL_COLUMNS
+    assert reciprocal[['Organelle_A', 'Organelle_B']].drop_duplicates().values.tolist() == [['ER', 'LD']]
+    first = reciprocal.set_index('Cell_ID').loc['Control_1']
+    assert first['Mean_Ratio'] == 0.5
+    assert first['Contact_Fraction_A_to_B'] == 0.3
+    assert first['Contact_Fraction_B_to_A'] == 0.25
+    second = reciprocal.set_index('Cell_ID').loc['Control_2']
+    assert np.isnan(second['Mean_B_to_A'])
+    assert second['Points_B_to_A'] == 0
+
+
+def test_reciprocal_table_without_interactions(make_analyzer):
+    analyzer = make_analyzer(OneWayInteractionAnalyzer)
+    analyzer.results = {'Control_1': {}, 'Control_2': {}}
+    analyzer.build_summary_tables()
+
+    assert analyzer.mean_distance_df.empty
+    assert analyzer.reciprocal_df.empty
+    assert list(analyzer.reciprocal_df.columns) == RECIPROCAL_COLUMNS
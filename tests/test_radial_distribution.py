@@ -0,0 +1,62 @@
+"""
+Tests for the batch Excel output of RadialDistributionAnalyzer.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.core.radial_distribution import RadialDistributionAnalyzer
+from src.visualization import load_radial_outputs
+
+
+def batch_analyzer(make_analyzer, organelles):
+    """Analyzer of several organelles with two 0.5 um bins."""
+    analyzer = make_analyzer(RadialDistributionAnalyzer)
+    analyzer.set_parameters(organelles, 0.5, 1.0)
+    return analyzer
+
+
+def add_profiles(analyzer, organelle, profiles):
+    """Per-cell profiles (cell -> values per bin) as analyze() stores them."""
+    bins = pd.cut([0.25, 0.75], bins=analyzer._bin_edges(), include_lowest=True).categories
+    per_cell_df = pd.DataFrame(profiles, index=bins)
+    analyzer.organelle_results[organelle] = dict(per_cell_df.items())
+    analyzer.per_cell_dfs[organelle] = per_cell_df
+    analyzer.summary_dfs[organelle] = pd.DataFrame({
+        'Mean': per_cell_df.mean(axis=1),
+        'SD': per_cell_df.std(axis=1, ddof=1),
+    })
+
+
+def test_sheet_names_are_unique(make_analyzer):
+    long_name = 'Endoplasmic_Reticulum_Tubules_Long'
+    organelles = ['ER/a', 'ER:a', 'er?a', 'Metadata', long_name, long_name + '2']
+    analyzer = batch_analyzer(make_analyzer, organelles)
+    for organelle in organelles:
+        add_profiles(analyzer, organelle, {'Control_1': [1.0, 2.0]})
+
+    sheet_names = analyzer._sheet_names()
+
+    assert sheet_names['ER/a'] == 'ER_a'
+    assert sheet_names['ER:a'] == 'ER_a_2'
+    assert sheet_names['er?a'] == 'er_a_3'
+    assert sheet_names['Metadata'] == 'Metadata_2'
+    assert sheet_names[long_name] == long_name[:31]
+    assert sheet_names[long_name + '2'] == long_name[:29] + '_2'
+
+
+def test_batch_excel_round_trip(make_analyzer, tmp_path):
+    analyzer = batch_analyzer(make_analyzer, ['ER/a', 'ER:a'])
+    add_profiles(analyzer, 'ER/a', {'Control_1': [1.0, 2.0], 'Control_2': [3.0, 4.0]})
+    add_profiles(analyzer, 'ER:a', {'Control_1': [5.0, 6.0], 'Mean': [7.0, 8.0]})
+    output_path = tmp_path / 'radial.xlsx'
+
+    analyzer._save_excel(str(output_path))
+
+    datasets = load_radial_outputs(str(output_path))
+    assert [dataset['organelle'] for dataset in datasets] == ['ER/a', 'ER:a']
+    np.testing.assert_allclose(datasets[0]['mean_values'], [2.0, 3.0])
+    np.testing.assert_allclose(datasets[1]['mean_values'], [6.0, 7.0])
+    np.testing.assert_allclose(datasets[1]['bin_edges'], [0.0, 0.5, 1.0])
+    sheet = pd.read_excel(output_path, sheet_name='ER_a_2', index_col=0)
+    assert list(sheet.columns) == ['Mean', 'SD', 'Control_1', 'Cell_Mean']
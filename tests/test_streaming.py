@@ -0,0 +1,50 @@
+"""
+Tests for the QuantileSketch error bound.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.streaming import QuantileSketch
+
+QUANTILES = np.linspace(0, 1, 101)
+
+
+def sample(seed):
+    """Distances over several orders of magnitude, both signs, some near zero."""
+    rng = np.random.default_rng(seed)
+    magnitudes = rng.lognormal(mean=-1.0, sigma=2.0, size=20000)
+    values = np.where(rng.random(len(magnitudes)) < 0.3, -magnitudes, magnitudes)
+    return np.concatenate((values, rng.uniform(-1e-5, 1e-5, 50), [0.0]))
+
+
+def assert_within_bound(sketch, values):
+    exact = np.sort(values)[np.floor(QUANTILES * (len(values) - 1)).astype(int)]
+    estimates = sketch.quantile(QUANTILES)
+    bound = np.maximum(sketch.relative_accuracy * np.abs(exact), sketch.min_value)
+    assert np.all(np.abs(estimates - exact) <= bound * (1 + 1e-9))
+
+
+@pytest.mark.parametrize('relative_accuracy', [0.001, 0.01, 0.05])
+def test_quantiles_within_relative_accuracy(relative_accuracy):
+    values = sample(0)
+    sketch = QuantileSketch(relative_accuracy).update(values)
+
+    assert sketch.count == len(values)
+    assert_within_bound(sketch, values)
+    assert values.min() <= sketch.quantile(0.0) <= sketch.quantile(1.0) <= values.max()
+
+
+def test_merged_sketch_keeps_bound():
+    chunks = [sample(seed) for seed in range(3)]
+    merged = QuantileSketch.merged(QuantileSketch().update(chunk) for chunk in chunks)
+
+    assert_within_bound(merged, np.concatenate(chunks))
+
+
+def test_nan_values_are_skipped():
+    sketch = QuantileSketch().update(np.array([np.nan, 1.0, np.nan]))
+
+    assert sketch.count == 1
+    assert sketch.quantile(0.5) == 1.0
+    assert np.isnan(QuantileSketch().quantile(0.5))
@@ -0,0 +1,64 @@
+"""
+Tests for the segmented reductions of VolSpherMetricsAnalyzer.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.vol_spher_metrics import (
+    VolSpherMetricsAnalyzer, DEFAULT_EXTENDED_STATISTICS, DEFAULT_VOLUME_CLASSES
+)
+
+EXTENDED = {'statistics': DEFAULT_EXTENDED_STATISTICS, 'volume_classes': DEFAULT_VOLUME_CLASSES}
+
+
+def expected_stats(arrays):
+    """Per-array statistics computed with a pandas groupby."""
+    frame = pd.DataFrame({
+        'segment': np.concatenate([np.full(len(values), i) for i, values in enumerate(arrays)
+                                   if values is not None]),
+        'value': np.concatenate([values for values in arrays if values is not None]),
+    })
+    grouped = frame.groupby('segment')['value']
+    segments = pd.RangeIndex(len(arrays))
+    return {
+        'Count': grouped.count().reindex(segments, fill_value=0),
+        'Total': grouped.sum().reindex(segments),
+        'Mean': grouped.mean().reindex(segments),
+        'Max': grouped.max().reindex(segments),
+        'Min': grouped.min().reindex(segments),
+        'Median': grouped.median().reindex(segments),
+        'SD': grouped.std().reindex(segments),
+        'P10': grouped.quantile(0.1).reindex(segments),
+        'P90': grouped.quantile(0.9).reindex(segments),
+    }
+
+
+@pytest.mark.parametrize('arrays', [
+    [np.array([3.0, 1.0, 2.0]), np.array([5.0]), np.array([0.05, 20.0, 0.5, 4.0])],
+    [np.array([1.0, 2.0]), np.empty(0), None, np.array([5.0]), np.empty(0)],
+    [None, np.empty(0)],
+])
+def test_segment_stats_match_groupby(make_analyzer, arrays):
+    stats = make_analyzer(VolSpherMetricsAnalyzer, **EXTENDED)._segment_stats(arrays, 'Volume')
+
+    present = [values for values in arrays if values is not None]
+    if any(len(values) for values in present):
+        expected = expected_stats(arrays)
+    else:
+        expected = {name: pd.Series(np.nan, index=range(len(arrays)))
+                    for name in ('Total', 'Mean', 'Max', 'Min', 'Median', 'SD', 'P10', 'P90')}
+        expected['Count'] = pd.Series(0, index=range(len(arrays)))
+    for name, values in expected.items():
+        np.testing.assert_allclose(stats[f'{name}_Volume'], values.to_numpy(dtype=float),
+                                   rtol=1e-12, err_msg=name)
+
+
+def test_segment_stats_volume_classes(make_analyzer):
+    analyzer = make_analyzer(VolSpherMetricsAnalyzer, **EXTENDED)
+    arrays = [np.array([0.05, 0.5, 5.0, 50.0, 0.1]), np.empty(0), None]
+    stats = analyzer._segment_stats(arrays, 'Volume')
+
+    counts = np.vstack([stats[row] for row in analyzer._volume_class_rows()]).T
+    np.testing.assert_array_equal(counts, [[1, 2, 1, 1], [0, 0, 0, 0], [0, 0, 0, 0]])